@@ -0,0 +1,19 @@
+"""
+Check that QuietGame and FastGame play the same games as Game on random
+kingdoms from the base and intrigue sets.
+
+"""
+import logging
+
+from pyminion.differential import fuzz_engines
+from pyminion.fast import FastGame
+from pyminion.quiet import QuietGame
+
+if __name__ == "__main__":
+    logging.getLogger().setLevel(logging.WARNING)
+
+    for engine in (QuietGame, FastGame):
+        divergences = fuzz_engines(engine.from_game, games=500)
+        for divergence in divergences:
+            print(divergence)
+        print(f"{engine.__name__}: {len(divergences)} of 500 games diverged")
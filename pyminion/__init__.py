@@ -4,7 +4,7 @@ __author__ = "Evan Slack"
 import logging
 
 # initialize logger with no handler.
-# handlers are added in the `Game` init
+# each `Game` keeps its own handlers, see `GameLogDispatcher`
 logger = logging.getLogger()
 logger.setLevel((logging.INFO))
 logger.addHandler(logging.NullHandler())
@@ -0,0 +1,451 @@
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from pyminion.bots.rule_bot import Condition, Expr, Feature, Rule, RuleBot, RuleBotDecider
+from pyminion.core import Action, Card, ScoreCard, Treasure
+from pyminion.exceptions import InvalidGameSetup
+from pyminion.expansions.base import copper, curse, duchy, estate, gold, province, silver
+from pyminion.game import Game
+from pyminion.result import PlayerSimulatorResult
+from pyminion.log import logger
+
+
+_comparisons: Dict[str, Callable[[np.ndarray], np.ndarray]] = {
+    "<": lambda value: value < 0,
+    "<=": lambda value: value <= 0,
+    ">": lambda value: value > 0,
+    ">=": lambda value: value >= 0,
+    "==": lambda value: value == 0,
+    "!=": lambda value: value != 0,
+}
+
+
+def is_batch_supported(card: Card) -> bool:
+    """
+    Check if the batch engine can simulate a card.
+
+    """
+    cls = type(card)
+    if cls.set_up is not Card.set_up:
+        return False
+    if card.is_action and not (isinstance(card, Action) and card.vanilla_play):
+        return False
+    if card.is_treasure and not card.is_action and cls.play is not Treasure.play:
+        return False
+    if card.is_victory or card.is_curse:
+        if not isinstance(card, ScoreCard) or len(card.score_dependencies) > 0:
+            return False
+    return card.is_action or card.is_treasure or card.is_victory or card.is_curse
+
+
+@dataclass
+class BatchResult:
+    """
+    Results of games simulated by the batch engine.
+
+    Arrays are indexed by game and then by player, in the order the players
+    were given to the simulator.
+
+    """
+
+    __slots__ = ("players", "scores", "turns", "shuffles", "winners", "turn_order")
+
+    players: List[RuleBot]
+    scores: np.ndarray
+    turns: np.ndarray
+    shuffles: np.ndarray
+    winners: np.ndarray
+    turn_order: np.ndarray
+
+    def __repr__(self):
+        results = "\n".join(str(result) for result in self.get_player_results())
+        return f"Batch Result: ran {len(self.scores)} games\n{results}"
+
+    def get_player_results(self) -> List[PlayerSimulatorResult]:
+        num_winners = self.winners.sum(axis=1)
+        sole_winner = self.winners & (num_winners == 1)[:, None]
+        tied = self.winners & (num_winners > 1)[:, None]
+        player_results = []
+        for i, player in enumerate(self.players):
+            player_results.append(
+                PlayerSimulatorResult(
+                    player=player,
+                    wins=int(sole_winner[:, i].sum()),
+                    losses=int((~self.winners[:, i]).sum()),
+                    ties=int(tied[:, i].sum()),
+                )
+            )
+        return player_results
+
+
+class _Turn:
+    """
+    Zones and state of the active player in each of a set of games, gathered
+    from the batch arrays for one turn.
+
+    """
+
+    def __init__(self, sim: "BatchSimulator", games: np.ndarray, seat: int):
+        self.sim = sim
+        self.games = games
+        self.who = sim.order[games, seat]
+        who = self.who
+        self.hand = sim.hand[games, who]
+        self.playmat = np.zeros_like(self.hand)
+        self.discard = sim.discard[games, who]
+        self.deck = sim.deck[games, who]
+        self.deck_len = sim.deck_len[games, who]
+        self.owned = sim.owned[games, who]
+        self.supply = sim.supply[games]
+        self.shuffles = sim.shuffles[games, who]
+        self.turns = sim.turns[games, who]
+
+        num = len(games)
+        self.actions = np.ones(num, dtype=np.int32)
+        self.buys = np.ones(num, dtype=np.int32)
+        self.money = np.zeros(num, dtype=np.int32)
+
+    def scatter(self) -> None:
+        sim = self.sim
+        games, who = self.games, self.who
+        sim.hand[games, who] = self.hand
+        sim.discard[games, who] = self.discard
+        if self.deck.shape[1] > sim.deck.shape[2]:
+            sim.grow_decks(self.deck.shape[1])
+        sim.deck[games, who, :self.deck.shape[1]] = self.deck
+        sim.deck_len[games, who] = self.deck_len
+        sim.owned[games, who] = self.owned
+        sim.supply[games] = self.supply
+        sim.shuffles[games, who] = self.shuffles
+        sim.turns[games, who] = self.turns
+
+    def draw(self, mask: np.ndarray) -> None:
+        """
+        Draw one card for the games in the mask, shuffling the discard pile
+        into the deck where the deck is empty.
+
+        """
+        reshuffle = mask & (self.deck_len == 0) & (self.discard.sum(axis=1) > 0)
+        if reshuffle.any():
+            self._reshuffle(np.nonzero(reshuffle)[0])
+
+        rows = np.nonzero(mask & (self.deck_len > 0))[0]
+        if len(rows) == 0:
+            return
+        top = self.deck_len[rows] - 1
+        cards = self.deck[rows, top]
+        self.deck_len[rows] = top
+        np.add.at(self.hand, (rows, cards), 1)
+
+    def _reshuffle(self, rows: np.ndarray) -> None:
+        counts = self.discard[rows]
+        lengths = counts.sum(axis=1)
+        size = int(lengths.max())
+        if size > self.deck.shape[1]:
+            pad = np.zeros((self.deck.shape[0], size - self.deck.shape[1]), dtype=self.deck.dtype)
+            self.deck = np.concatenate([self.deck, pad], axis=1)
+
+        # lay the discarded cards out in card order, then shuffle each row
+        # by sorting random keys with the unused slots sorted last
+        positions = np.arange(size)
+        ends = np.cumsum(counts, axis=1)
+        cards = (positions[None, :, None] >= ends[:, None, :]).sum(axis=2)
+        keys = self.sim.rng.random((len(rows), size))
+        keys[positions[None, :] >= lengths[:, None]] = 2.0
+        order = np.argsort(keys, axis=1)
+        shuffled = np.take_along_axis(cards, order, axis=1)
+
+        self.deck[rows, :size] = shuffled
+        self.deck_len[rows] = lengths
+        self.discard[rows] = 0
+        self.shuffles[rows] += 1
+
+    def evaluate(self, expr: Expr, rows: np.ndarray) -> np.ndarray:
+        sim = self.sim
+        value = np.full(len(rows), expr.constant, dtype=np.int64)
+        for (feature, card_name), coef in expr.terms.items():
+            if feature == Feature.Money:
+                term = self.money[rows]
+            elif feature == Feature.Actions:
+                term = self.actions[rows]
+            elif feature == Feature.Buys:
+                term = self.buys[rows]
+            elif feature == Feature.Turns:
+                term = self.turns[rows]
+            elif feature == Feature.DeckMoney:
+                term = self.owned[rows] @ sim.card_money
+            elif feature == Feature.TreasureCount:
+                term = self.owned[rows] @ sim.card_is_treasure
+            elif feature == Feature.CardCount:
+                term = self.owned[rows, sim.get_card_index(card_name)]
+            else:
+                term = self.supply[rows, sim.get_card_index(card_name)]
+            value += coef * term
+        return value
+
+    def holds(self, conditions: Tuple[Condition, ...], rows: np.ndarray) -> np.ndarray:
+        result = np.ones(len(rows), dtype=bool)
+        for condition in conditions:
+            result &= _comparisons[condition.op](self.evaluate(condition.expr, rows))
+        return result
+
+    def choose(self, rules: List[Sequence[Rule]], eligible: Callable[[int, np.ndarray], np.ndarray]) -> np.ndarray:
+        """
+        Get the index of the card of the first rule of each active player
+        that is eligible and holds, or -1 if there is none.
+
+        """
+        chosen = np.full(len(self.games), -1, dtype=np.int64)
+        for player_index, player_rules in enumerate(rules):
+            rows = np.nonzero(self.who == player_index)[0]
+            for rule in player_rules:
+                if len(rows) == 0:
+                    break
+                k = self.sim.get_card_index(rule.card.name)
+                ok = eligible(k, rows)
+                ok[ok] = self.holds(rule.conditions, rows[ok])
+                chosen[rows[ok]] = k
+                rows = rows[~ok]
+        return chosen
+
+    def action_phase(self) -> None:
+        sim = self.sim
+        active = np.ones(len(self.games), dtype=bool)
+        while True:
+            active &= (self.actions > 0) & ((self.hand @ sim.card_is_action) > 0)
+            if not active.any():
+                return
+            chosen = self.choose(
+                sim.action_rules,
+                lambda k, rows: active[rows] & (self.hand[rows, k] > 0),
+            )
+            playing = chosen >= 0
+            active &= playing
+            rows = np.nonzero(playing)[0]
+            if len(rows) == 0:
+                return
+            cards = chosen[rows]
+            self.hand[rows, cards] -= 1
+            self.playmat[rows, cards] += 1
+            self.actions[rows] += sim.card_actions[cards] - 1
+            self.buys[rows] += sim.card_buys[cards]
+            self.money[rows] += sim.card_money[cards]
+            draws = np.zeros(len(self.games), dtype=np.int64)
+            draws[rows] = sim.card_draw[cards]
+            for i in range(int(draws.max())):
+                self.draw(draws > i)
+
+    def treasure_phase(self) -> None:
+        treasures = self.hand * self.sim.card_is_treasure
+        self.money += treasures @ self.sim.card_money
+        self.hand -= treasures
+        self.playmat += treasures
+
+    def buy_phase(self) -> None:
+        sim = self.sim
+        active = self.buys > 0
+        while active.any():
+            chosen = self.choose(
+                sim.buy_rules,
+                lambda k, rows: (
+                    active[rows]
+                    & (sim.card_cost[k] <= self.money[rows])
+                    & (self.supply[rows, k] > 0)
+                ),
+            )
+            active &= chosen >= 0
+            rows = np.nonzero(active)[0]
+            cards = chosen[rows]
+            self.supply[rows, cards] -= 1
+            self.discard[rows, cards] += 1
+            self.owned[rows, cards] += 1
+            self.money[rows] -= sim.card_cost[cards]
+            self.buys[rows] -= 1
+            active &= self.buys > 0
+
+    def cleanup_phase(self) -> None:
+        self.discard += self.hand + self.playmat
+        self.hand[:] = 0
+        self.playmat[:] = 0
+        everyone = np.ones(len(self.games), dtype=bool)
+        for _ in range(5):
+            self.draw(everyone)
+
+
+class BatchSimulator:
+    """
+    Simulate many games between RuleBots at once. Requires numpy.
+
+    Every game takes the same turn at the same time, and decks, hands, money
+    and rules are evaluated for all games together with NumPy arrays. Only
+    cards without custom logic are supported: treasures and actions that do
+    not override play, and score cards whose score does not depend on other
+    cards. There are no attacks, so the games match games of the same
+    RuleBots played with Game.play.
+
+    The supply has the basic cards and the given kingdom cards. Piles no
+    rule can buy do not change the outcome, so the rest of the kingdom is
+    left out.
+
+    Attributes:
+        players: RuleBots playing every game.
+        kingdom_cards: Kingdom cards in the supply. Every card the rules can
+            play or buy must be in the supply.
+        iterations: Number of games to simulate.
+        start_deck: List of cards each player starts with. Default = [7 Coppers + 3 Estates].
+        random_order: If True, the order of players is random in every game.
+        seed: Seed for the random number generator.
+        max_turns: Games are stopped after this many rounds of turns.
+
+    """
+
+    def __init__(
+        self,
+        players: Sequence[RuleBot],
+        kingdom_cards: Optional[Sequence[Card]] = None,
+        iterations: int = 1000,
+        start_deck: Optional[Sequence[Card]] = None,
+        random_order: bool = True,
+        seed: Optional[int] = None,
+        max_turns: int = 100,
+    ):
+        for player in players:
+            if not isinstance(player.decider, RuleBotDecider):
+                raise InvalidGameSetup(f"{player} does not decide by rules")
+        self.players = list(players)
+        self.kingdom_cards = [] if kingdom_cards is None else list(kingdom_cards)
+        self.iterations = iterations
+        self.start_deck = (
+            [copper] * 7 + [estate] * 3 if start_deck is None else list(start_deck)
+        )
+        self.random_order = random_order
+        self.rng = np.random.default_rng(seed)
+        self.max_turns = max_turns
+
+        self.cards: List[Card] = [copper, silver, gold, estate, duchy, province, curse]
+        self.cards += [card for card in self.kingdom_cards if card not in self.cards]
+        self._card_indexes = {card.name: i for i, card in enumerate(self.cards)}
+        if unsupported := [card for card in self.cards if not is_batch_supported(card)]:
+            raise InvalidGameSetup(f"Invalid game setup: {unsupported} not supported by the batch engine")
+
+        deciders = [player.decider for player in self.players]
+        self.buy_rules = [decider.buy_rules for decider in deciders]  # type: ignore
+        self.action_rules = [decider.action_rules for decider in deciders]  # type: ignore
+        for rules in self.buy_rules + self.action_rules:
+            for rule in rules:
+                self.get_card_index(rule.card.name)
+                for condition in rule.conditions:
+                    for _, card_name in condition.expr.terms:
+                        if card_name is not None:
+                            self.get_card_index(card_name)
+
+        # an unstarted game to price cards and size piles with
+        game = Game(players=list(self.players), expansions=[self.kingdom_cards], log_stdout=False)
+        player = self.players[0]
+        self.card_cost = np.array([card.get_cost(player, game) for card in self.cards], dtype=np.int32)
+        self.card_money = np.array([getattr(card, "money", 0) for card in self.cards], dtype=np.int32)
+        self.card_is_treasure = np.array([card.is_treasure for card in self.cards], dtype=np.int32)
+        self.card_is_action = np.array([card.is_action for card in self.cards], dtype=np.int32)
+        self.card_actions = np.array([getattr(card, "actions", 0) for card in self.cards], dtype=np.int32)
+        self.card_draw = np.array([getattr(card, "draw", 0) for card in self.cards], dtype=np.int32)
+        self.card_buys = np.array([getattr(card, "buys", 0) for card in self.cards], dtype=np.int32)
+        self.card_vp = np.array(
+            [card.score(player) if isinstance(card, ScoreCard) else 0 for card in self.cards],
+            dtype=np.int32,
+        )
+        self.pile_counts = np.array(
+            [card.get_pile_starting_count(game) for card in self.cards], dtype=np.int32
+        )
+        self.province_index = self.get_card_index(province.name)
+
+    def get_card_index(self, card_name: str) -> int:
+        try:
+            return self._card_indexes[card_name]
+        except KeyError:
+            raise InvalidGameSetup(f"Invalid game setup: {card_name} is not in the supply") from None
+
+    def grow_decks(self, size: int) -> None:
+        pad = np.zeros(self.deck.shape[:2] + (size - self.deck.shape[2],), dtype=self.deck.dtype)
+        self.deck = np.concatenate([self.deck, pad], axis=2)
+
+    def _set_up(self) -> None:
+        num_games, num_players, num_cards = self.iterations, len(self.players), len(self.cards)
+        shape = (num_games, num_players, num_cards)
+
+        self.supply = np.tile(self.pile_counts, (num_games, 1))
+        self.hand = np.zeros(shape, dtype=np.int32)
+        self.discard = np.zeros(shape, dtype=np.int32)
+        self.owned = np.zeros(shape, dtype=np.int32)
+        self.deck = np.zeros((num_games, num_players, 2 * len(self.start_deck)), dtype=np.int64)
+        self.deck_len = np.zeros((num_games, num_players), dtype=np.int64)
+        self.shuffles = np.zeros((num_games, num_players), dtype=np.int32)
+        self.turns = np.zeros((num_games, num_players), dtype=np.int32)
+
+        start_counts = np.zeros(num_cards, dtype=np.int32)
+        for card in self.start_deck:
+            start_counts[self.get_card_index(card.name)] += 1
+        self.discard[:] = start_counts
+        self.owned[:] = start_counts
+
+        # order[game, seat] is the index of the player in that seat
+        if self.random_order:
+            self.order = np.argsort(self.rng.random((num_games, num_players)), axis=1)
+        else:
+            self.order = np.tile(np.arange(num_players), (num_games, 1))
+
+        all_games = np.arange(num_games)
+        for seat in range(num_players):
+            turn = _Turn(self, all_games, seat)
+            everyone = np.ones(num_games, dtype=bool)
+            for _ in range(5):
+                turn.draw(everyone)
+            turn.scatter()
+
+    def _is_over(self, games: np.ndarray) -> np.ndarray:
+        supply = self.supply[games]
+        return (supply[:, self.province_index] == 0) | ((supply == 0).sum(axis=1) >= 3)
+
+    def run(self) -> BatchResult:
+        logger.info("Simulating %s games in a batch...", self.iterations)
+        self._set_up()
+
+        num_players = len(self.players)
+        done = np.zeros(self.iterations, dtype=bool)
+        for _ in range(self.max_turns):
+            for seat in range(num_players):
+                games = np.nonzero(~done)[0]
+                if len(games) == 0:
+                    break
+                turn = _Turn(self, games, seat)
+                turn.turns += 1
+                turn.action_phase()
+                turn.treasure_phase()
+                turn.buy_phase()
+                turn.cleanup_phase()
+                turn.scatter()
+                done[games] = self._is_over(games)
+            if done.all():
+                break
+
+        return self._get_result()
+
+    def _get_result(self) -> BatchResult:
+        scores = self.owned @ self.card_vp
+
+        # highest score wins, ties go to the player with fewer turns
+        high_score = scores.max(axis=1, keepdims=True)
+        tied = scores == high_score
+        tied_turns = np.where(tied, self.turns, np.iinfo(np.int32).max)
+        winners = tied & (tied_turns == tied_turns.min(axis=1, keepdims=True))
+
+        turn_order = np.argsort(self.order, axis=1) + 1
+        return BatchResult(
+            players=self.players,
+            scores=scores,
+            turns=self.turns.copy(),
+            shuffles=self.shuffles.copy(),
+            winners=winners,
+            turn_order=turn_order,
+        )
@@ -5,6 +5,7 @@ from pyminion.decider import Decider
 from pyminion.player import Player
 
 if TYPE_CHECKING:
+    from pyminion.bots.endgame import EndgameSolver
     from pyminion.effects import Effect
     from pyminion.game import Game
 
@@ -22,8 +23,14 @@ class BotDecider:
     Does implement default responses to any decision the bot might have to make
     when playing a card or responding to an attack as to not crash the game.
 
+    If endgame_solver is set, buys near the end of the game are chosen by the
+    solver instead of buy_priority, which then only chooses between the buys
+    that the solver does not tell apart from buying nothing.
+
     """
 
+    endgame_solver: Optional["EndgameSolver"] = None
+
     def action_priority(self, player: "Player", game: "Game") -> Iterator[Card]:
         """
         Add logic for playing action cards through this method
@@ -70,6 +77,17 @@ class BotDecider:
         player: "Player",
         game: "Game",
     ) -> Optional["Card"]:
+        solver = self.endgame_solver
+        if solver is not None and solver.is_endgame(game):
+            card = solver.choose_buy(valid_cards, player, game)
+            if card is not None:
+                return card
+            # the solver found no victory card or last card of a pile worth buying
+            for card in self.buy_priority(player, game):
+                if game.supply.pile_length(card.name) > 0 and not solver.is_relevant(card, game):
+                    return card
+            return None
+
         for card in self.buy_priority(player, game):
             if game.supply.pile_length(card.name) > 0:
                 return card
@@ -220,6 +238,8 @@ class Bot(Player):
 
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         decider: Optional[Decider] = None,
@@ -0,0 +1,317 @@
+from math import comb, exp
+from typing import TYPE_CHECKING, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from pyminion.core import Card, ScoreCard
+from pyminion.player import Player
+
+if TYPE_CHECKING:
+    from pyminion.game import Game
+
+# the game ends when this many supply piles are empty
+EMPTY_PILES_TO_END = 3
+
+# probabilities of the money a player has in a turn
+MoneyDistribution = Tuple[Tuple[int, float], ...]
+
+# win probabilities of the players, in seat order
+Values = Tuple[float, ...]
+
+
+def get_money_distribution(
+    sure_cards: Sequence[Card],
+    pool: Sequence[Card],
+    num: int,
+    max_money: int,
+) -> MoneyDistribution:
+    """
+    Get the probabilities of the money of a hand made of sure_cards and num
+    cards drawn at random from pool. Money above max_money is counted as
+    max_money.
+
+    """
+    sure_money = sum(_get_money(card) for card in sure_cards)
+    num = min(num, len(pool))
+
+    counts: Dict[int, int] = {}
+    for card in pool:
+        money = _get_money(card)
+        counts[money] = counts.get(money, 0) + 1
+
+    # ways[k][m] is the number of ways to draw k cards with m money
+    ways: List[Dict[int, int]] = [{0: 1}] + [{} for _ in range(num)]
+    for money, count in counts.items():
+        new_ways: List[Dict[int, int]] = [{} for _ in range(num + 1)]
+        for k, by_money in enumerate(ways):
+            for m, w in by_money.items():
+                for j in range(min(count, num - k) + 1):
+                    total = m + j * money
+                    new_ways[k + j][total] = new_ways[k + j].get(total, 0) + w * comb(count, j)
+        ways = new_ways
+
+    total_ways = comb(len(pool), num)
+    distribution: Dict[int, float] = {}
+    for m, w in ways[num].items():
+        money = min(sure_money + m, max_money)
+        distribution[money] = distribution.get(money, 0.0) + w / total_ways
+    return tuple(sorted(distribution.items()))
+
+
+def _get_money(card: Card) -> int:
+    # treasures and actions that give money without conditions
+    return getattr(card, "money", 0)
+
+
+class _Position:
+    """
+    The parts of a game the endgame search looks at, taken when a solve
+    starts.
+
+    """
+
+    def __init__(self, player: Player, game: "Game", horizon: int, max_money: int):
+        self.players = game.players
+        self.num_players = len(game.players)
+        self.root = game.players.index(player)
+        self.horizon = horizon
+
+        # piles that change scores or can end the game when a card is bought
+        self.cards: List[Card] = []
+        counts = []
+        empty_piles = 0
+        for pile in game.supply.piles:
+            if len(pile) == 0:
+                empty_piles += 1
+            elif pile.cards[0].is_victory or pile.cards[0].is_curse or len(pile) == 1:
+                self.cards.append(pile.cards[0])
+                counts.append(len(pile))
+        self.counts = tuple(counts)
+        self.empty_piles = empty_piles
+        self.costs = [card.get_cost(player, game) for card in self.cards]
+        self.province = next((i for i, card in enumerate(self.cards) if card.name == "Province"), None)
+
+        self.scores = tuple(game.scoreboard.get_victory_points(p) for p in game.players)
+        self.gains = [
+            [card.score(p) if isinstance(card, ScoreCard) else 0 for card in self.cards]
+            for p in game.players
+        ]
+        self.turns = [p.turns for p in game.players]
+
+        max_money = min(max_money, max(self.costs, default=0))
+        self.first_turn_money: List[MoneyDistribution] = []
+        self.later_turn_money: List[MoneyDistribution] = []
+        for i, p in enumerate(game.players):
+            self.later_turn_money.append(get_money_distribution([], p.get_all_cards(), 5, max_money))
+            if i == self.root:
+                deck = p.deck.get_cards_unordered()
+                if len(deck) >= 5:
+                    money = get_money_distribution([], deck, 5, max_money)
+                else:
+                    pool = p.discard_pile.cards + p.hand.cards + p.playmat.cards
+                    money = get_money_distribution(deck, pool, 5 - len(deck), max_money)
+            else:
+                # the hand of another player is hidden, so it could be any of their unseen cards
+                pool = p.hand.cards + p.deck.get_cards_unordered()
+                money = get_money_distribution([], pool, len(p.hand), max_money)
+            self.first_turn_money.append(money)
+
+    def get_mover(self, ply: int) -> int:
+        return (self.root + ply) % self.num_players
+
+    def get_money(self, ply: int) -> MoneyDistribution:
+        mover = self.get_mover(ply)
+        if ply <= self.num_players:
+            return self.first_turn_money[mover]
+        return self.later_turn_money[mover]
+
+    def is_over(self, counts: Tuple[int, ...]) -> bool:
+        if self.province is not None and counts[self.province] == 0:
+            return True
+        emptied = sum(1 for count in counts if count == 0)
+        return self.empty_piles + emptied >= EMPTY_PILES_TO_END
+
+    def get_horizon_values(self, scores: Tuple[int, ...], lead_scale: float) -> Values:
+        """
+        Estimate each player's chance to win from the scores of a game that
+        has not ended by the horizon.
+
+        """
+        high_score = max(scores)
+        weights = [exp((score - high_score) / lead_scale) for score in scores]
+        total = sum(weights)
+        return tuple(weight / total for weight in weights)
+
+    def get_win_values(self, ply: int, scores: Tuple[int, ...]) -> Values:
+        """
+        Get each player's share of the win if the game ended after the turn
+        of a ply, by the rules of Game.get_winners.
+
+        """
+        turns = []
+        for i, num_turns in enumerate(self.turns):
+            # players after the root player in turn order have started another turn by each of their plies
+            first_ply = (i - self.root) % self.num_players or self.num_players
+            if ply >= first_ply:
+                num_turns += (ply - first_ply) // self.num_players + 1
+            turns.append(num_turns)
+
+        high_score = max(scores)
+        tied = [i for i, score in enumerate(scores) if score == high_score]
+        fewest_turns = min(turns[i] for i in tied)
+        winners = [i for i in tied if turns[i] == fewest_turns]
+        return tuple(1 / len(winners) if i in winners else 0.0 for i in range(self.num_players))
+
+
+class EndgameSolver:
+    """
+    Chooses buys near the end of the game by searching the remaining turns.
+
+    The game is near its end when at most provinces Provinces are left or
+    at least empty_piles supply piles are empty. The solver then searches
+    the next horizon turns, starting with the current buy, by expectimax:
+    in each turn the player whose turn it is buys what gives them the best
+    chance to win, averaged over the money they may draw. Only buys that
+    change the scores or empty a pile are told apart, since other buys do
+    not matter within a few turns. If the game has not ended by the
+    horizon, the chances to win are estimated from the scores: the chance
+    of each player is proportional to exp(score / lead_scale).
+
+    The money of a future turn is the money of the treasures, and of the
+    actions that give money, among the cards the player may draw. Other
+    effects of actions are not modelled. Each player's own draw pile is
+    used for their next hand, and the other players' hands are taken to be
+    any of the cards they have not shown.
+
+    Solved buys are memoized by the hash of the position from the player's
+    view, so positions that repeat across simulations are solved once.
+
+    """
+
+    def __init__(
+        self,
+        horizon: int = 3,
+        provinces: int = 2,
+        empty_piles: int = 2,
+        lead_scale: float = 4.0,
+        max_money: int = 11,
+        cache_size: int = 100000,
+    ):
+        self.horizon = horizon
+        self.lead_scale = lead_scale
+        self.provinces = provinces
+        self.empty_piles = empty_piles
+        self.max_money = max_money
+        self.cache_size = cache_size
+        self.cache: Dict[Hashable, Optional[str]] = {}
+
+    def is_endgame(self, game: "Game") -> bool:
+        if game.supply.pile_length("Province") <= self.provinces:
+            return True
+        empty_piles = sum(1 for pile in game.supply.piles if len(pile) == 0)
+        return empty_piles >= self.empty_piles
+
+    def is_relevant(self, card: Card, game: "Game") -> bool:
+        """
+        Whether the solver tells buying a card apart from buying nothing.
+
+        """
+        return card.is_victory or card.is_curse or game.supply.pile_length(card.name) == 1
+
+    def choose_buy(self, valid_cards: List[Card], player: Player, game: "Game") -> Optional[Card]:
+        """
+        Choose the card to buy from valid_cards that gives the player the
+        best chance to win, or None if buying none of the relevant cards
+        is best.
+
+        """
+        key = (
+            game.state_hash(perspective=player),
+            game.players.index(player),
+            tuple(p.turns for p in game.players),
+            player.state.money,
+            player.state.buys,
+            game.card_cost_reduction,
+        )
+        if key in self.cache:
+            name = self.cache[key]
+        else:
+            name = self._solve(valid_cards, player, game)
+            if len(self.cache) >= self.cache_size:
+                self.cache.clear()
+            self.cache[key] = name
+
+        if name is None:
+            return None
+        return next(card for card in valid_cards if card.name == name)
+
+    def _solve(self, valid_cards: List[Card], player: Player, game: "Game") -> Optional[str]:
+        position = _Position(player, game, self.horizon, self.max_money)
+        valid_names = {card.name for card in valid_cards}
+        memo: Dict[Hashable, Values] = {}
+
+        def search(ply: int, counts: Tuple[int, ...], scores: Tuple[int, ...]) -> Values:
+            if ply >= position.horizon:
+                return position.get_horizon_values(scores, self.lead_scale)
+            key = (ply, counts, scores)
+            values = memo.get(key)
+            if values is not None:
+                return values
+
+            mover = position.get_mover(ply)
+            expected = [0.0] * position.num_players
+            for money, probability in position.get_money(ply):
+                best, _ = buy(ply, mover, money, 1, counts, scores, None)
+                for i, value in enumerate(best):
+                    expected[i] += probability * value
+            values = tuple(expected)
+            memo[key] = values
+            return values
+
+        def buy(
+            ply: int,
+            mover: int,
+            money: int,
+            buys: int,
+            counts: Tuple[int, ...],
+            scores: Tuple[int, ...],
+            names: Optional[set],
+        ) -> Tuple[Values, Optional[int]]:
+            """
+            Get the values of the mover's best buys in the rest of a turn,
+            and the index of the card bought first, or None.
+
+            """
+            best = search(ply + 1, counts, scores)
+            best_index = None
+            best_gain = 0
+            for i, card in enumerate(position.cards):
+                if counts[i] == 0 or position.costs[i] > money:
+                    continue
+                if names is not None and card.name not in names:
+                    continue
+                new_counts = counts[:i] + (counts[i] - 1,) + counts[i + 1:]
+                new_scores = tuple(
+                    score + position.gains[p][i] if p == mover else score
+                    for p, score in enumerate(scores)
+                )
+                if position.is_over(new_counts):
+                    values = position.get_win_values(ply, new_scores)
+                elif buys > 1:
+                    values, _ = buy(ply, mover, money - position.costs[i], buys - 1, new_counts, new_scores, names)
+                else:
+                    values = search(ply + 1, new_counts, new_scores)
+                # between equal chances to win, the buy that scores the most is kept
+                gain = position.gains[mover][i]
+                if values[mover] > best[mover] + 1e-9 or (values[mover] > best[mover] - 1e-9 and gain > best_gain):
+                    best, best_index, best_gain = values, i, gain
+            return best, best_index
+
+        _, index = buy(
+            0,
+            position.root,
+            player.state.money,
+            player.state.buys,
+            position.counts,
+            position.scores,
+            valid_names,
+        )
+        return None if index is None else position.cards[index].name
@@ -2,7 +2,7 @@ import logging
 from typing import Iterator
 
 from pyminion.bots.bot import Bot, BotDecider
-from pyminion.core import CardType, Card
+from pyminion.core import Card
 from pyminion.expansions.base import duchy, estate, gold, province, silver, smithy
 from pyminion.player import Player
 from pyminion.game import Game
@@ -33,7 +33,7 @@ class BigMoneyUltimateDecider(BotDecider):
         num_province = game.supply.pile_length(pile_name="Province")
         num_smithy = player.get_card_count(card=smithy)
         num_treasure = len(
-            [card for card in player.get_all_cards() if CardType.Treasure in card.type]
+            [card for card in player.get_all_cards() if card.is_treasure]
         )
 
         if deck_money > 15 and money >= 8:
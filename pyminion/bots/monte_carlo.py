@@ -0,0 +1,327 @@
+import os
+import pickle
+import random
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, wait
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
+
+from pyminion.bots.optimized_bot import OptimizedBot, OptimizedBotDecider
+from pyminion.core import Action, Card
+from pyminion.decider import Decider
+from pyminion.expansions.base import duchy, estate, gold, province, silver
+from pyminion.log import logging_disabled
+from pyminion.player import Player
+
+if TYPE_CHECKING:
+    from pyminion.game import Game
+
+
+def get_action_play_order(player: Player, game: "Game") -> List[Card]:
+    """
+    Order the actions in a player's hand for playing without a card
+    specific strategy: actions that give actions first, then the ones that
+    draw the most cards, then the most expensive.
+
+    """
+    actions = [card for card in player.hand.cards if card.is_action]
+
+    def key(card: Card) -> Tuple[bool, int, int]:
+        gives_actions = isinstance(card, Action) and card.actions > 0
+        draw = card.draw if isinstance(card, Action) else 0
+        return (not gives_actions, -draw, -card.get_cost(player, game))
+
+    return sorted(actions, key=key)
+
+
+class RolloutDecider(OptimizedBotDecider):
+    """
+    Fast default policy for playing games to the end: plays actions in a
+    generic order, buys money and Provinces and greens near the end.
+
+    """
+
+    def action_priority(self, player: Player, game: "Game") -> Iterator[Card]:
+        yield from get_action_play_order(player, game)
+
+    def buy_priority(self, player: Player, game: "Game") -> Iterator[Card]:
+        money = player.state.money
+        provinces = game.supply.pile_length(province.name)
+        if money >= 8:
+            yield province
+        if money >= 5 and provinces <= 4:
+            yield duchy
+        if money >= 2 and provinces <= 2:
+            yield estate
+        if money >= 6:
+            yield gold
+        if money >= 3:
+            yield silver
+
+
+def fork_game(game: "Game") -> bytes:
+    """
+    Pickle a started game without its deciders and log handlers, which
+    may not be picklable. The game's players get deciders again when the
+    copy is played.
+
+    """
+    deciders = [player.decider for player in game.players]
+    log_handlers = game.log_handlers
+    stepper = game.stepper
+    try:
+        for player in game.players:
+            player.decider = None  # type: ignore[assignment]
+        game.log_handlers = ()
+        game.stepper = None
+        return pickle.dumps(game)
+    finally:
+        for player, decider in zip(game.players, deciders):
+            player.decider = decider
+        game.log_handlers = log_handlers
+        game.stepper = stepper
+
+
+def _determinize(game: "Game", player: Player, rng: random.Random) -> None:
+    """
+    Replace what a player cannot know with a random guess: the order of all
+    decks, and which of another player's cards are in their hand.
+
+    """
+    for other in game.players:
+        if other is player:
+            hidden = other.deck.cards[:]
+            num_hand = 0
+        else:
+            hidden = other.hand.cards + other.deck.cards
+            num_hand = len(other.hand)
+        rng.shuffle(hidden)
+        if num_hand > 0:
+            other.hand.clear()
+            other.hand.add_cards(hidden[:num_hand])
+        other.deck.clear()
+        other.deck.add_cards(hidden[num_hand:])
+
+
+def _play_rollout(game: "Game", player_index: int, card: Optional[Card], max_turns: int) -> float:
+    """
+    Finish the buy phase of a forked game with a buy, play the game to the
+    end and get the player's share of the win.
+
+    """
+    player = game.players[player_index]
+    if card is not None:
+        player.buy(card, game)
+        player.start_buy_phase(game)
+    player.start_cleanup_phase(game)
+    game.effect_registry.on_turn_end(player, game)
+    game.card_cost_reduction = 0
+
+    index = player_index
+    while not game.is_over():
+        index = (index + 1) % len(game.players)
+        if game.players[index].turns >= max_turns:
+            break
+        game.players[index].take_turn(game)
+        game.card_cost_reduction = 0
+
+    winners = game.get_winners()
+    return 1 / len(winners) if player in winners else 0.0
+
+
+def run_rollouts(
+    game_data: bytes,
+    player_index: int,
+    card: Optional[Card],
+    rollout_decider: Decider,
+    seed: int,
+    rollouts: int,
+    max_turns: int,
+    deadline: Optional[float] = None,
+) -> List[float]:
+    """
+    Play rollouts of a forked game after the player buys a card, or buys
+    nothing if card is None, and return the player's share of the win in
+    each. Runs in worker processes, so it is a module level function.
+
+    If a deadline is given as a time.time() value, no more rollouts are
+    started once it has passed, apart from the first.
+
+    """
+    rng = random.Random(seed)
+    outcomes: List[float] = []
+    with logging_disabled():
+        for _ in range(rollouts):
+            if deadline is not None and len(outcomes) > 0 and time.time() > deadline:
+                break
+            game: "Game" = pickle.loads(game_data)
+            game.clear_marks()
+            game.rng = random.Random(rng.getrandbits(64))
+            for player in game.players:
+                player.decider = rollout_decider
+                player.deck.rng = game.rng
+            _determinize(game, game.players[player_index], game.rng)
+            outcomes.append(_play_rollout(game, player_index, card, max_turns))
+    return outcomes
+
+
+class MonteCarloBotDecider(OptimizedBotDecider):
+    """
+    Chooses buys by flat Monte Carlo search and makes all other decisions
+    like the OptimizedBot, playing actions in a generic order.
+
+    For each card it can buy, and for buying nothing, the decider plays
+    rollouts: copies of the game in which it buys the card and all players
+    then follow the rollout policy to the end of the game. It buys the card
+    with the highest average share of the win. In each rollout the order of
+    the decks and the opponents' hands are shuffled, so the decider does
+    not use information hidden from it.
+
+    Rollouts run in a pool of processes, unless processes is 0, and stop
+    when time_budget seconds have passed since the decision started or
+    each candidate has had its rollouts. Candidates are evaluated in rounds
+    of batch_size rollouts, so they get about equal numbers of rollouts
+    when time runs out. Batches that have not started by then are
+    cancelled, and running batches stop after their current rollout.
+
+    The pool is shut down by close, when the decider is used as a context
+    manager and exits, or when the decider is garbage collected.
+
+    """
+
+    def __init__(
+        self,
+        rollouts: int = 32,
+        time_budget: float = 1.0,
+        processes: Optional[int] = None,
+        rollout_decider: Optional[Decider] = None,
+        batch_size: int = 4,
+        max_turns: int = 100,
+        seed: Optional[int] = None,
+    ):
+        self.rollouts = rollouts
+        self.time_budget = time_budget
+        self.processes = os.cpu_count() or 1 if processes is None else processes
+        self.rollout_decider = RolloutDecider() if rollout_decider is None else rollout_decider
+        self.batch_size = batch_size
+        self.max_turns = max_turns
+        self.rng = random.Random(seed)
+        self.executor: Optional[Executor] = None
+        self.futures: List[Future] = []
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state["executor"] = None
+        state["futures"] = []
+        return state
+
+    def __enter__(self) -> "MonteCarloBotDecider":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        # the pool does not exist if __init__ did not finish
+        if getattr(self, "executor", None) is not None:
+            self.close()
+
+    def close(self) -> None:
+        """
+        Cancel the rollouts that have not started and shut down the process
+        pool.
+
+        """
+        for future in self.futures:
+            future.cancel()
+        self.futures = []
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+            self.executor = None
+
+    def action_priority(self, player: Player, game: "Game") -> Iterator[Card]:
+        yield from get_action_play_order(player, game)
+
+    def evaluate_buys(
+        self,
+        candidates: List[Optional[Card]],
+        player: Player,
+        game: "Game",
+    ) -> List[List[float]]:
+        """
+        Play rollouts for each candidate buy within the time budget and get
+        the player's share of the win in each.
+
+        """
+        deadline = time.perf_counter() + self.time_budget
+        # workers run in other processes, so they are given the deadline as wall-clock time
+        worker_deadline = time.time() + self.time_budget
+        game_data = fork_game(game)
+        player_index = game.players.index(player)
+
+        tasks = []
+        for start in range(0, self.rollouts, self.batch_size):
+            for i, card in enumerate(candidates):
+                rollouts = min(self.batch_size, self.rollouts - start)
+                tasks.append((i, (game_data, player_index, card, self.rollout_decider,
+                                  self.rng.getrandbits(64), rollouts, self.max_turns)))
+
+        outcomes: List[List[float]] = [[] for _ in candidates]
+        if self.processes == 0:
+            for i, args in tasks:
+                if time.perf_counter() > deadline and all(outcomes):
+                    break
+                outcomes[i] += run_rollouts(*args)
+            return outcomes
+
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(self.processes)
+        futures: Dict[Future, int] = {
+            self.executor.submit(run_rollouts, *args, worker_deadline): i for i, args in tasks
+        }
+        self.futures = list(futures)
+        done, not_done = wait(futures, timeout=max(0.0, deadline - time.perf_counter()))
+        for future in not_done:
+            future.cancel()
+        self.futures = []
+        for future in done:
+            outcomes[futures[future]] += future.result()
+        return outcomes
+
+    def buy_phase_decision(
+        self,
+        valid_cards: List[Card],
+        player: Player,
+        game: "Game",
+    ) -> Optional[Card]:
+        candidates: List[Optional[Card]] = [None]
+        for card in valid_cards:
+            if card not in candidates:
+                candidates.append(card)
+        if len(candidates) == 1:
+            return None
+
+        outcomes = self.evaluate_buys(candidates, player, game)
+        scored = [(sum(o) / len(o), card) for o, card in zip(outcomes, candidates) if len(o) > 0]
+        if len(scored) == 0:
+            return self.rollout_decider.buy_phase_decision(valid_cards, player, game)
+        return max(scored, key=lambda score_card: score_card[0])[1]
+
+
+class MonteCarloBot(OptimizedBot):
+    def __init__(
+        self,
+        rollouts: int = 32,
+        time_budget: float = 1.0,
+        processes: Optional[int] = None,
+        rollout_decider: Optional[Decider] = None,
+        seed: Optional[int] = None,
+        player_id: str = "monte_carlo_bot",
+    ):
+        decider = MonteCarloBotDecider(
+            rollouts=rollouts,
+            time_budget=time_budget,
+            processes=processes,
+            rollout_decider=rollout_decider,
+            seed=seed,
+        )
+        super().__init__(decider=decider, player_id=player_id)
@@ -1,7 +1,7 @@
 from typing import TYPE_CHECKING, Iterable, List, Literal, Optional, Tuple, Union, overload
 
 from pyminion.bots.bot import Bot, BotDecider
-from pyminion.core import CardType, Card, DeckCounter, Treasure, Victory, get_action_cards, get_treasure_cards, get_victory_cards, get_score_cards
+from pyminion.core import Card, DeckCounter, Treasure, Victory, get_action_cards, get_treasure_cards, get_victory_cards, get_score_cards
 from pyminion.decider import Decider
 from pyminion.exceptions import InvalidBotImplementation
 from pyminion.expansions.base import duchy, estate, curse, gold, silver, copper
@@ -9,6 +9,7 @@ from pyminion.expansions.intrigue import Baron, Courtier, Lurker, Minion, Nobles
 from pyminion.player import Player
 
 if TYPE_CHECKING:
+    from pyminion.bots.turn_planner import TurnPlanner
     from pyminion.game import Game
 
 
@@ -20,8 +21,14 @@ class OptimizedBotDecider(BotDecider):
     If inheriting from this bot, it is possible to change the way that a single card is executed
     by overwriting the card specific method at the bottom of this file.
 
+    If turn_planner is set, the actions yielded by action_priority are played
+    in the order the planner finds best, rather than in priority order, and
+    the planner chooses the action for Throne Room.
+
     """
 
+    turn_planner: Optional["TurnPlanner"] = None
+
     @staticmethod
     def get_best_victory_card(valid_cards: List[Card], player: Player) -> Union[Victory, None]:
         """
@@ -51,11 +58,11 @@ class OptimizedBotDecider(BotDecider):
         non_score_cards = [
             card
             for card in sorted_cards
-            if CardType.Victory not in card.type and CardType.Curse not in card.type
+            if not card.is_victory and not card.is_curse
         ]
-        treasure_cards = [card for card in non_score_cards if CardType.Treasure in card.type]
+        treasure_cards = [card for card in non_score_cards if card.is_treasure]
         action_cards = [
-            card for card in non_score_cards if CardType.Treasure not in card.type
+            card for card in non_score_cards if not card.is_treasure
         ]
         if actions == 0:
             return score_cards + action_cards + treasure_cards
@@ -69,7 +76,7 @@ class OptimizedBotDecider(BotDecider):
 
         prioritized_cards: List[Tuple[int, Card]] = []
         for card in cards:
-            if CardType.Curse in card.type:
+            if card.is_curse:
                 priority = 1
             elif card.name == "Estate" and num_provinces >= 5:
                 priority = 2
@@ -90,13 +97,13 @@ class OptimizedBotDecider(BotDecider):
         discard_cards: List[Card] = []
         actions = player.state.actions
         for card in cards:
-            if CardType.Treasure in card.type:
+            if card.is_treasure:
                 continue
-            elif CardType.Curse in card.type:
+            elif card.is_curse:
                 discard_cards.append(card)
-            elif CardType.Victory in card.type and CardType.Action not in card.type:
+            elif card.is_victory and not card.is_action:
                 discard_cards.append(card)
-            elif actions == 0 and CardType.Action in card.type:
+            elif actions == 0 and card.is_action:
                 discard_cards.append(card)
 
         return discard_cards
@@ -117,7 +124,7 @@ class OptimizedBotDecider(BotDecider):
         deck_money = player.get_deck_money()
         trash_cards = []
         for card in valid_cards:
-            if CardType.Curse in card.type:
+            if card.is_curse:
                 trash_cards.append(card)
             elif (
                 card.name == "Estate"
@@ -397,6 +404,17 @@ class OptimizedBotDecider(BotDecider):
         else:
             return super().name_card_decision(prompt, card, valid_cards, player, game, min_num_name, max_num_name)
 
+    def action_phase_decision(
+        self,
+        valid_actions: List["Card"],
+        player: "Player",
+        game: "Game",
+    ) -> Optional["Card"]:
+        if self.turn_planner is None:
+            return super().action_phase_decision(valid_actions, player, game)
+        priority = list(self.action_priority(player, game))
+        return self.turn_planner.choose_action(valid_actions, player, game, priority)
+
     def multi_play_decision(
         self,
         prompt: str,
@@ -407,6 +425,11 @@ class OptimizedBotDecider(BotDecider):
         required: bool = True,
     ) -> Optional["Card"]:
         if card.name == "Throne Room":
+            if self.turn_planner is not None:
+                priority = list(self.action_priority(player, game))
+                planned = self.turn_planner.choose_multi_play(valid_cards, player, game, priority)
+                if planned is not None:
+                    return planned
             return self.throne_room(player=player, game=game, valid_cards=valid_cards)
         else:
             return super().multi_play_decision(prompt, card, valid_cards, player, game, required)
@@ -481,8 +504,8 @@ class OptimizedBotDecider(BotDecider):
                 card
                 for card in valid_cards
                 if card.name == "Copper"
-                or CardType.Victory in card.type
-                or CardType.Curse in card.type
+                or card.is_victory
+                or card.is_curse
             ]
         if binary:
             return False
@@ -501,7 +524,7 @@ class OptimizedBotDecider(BotDecider):
         return [
             card
             for card in valid_cards
-            if card.name == "Copper" or CardType.Victory in card.type or CardType.Curse in card.type
+            if card.name == "Copper" or card.is_victory or card.is_curse
         ]
 
     def moat(self, player: "Player", game: "Game", relevant_cards: Optional[List[Card]]) -> bool:
@@ -575,7 +598,7 @@ class OptimizedBotDecider(BotDecider):
     ) -> Card:
         if topdeck:
             for card in player.hand.cards:
-                if CardType.Action in card.type and player.state.actions == 0:
+                if card.is_action and player.state.actions == 0:
                     return card
             else:
                 return player.hand.cards[-1]
@@ -606,7 +629,7 @@ class OptimizedBotDecider(BotDecider):
         valid_cards: List[Card],
     ) -> Optional[Card]:
         # Do not topdeck victory cards
-        best_topdeck = [card for card in valid_cards if CardType.Victory not in card.type]
+        best_topdeck = [card for card in valid_cards if not card.is_victory]
         if not best_topdeck:
             return None
         # Topdeck highest price card if price > 2
@@ -684,7 +707,7 @@ class OptimizedBotDecider(BotDecider):
             assert num_choices > 0
             counter = DeckCounter(player.get_all_cards())
             gold_count = counter[gold]
-            has_actions = any(CardType.Action in c.type for c in player.hand.cards)
+            has_actions = any(c.is_action for c in player.hand.cards)
 
             # prioritize choices
             choices: List[int] = []
@@ -714,7 +737,7 @@ class OptimizedBotDecider(BotDecider):
     ) -> Card:
         if player.state.actions == 0:
             for card in valid_cards:
-                if CardType.Action in card.type:
+                if card.is_action:
                     return card
 
         return valid_cards[-1]
@@ -823,7 +846,7 @@ class OptimizedBotDecider(BotDecider):
         gain: bool = False,
     ) -> Union[int, Card]:
         if options:
-            if any(CardType.Action in c.type for c in game.trash.cards):
+            if any(c.is_action for c in game.trash.cards):
                 return Lurker.Choice.GainAction
             else:
                 return Lurker.Choice.TrashAction
@@ -958,9 +981,9 @@ class OptimizedBotDecider(BotDecider):
         has_action_cards = False
         hand_money = 0
         for card in player.hand.cards:
-            if CardType.Action in card.type:
+            if card.is_action:
                 has_action_cards = True
-            if CardType.Treasure in card.type:
+            if card.is_treasure:
                 assert isinstance(card, Treasure)
                 hand_money += card.money
 
@@ -999,9 +1022,9 @@ class OptimizedBotDecider(BotDecider):
         action_card_count = 0
         total_money = player.state.money
         for card in player.hand.cards:
-            if CardType.Action in card.type:
+            if card.is_action:
                 action_card_count += 1
-            if CardType.Treasure in card.type:
+            if card.is_treasure:
                 assert isinstance(card, Treasure)
                 total_money += card.money
 
@@ -1034,7 +1057,7 @@ class OptimizedBotDecider(BotDecider):
             has_gold = False
             has_curse = False
             for card in valid_cards:
-                if CardType.Curse in card.type:
+                if card.is_curse:
                     has_curse = True
                 elif card.name == "Gold":
                     has_gold = True
@@ -1173,10 +1196,10 @@ class OptimizedBotDecider(BotDecider):
             if card.name == "Curse":
                 # prioritize giving opponents curses first
                 prioritized_cards.append((1, card))
-            elif CardType.Attack in card.type:
+            elif card.is_attack:
                 # lower priority for giving opponents attack cards
                 prioritized_cards.append((3, card))
-            elif CardType.Victory in card.type:
+            elif card.is_victory:
                 # lower priority for giving opponents victory cards
                 prioritized_cards.append((4, card))
             else:
@@ -0,0 +1,279 @@
+from enum import Enum
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, Optional, Sequence, Tuple, Union
+
+from pyminion.bots.bot import Bot, BotDecider
+from pyminion.core import Card
+from pyminion.expansions.base import duchy, estate, gold, province, silver, smithy
+from pyminion.player import Player
+
+if TYPE_CHECKING:
+    from pyminion.game import Game
+
+
+class Feature(Enum):
+    """
+    Integer valued quantities of a game that rules can test.
+
+    Money, Actions and Buys are the active player's current state. Turns is
+    the number of turns the player has started. DeckMoney is the money of
+    all the player's cards, TreasureCount the number of treasures they own.
+    CardCount and PileCount are the number of copies of a card the player
+    owns and that are left in the supply.
+
+    """
+
+    Money = "money"
+    Actions = "actions"
+    Buys = "buys"
+    Turns = "turns"
+    DeckMoney = "deck_money"
+    TreasureCount = "treasure_count"
+    CardCount = "card_count"
+    PileCount = "pile_count"
+
+
+def _get_treasure_count(player: Player, game: "Game", card_name: Optional[str]) -> int:
+    return sum(1 for card in player.get_all_cards() if card.is_treasure)
+
+
+def _get_card_count(player: Player, game: "Game", card_name: Optional[str]) -> int:
+    assert card_name is not None
+    return game.scoreboard.get_card_count(player, card_name)
+
+
+def _get_pile_count(player: Player, game: "Game", card_name: Optional[str]) -> int:
+    assert card_name is not None
+    return game.supply.pile_length(card_name)
+
+
+_feature_getters: Dict[Feature, Callable[[Player, "Game", Optional[str]], int]] = {
+    Feature.Money: lambda player, game, card_name: player.state.money,
+    Feature.Actions: lambda player, game, card_name: player.state.actions,
+    Feature.Buys: lambda player, game, card_name: player.state.buys,
+    Feature.Turns: lambda player, game, card_name: player.turns,
+    Feature.DeckMoney: lambda player, game, card_name: player.get_deck_money(),
+    Feature.TreasureCount: _get_treasure_count,
+    Feature.CardCount: _get_card_count,
+    Feature.PileCount: _get_pile_count,
+}
+
+# a feature together with the card it refers to, if any
+Term = Tuple[Feature, Optional[str]]
+
+
+class Expr:
+    """
+    Integer linear combination of game features plus a constant.
+
+    Expressions are built from the feature helpers below with +, - and
+    multiplication by integers. Comparing an expression with another
+    expression or an integer gives a Condition. Because they are linear,
+    the batch engine can evaluate them for many games at once.
+
+    """
+
+    __slots__ = ("terms", "constant")
+
+    def __init__(self, terms: Optional[Dict[Term, int]] = None, constant: int = 0):
+        self.terms: Dict[Term, int] = {} if terms is None else terms
+        self.constant = constant
+
+    def __repr__(self):
+        parts = []
+        for (feature, card_name), coef in self.terms.items():
+            name = feature.value if card_name is None else f"{feature.value}({card_name})"
+            parts.append(name if coef == 1 else f"{coef}*{name}")
+        if self.constant != 0 or len(parts) == 0:
+            parts.append(str(self.constant))
+        return " + ".join(parts)
+
+    def evaluate(self, player: Player, game: "Game") -> int:
+        value = self.constant
+        for (feature, card_name), coef in self.terms.items():
+            value += coef * _feature_getters[feature](player, game, card_name)
+        return value
+
+    def _combine(self, other: Union["Expr", int], sign: int) -> "Expr":
+        other = _as_expr(other)
+        terms = dict(self.terms)
+        for term, coef in other.terms.items():
+            terms[term] = terms.get(term, 0) + sign * coef
+        terms = {term: coef for term, coef in terms.items() if coef != 0}
+        return Expr(terms, self.constant + sign * other.constant)
+
+    def __add__(self, other: Union["Expr", int]) -> "Expr":
+        return self._combine(other, 1)
+
+    def __radd__(self, other: int) -> "Expr":
+        return self._combine(other, 1)
+
+    def __sub__(self, other: Union["Expr", int]) -> "Expr":
+        return self._combine(other, -1)
+
+    def __rsub__(self, other: int) -> "Expr":
+        return _as_expr(other)._combine(self, -1)
+
+    def __mul__(self, factor: int) -> "Expr":
+        if not isinstance(factor, int):
+            return NotImplemented
+        terms = {term: coef * factor for term, coef in self.terms.items() if coef * factor != 0}
+        return Expr(terms, self.constant * factor)
+
+    def __rmul__(self, factor: int) -> "Expr":
+        return self.__mul__(factor)
+
+    def __lt__(self, other: Union["Expr", int]) -> "Condition":
+        return Condition(self - other, "<")
+
+    def __le__(self, other: Union["Expr", int]) -> "Condition":
+        return Condition(self - other, "<=")
+
+    def __gt__(self, other: Union["Expr", int]) -> "Condition":
+        return Condition(self - other, ">")
+
+    def __ge__(self, other: Union["Expr", int]) -> "Condition":
+        return Condition(self - other, ">=")
+
+    def __eq__(self, other: Union["Expr", int]) -> "Condition":  # type: ignore[override]
+        return Condition(self - other, "==")
+
+    def __ne__(self, other: Union["Expr", int]) -> "Condition":  # type: ignore[override]
+        return Condition(self - other, "!=")
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+def _as_expr(value: Union[Expr, int]) -> Expr:
+    if isinstance(value, Expr):
+        return value
+    return Expr(constant=value)
+
+
+class Condition:
+    """
+    Comparison of an expression with zero.
+
+    """
+
+    __slots__ = ("expr", "op")
+
+    OPS: Dict[str, Callable[[int], bool]] = {
+        "<": lambda value: value < 0,
+        "<=": lambda value: value <= 0,
+        ">": lambda value: value > 0,
+        ">=": lambda value: value >= 0,
+        "==": lambda value: value == 0,
+        "!=": lambda value: value != 0,
+    }
+
+    def __init__(self, expr: Expr, op: str):
+        if op not in Condition.OPS:
+            raise ValueError(f"Unknown comparison {op}")
+        self.expr = expr
+        self.op = op
+
+    def __repr__(self):
+        return f"{self.expr} {self.op} 0"
+
+    def holds(self, player: Player, game: "Game") -> bool:
+        return Condition.OPS[self.op](self.expr.evaluate(player, game))
+
+
+money = Expr({(Feature.Money, None): 1})
+actions = Expr({(Feature.Actions, None): 1})
+buys = Expr({(Feature.Buys, None): 1})
+turns = Expr({(Feature.Turns, None): 1})
+deck_money = Expr({(Feature.DeckMoney, None): 1})
+treasure_count = Expr({(Feature.TreasureCount, None): 1})
+
+
+def card_count(card: Card) -> Expr:
+    return Expr({(Feature.CardCount, card.name): 1})
+
+
+def pile_count(card: Card) -> Expr:
+    return Expr({(Feature.PileCount, card.name): 1})
+
+
+class Rule:
+    """
+    Play or buy a card if all conditions hold.
+
+    """
+
+    __slots__ = ("card", "conditions")
+
+    def __init__(self, card: Card, *conditions: Condition):
+        self.card = card
+        self.conditions: Tuple[Condition, ...] = conditions
+
+    def __repr__(self):
+        conditions = ", ".join(str(c) for c in self.conditions)
+        return f"Rule({self.card}, {conditions})" if conditions else f"Rule({self.card})"
+
+    def holds(self, player: Player, game: "Game") -> bool:
+        return all(condition.holds(player, game) for condition in self.conditions)
+
+
+class RuleBotDecider(BotDecider):
+    """
+    Plays and buys cards by priority lists of rules.
+
+    The first action rule whose card is in hand and whose conditions hold is
+    played. The first buy rule whose card is affordable, still in the
+    supply and whose conditions hold is bought. The rules are restricted to
+    linear conditions on game features, so bots deciding only by rules can
+    also be simulated by the batch engine in pyminion.batch.
+
+    """
+
+    def __init__(self, buy_rules: Sequence[Rule], action_rules: Sequence[Rule] = ()):
+        self.buy_rules = tuple(buy_rules)
+        self.action_rules = tuple(action_rules)
+
+    def action_priority(self, player: Player, game: "Game") -> Iterator[Card]:
+        for rule in self.action_rules:
+            if rule.holds(player, game):
+                yield rule.card
+
+    def buy_priority(self, player: Player, game: "Game") -> Iterator[Card]:
+        for rule in self.buy_rules:
+            if rule.card.get_cost(player, game) <= player.state.money and rule.holds(player, game):
+                yield rule.card
+
+
+class RuleBot(Bot):
+    def __init__(
+        self,
+        buy_rules: Sequence[Rule],
+        action_rules: Sequence[Rule] = (),
+        player_id: str = "rule_bot",
+    ):
+        super().__init__(decider=RuleBotDecider(buy_rules, action_rules), player_id=player_id)
+
+
+# rule versions of the example bots
+big_money_rules = [
+    Rule(province),
+    Rule(gold),
+    Rule(silver),
+]
+
+big_money_smithy_rules = [
+    Rule(province),
+    Rule(gold),
+    Rule(smithy, money == 4),
+    Rule(silver),
+]
+
+big_money_ultimate_rules = [
+    Rule(province, deck_money > 15),
+    Rule(duchy, pile_count(province) < 5),
+    Rule(estate, pile_count(province) < 3),
+    Rule(gold),
+    Rule(duchy, pile_count(province) < 7),
+    Rule(smithy, 11 * card_count(smithy) < treasure_count),
+    Rule(silver),
+]
+
+smithy_action_rules = [Rule(smithy)]
@@ -0,0 +1,309 @@
+from math import comb
+from typing import TYPE_CHECKING, Dict, Hashable, Iterable, Iterator, List, Optional, Set, Tuple
+
+from pyminion.core import Action, Card
+from pyminion.player import Player
+
+if TYPE_CHECKING:
+    from pyminion.game import Game
+
+# cards that let the player choose an action from their hand to play twice
+MULTI_PLAY_CARDS = {"Throne Room"}
+
+# counts of cards by name, with the cards that are not planned actions counted as ""
+Multiset = Tuple[Tuple[str, int], ...]
+
+# the cards of a pile and the average money of its cards that are not planned actions
+Pile = Tuple[Multiset, float]
+
+_OTHER = ""
+
+_EMPTY_PILE: Pile = ((), 0.0)
+
+
+def _to_multiset(counts: Dict[str, int]) -> Multiset:
+    return tuple(sorted((name, count) for name, count in counts.items() if count > 0))
+
+
+def _remove(multiset: Multiset, name: str) -> Multiset:
+    counts = dict(multiset)
+    counts[name] -= 1
+    return _to_multiset(counts)
+
+
+def _iter_draws(cards: Multiset, num: int) -> Iterator[Tuple[float, Multiset, Multiset]]:
+    """
+    Iterate over the outcomes of drawing num cards from a shuffled pile,
+    with their probability, the cards drawn and the cards left.
+
+    """
+    total = comb(sum(count for _, count in cards), num)
+
+    def draw(index: int, num: int) -> Iterator[Tuple[int, Dict[str, int]]]:
+        if num == 0:
+            yield 1, {}
+            return
+        if index == len(cards):
+            return
+        name, count = cards[index]
+        for drawn in range(min(num, count), -1, -1):
+            for ways, rest in draw(index + 1, num - drawn):
+                if drawn > 0:
+                    rest = {**rest, name: drawn}
+                yield ways * comb(count, drawn), rest
+
+    for ways, drawn in draw(0, num):
+        left = {name: count - drawn.get(name, 0) for name, count in cards}
+        yield ways / total, _to_multiset(drawn), _to_multiset(left)
+
+
+class TurnPlanner:
+    """
+    Chooses which action to play next by searching over the orders the
+    actions in hand could be played in.
+
+    A turn is modelled by the actions, cards, money and buys that the
+    actions give. Draws are weighed by their probability, using what is in
+    the draw pile, and in the discard pile once the draw pile runs out, but
+    not the order of the draw pile, which the player does not know. The
+    value of a plan is the expected money from played actions and drawn
+    treasures, plus buy_value for each extra buy and play_value for each
+    action played. Throne Room is planned with the action it plays twice.
+    Other effects of actions are not modelled, so the planner suits
+    engines of drawing and village cards.
+
+    Only the actions given by the caller are planned, which lets a bot
+    keep choosing which actions it is willing to play. Actions earlier in
+    the given order are preferred between plans of equal value. Drawing
+    other cards matters to a plan only through their money, so they are
+    not told apart and are valued at the average money of their pile,
+    which gives the same expected value.
+
+    Values are cached by the planned actions in hand and the remaining
+    actions, plus the draw and discard piles if an action in hand draws,
+    so hands that repeat across turns and games are planned once. A
+    decision looks at no more than max_nodes positions, shared between
+    its options, and positions past that are valued as stopping.
+
+    """
+
+    def __init__(
+        self,
+        buy_value: float = 0.5,
+        play_value: float = 0.01,
+        max_nodes: int = 2000,
+        cache_size: int = 100000,
+    ):
+        self.buy_value = buy_value
+        self.play_value = play_value
+        self.max_nodes = max_nodes
+        self.cache_size = cache_size
+        self.cache: Dict[Hashable, float] = {}
+        self._cards: Dict[str, Card] = {}
+        self._planned: Optional[Set[str]] = None
+        self._nodes = 0
+        self._node_limit = 0
+
+    def choose_action(
+        self,
+        valid_actions: List[Card],
+        player: Player,
+        game: "Game",
+        priority: Optional[Iterable[Card]] = None,
+    ) -> Optional[Card]:
+        """
+        Choose the next action to play from valid_actions, or None to stop
+        playing actions. If priority is given, only its cards are played.
+
+        """
+        names = self._set_up(valid_actions, player, priority)
+        if player.state.actions < 1:
+            return None
+
+        hand, deck, discard = self._get_piles(player)
+        options = self._get_options(hand, valid_actions)
+        values = {}
+        for i, name in enumerate(options):
+            self._node_limit = self._nodes + (self.max_nodes - self._nodes) // (len(options) - i)
+            values[name] = self._play(name, hand, player.state.actions, deck, discard)
+        return self._choose(valid_actions, values, names)
+
+    def choose_multi_play(
+        self,
+        valid_cards: List[Card],
+        player: Player,
+        game: "Game",
+        priority: Optional[Iterable[Card]] = None,
+    ) -> Optional[Card]:
+        """
+        Choose the action for a Throne Room to play twice, or None if no
+        planned action can be chosen.
+
+        """
+        names = self._set_up(valid_cards, player, priority)
+        hand, deck, discard = self._get_piles(player)
+        options = self._get_options(hand, valid_cards)
+        values = {}
+        for i, name in enumerate(options):
+            self._node_limit = self._nodes + (self.max_nodes - self._nodes) // (len(options) - i)
+            values[name] = self._multi_play(name, hand, player.state.actions, deck, discard)
+        return self._choose(valid_cards, values, names)
+
+    def _set_up(self, valid_cards: List[Card], player: Player, priority: Optional[Iterable[Card]]) -> List[str]:
+        """
+        Prepare a plan and get the names of the planned actions in order of
+        preference. Without a priority, all actions are planned in the
+        order of valid_cards.
+
+        """
+        self._nodes = 0
+        if len(self.cache) > self.cache_size:
+            self.cache.clear()
+
+        names: List[str] = []
+        for card in valid_cards if priority is None else priority:
+            if card.name not in names:
+                names.append(card.name)
+        self._planned = None if priority is None else set(names)
+        return names
+
+    def _is_planned(self, card: Card) -> bool:
+        return card.is_action and (self._planned is None or card.name in self._planned)
+
+    @staticmethod
+    def _get_options(hand: Multiset, valid_cards: List[Card]) -> List[str]:
+        valid_names = {card.name for card in valid_cards}
+        return [name for name, _ in hand if name in valid_names]
+
+    @staticmethod
+    def _choose(valid_cards: List[Card], values: Dict[str, float], names: List[str]) -> Optional[Card]:
+        if len(values) == 0:
+            return None
+        # max keeps the first of equal values, which is the earliest in order of preference
+        best = max((name for name in names if name in values), key=lambda name: values[name])
+        return next(card for card in valid_cards if card.name == best)
+
+    def _get_piles(self, player: Player) -> Tuple[Multiset, Pile, Pile]:
+        """
+        Get the planned actions in hand, and the draw and discard piles.
+
+        """
+        hand: Dict[str, int] = {}
+        for card in player.hand.cards:
+            if self._is_planned(card):
+                self._cards.setdefault(card.name, card)
+                hand[card.name] = hand.get(card.name, 0) + 1
+        deck = self._get_pile(player.deck.get_cards_unordered())
+        discard = self._get_pile(player.discard_pile.cards)
+        return _to_multiset(hand), deck, discard
+
+    def _get_pile(self, cards: Iterable[Card]) -> Pile:
+        counts: Dict[str, int] = {}
+        money = 0
+        for card in cards:
+            if self._is_planned(card):
+                self._cards.setdefault(card.name, card)
+                name = card.name
+            else:
+                name = _OTHER
+                if card.is_treasure:
+                    money += getattr(card, "money", 0)
+            counts[name] = counts.get(name, 0) + 1
+        num_other = counts.get(_OTHER, 0)
+        return _to_multiset(counts), money / num_other if num_other > 0 else 0.0
+
+    def _can_draw(self, hand: Multiset) -> bool:
+        for name, _ in hand:
+            card = self._cards[name]
+            if isinstance(card, Action) and card.draw > 0:
+                return True
+        return False
+
+    def _value(self, hand: Multiset, actions: int, deck: Pile, discard: Pile) -> float:
+        """
+        Get the expected value of the best plan for the rest of the turn.
+
+        """
+        if actions < 1 or len(hand) == 0:
+            return 0.0
+
+        piles = (deck, discard) if self._can_draw(hand) else None
+        key = (hand, actions, piles)
+        value = self.cache.get(key)
+        if value is not None:
+            return value
+
+        self._nodes += 1
+        if self._nodes > self._node_limit:
+            return 0.0
+
+        value = 0.0
+        for name, _ in hand:
+            value = max(value, self._play(name, hand, actions, deck, discard))
+        # values found after the node budget ran out are incomplete
+        if self._nodes <= self._node_limit:
+            self.cache[key] = value
+        return value
+
+    def _play(self, name: str, hand: Multiset, actions: int, deck: Pile, discard: Pile) -> float:
+        hand = _remove(hand, name)
+        actions -= 1
+        if name not in MULTI_PLAY_CARDS:
+            return self._resolve(self._cards[name], 1, hand, actions, deck, discard)
+
+        value = self.play_value + self._value(hand, actions, deck, discard)
+        for target, _ in hand:
+            value = max(value, self._multi_play(target, hand, actions, deck, discard))
+        return value
+
+    def _multi_play(self, name: str, hand: Multiset, actions: int, deck: Pile, discard: Pile) -> float:
+        hand = _remove(hand, name)
+        if name in MULTI_PLAY_CARDS:
+            # a Throne Room played twice is not planned further
+            return 2 * self.play_value + self._value(hand, actions, deck, discard)
+        return self.play_value + self._resolve(self._cards[name], 2, hand, actions, deck, discard)
+
+    def _resolve(self, card: Card, times: int, hand: Multiset, actions: int, deck: Pile, discard: Pile) -> float:
+        """
+        Get the value of the effects of playing an action a number of times.
+
+        """
+        if not isinstance(card, Action):
+            return self.play_value + self._value(hand, actions, deck, discard)
+        gain = times * (self.play_value + card.money + self.buy_value * card.buys)
+        return gain + self._draw(hand, actions + times * card.actions, deck, discard, times * card.draw)
+
+    def _draw(self, hand: Multiset, actions: int, deck: Pile, discard: Pile, num: int) -> float:
+        """
+        Get the expected value of drawing num cards: the money of the drawn
+        treasures and the value of the best plan with the new hand.
+
+        """
+        cards, money = deck
+        deck_size = sum(count for _, count in cards)
+        if num == 0 or deck_size + len(discard[0]) == 0:
+            return self._value(hand, actions, deck, discard)
+
+        if num >= deck_size:
+            # the whole draw pile is drawn, then the discard pile is shuffled
+            drawn_money, hand = self._add_drawn(hand, cards, money)
+            if num > deck_size and len(discard[0]) > 0:
+                return drawn_money + self._draw(hand, actions, discard, _EMPTY_PILE, num - deck_size)
+            return drawn_money + self._value(hand, actions, _EMPTY_PILE, discard)
+
+        value = 0.0
+        for probability, drawn, left in _iter_draws(cards, num):
+            drawn_money, new_hand = self._add_drawn(hand, drawn, money)
+            value += probability * (drawn_money + self._value(new_hand, actions, (left, money), discard))
+        return value
+
+    @staticmethod
+    def _add_drawn(hand: Multiset, drawn: Multiset, money: float) -> Tuple[float, Multiset]:
+        counts = dict(hand)
+        drawn_money = 0.0
+        for name, count in drawn:
+            if name == _OTHER:
+                drawn_money += money * count
+            else:
+                counts[name] = counts.get(name, 0) + count
+        return drawn_money, _to_multiset(counts)
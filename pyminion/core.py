@@ -1,30 +1,35 @@
-import logging
+from bisect import bisect_left, bisect_right
+from operator import itemgetter
 import random
 from collections import Counter
-from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple, Union
 
 if TYPE_CHECKING:
     from pyminion.game import Game
     from pyminion.player import Player
 
-from enum import Enum
+from enum import Flag
 from pyminion.exceptions import EmptyPile, InsufficientActions, PileNotFound
+from pyminion.hashing import MASK, UNORDERED_FACTOR, get_card_key, get_position_factor
+from pyminion.log import logger
 
+if TYPE_CHECKING:
+    from pyminion.undo import UndoLog
 
-logger = logging.getLogger()
 
 
-class CardType(Enum):
+class CardType(Flag):
     """
-    Enum class for all card types that are currently used in the implemented expansions
+    Enum class for all card types that are currently used in the implemented expansions.
+    Types are bit flags so a card's types can be combined into a single mask.
 
     """
     Treasure = 1
     Victory = 2
-    Curse = 3
-    Action = 4
-    Attack = 5
-    Reaction = 6
+    Curse = 4
+    Action = 8
+    Attack = 16
+    Reaction = 32
 
 
 class Card:
@@ -32,16 +37,67 @@ class Card:
     """
     Base class representing a dominion card
 
+    Card instances are shared by all games and must not hold any game state.
+
     """
 
+    # money is declared here rather than on Treasure and Action so that a
+    # card can derive from both
+    __slots__ = (
+        "name", "_cost", "_type", "type_mask", "money", "hash_key",
+        "is_treasure", "is_victory", "is_curse", "is_action", "is_attack", "is_reaction",
+    )
+
     def __init__(self, name: str, cost: int, type: Tuple[CardType, ...]):
         self.name = name
+        self.hash_key = get_card_key(name)
         self._cost = cost
         self.type = type
 
+    @property
+    def type(self) -> Tuple[CardType, ...]:
+        return self._type
+
+    @type.setter
+    def type(self, type: Union[CardType, Tuple[CardType, ...]]) -> None:
+        """
+        Set the card's types and precompute its type mask and type predicates.
+
+        """
+        if isinstance(type, CardType):
+            type = tuple(t for t in CardType if t in type)
+        else:
+            type = tuple(type)
+
+        type_mask = CardType(0)
+        for t in type:
+            type_mask |= t
+
+        self._type = type
+        self.type_mask = type_mask
+        self.is_treasure = bool(type_mask & CardType.Treasure)
+        self.is_victory = bool(type_mask & CardType.Victory)
+        self.is_curse = bool(type_mask & CardType.Curse)
+        self.is_action = bool(type_mask & CardType.Action)
+        self.is_attack = bool(type_mask & CardType.Attack)
+        self.is_reaction = bool(type_mask & CardType.Reaction)
+
     def __repr__(self):
         return f"{self.name}"
 
+    def __reduce_ex__(self, protocol):
+        # cards are shared instances compared by identity, so known cards are
+        # pickled by name and unpickle to the instance of the loading process
+        from pyminion.spec import get_card
+
+        try:
+            known = get_card(self.name)
+        except KeyError:
+            known = None
+        if known is self:
+            return (get_card, (self.name,))
+        return super().__reduce_ex__(protocol)
+
     def get_cost(self, player: "Player", game: "Game") -> int:
         cost = max(0, self._cost - game.card_cost_reduction)
         return cost
@@ -54,6 +110,13 @@ class Card:
 
 
 class ScoreCard(Card):
+    __slots__ = ()
+
+    # names of the cards whose counts the score of this card depends on.
+    # ALL_CARDS means it depends on the total number of cards the player has
+    ALL_CARDS = "*"
+    score_dependencies: Tuple[str, ...] = ()
+
     def __init__(self, name: str, cost: int, type: Tuple[CardType, ...]):
         super().__init__(name, cost, type)
 
@@ -64,8 +127,19 @@ class ScoreCard(Card):
         """
         raise NotImplementedError(f"Score method must be implemented for {self.name}")
 
+    def score_from_counts(self, player: "Player", counts: Mapping[str, int], total_count: int) -> int:
+        """
+        Score of one copy of this card given how many of each card the player
+        has. Used by the scoreboard. Cards whose score depends on the player's
+        cards must list them in score_dependencies and override this method.
+
+        """
+        return self.score(player)
+
 
 class Victory(ScoreCard):
+    __slots__ = ()
+
     def __init__(self, name: str, cost: int, type: Tuple[CardType, ...]):
         super().__init__(name, cost, type)
 
@@ -80,19 +154,38 @@ class Victory(ScoreCard):
 
 
 class Treasure(Card):
+    __slots__ = ()
+
     def __init__(self, name: str, cost: int, type: Tuple[CardType, ...], money: int):
         super().__init__(name, cost, type)
         self.money = money
 
     def play(self, player: "Player", game: "Game") -> None:
         """
-        Specific play method unique to each treasure card
+        Move the treasure from the player's hand to the playmat and add its
+        money. Treasures with additional effects override this method.
 
         """
-        raise NotImplementedError(f"Play method must be implemented for {self.name}")
+        player.playmat.add(self)
+        player.hand.remove(self)
+        player.state.money += self.money
 
 
 class Action(Card):
+    __slots__ = ("actions", "draw", "buys")
+
+    # True for cards whose play only applies the draw, actions, money and
+    # buys fields. Set automatically for each subclass.
+    vanilla_play = True
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.vanilla_play = (
+            cls.play is Action.play
+            and cls.generic_play is Action.generic_play
+            and cls.multi_play is Action.multi_play
+        )
+
     def __init__(
         self,
         name: str,
@@ -114,7 +207,7 @@ class Action(Card):
         Specific play method unique to each action card
 
         """
-        logger.info(f"{player} plays {self}")
+        logger.info("%s plays %s", player, self)
 
         if generic_play:
             self.generic_play(player)
@@ -159,14 +252,29 @@ class AbstractDeck:
     """
     Base class representing a generic list of dominion cards
 
+    If undo_log is set, the cards are saved to it before they change so the
+    change can be undone. Once the hash of the deck has been asked for, it is
+    kept up to date as cards are added and removed. Code that changes a deck
+    must go through its methods rather than changing the card list directly.
+    Replacing the whole card list is allowed, the hash is then computed again.
+
     """
 
+    __slots__ = ("cards", "on_add", "on_remove", "undo_log", "_undo_epoch", "_hash", "_hashed_cards")
+
     def __init__(
             self,
             cards: Optional[List[Card]] = None,
             on_add: Optional[Callable[[Card], None]] = None,
             on_remove: Optional[Callable[[Card], None]] = None,
     ):
+        self.undo_log: Optional["UndoLog"] = None
+        self._undo_epoch = -1
+
+        # sum of the hash keys of the cards, None until the hash is first asked for,
+        # and the card list it was computed for
+        self._hash: Optional[int] = None
+        self._hashed_cards: Optional[List[Card]] = None
         if cards:
             self.cards = cards
         else:
@@ -180,64 +288,383 @@ class AbstractDeck:
     def __len__(self):
         return len(self.cards)
 
+    def snapshot(self) -> Any:
+        """
+        Capture the cards so they can be restored later.
+
+        """
+        return self.cards[:], self._get_tracked_hash()
+
+    def restore(self, snapshot: Any) -> None:
+        """
+        Restore the cards captured by snapshot. The deck takes ownership of
+        the snapshot.
+
+        """
+        self.cards, self._hash = snapshot
+        self._hashed_cards = self.cards
+
+    def get_hash(self) -> int:
+        """
+        Get a 64-bit hash of the cards in the deck, regardless of their order.
+
+        The hash is the sum of the cards' hash keys, so the hash of several
+        decks together is the sum of their hashes.
+
+        """
+        if self._hash is None or self.cards is not self._hashed_cards:
+            self._hash = sum(card.hash_key for card in self.cards) & MASK
+            self._hashed_cards = self.cards
+        return self._hash
+
+    def _get_tracked_hash(self) -> Optional[int]:
+        """
+        Get the running hash, or None if it is not kept or the card list was
+        replaced since it was computed.
+
+        """
+        if self.cards is not self._hashed_cards:
+            return None
+        return self._hash
+
+    def _reordered(self) -> None:
+        """
+        Called when cards were added or removed other than at the end of the
+        card list.
+
+        """
+        pass
+
     def add(self, card: Card) -> None:
+        if self.undo_log is not None:
+            self.undo_log.save(self)
         self.cards.append(card)
+        if self._hash is not None:
+            self._hash = (self._hash + card.hash_key) & MASK
         if self.on_add is not None:
             self.on_add(card)
 
     def remove(self, card: Card) -> Card:
+        if self.undo_log is not None:
+            self.undo_log.save(self)
         self.cards.remove(card)
+        if self._hash is not None:
+            self._hash = (self._hash - card.hash_key) & MASK
         if self.on_remove is not None:
             self.on_remove(card)
         return card
 
-    def move_to(self, destination: "AbstractDeck") -> None:
-        if destination.on_add is None and self.on_remove is None:
-            destination.cards += self.cards
-            self.cards = []
-        else:
-            cards = self.cards[:] # copy cards that are being moved
-            destination.cards += self.cards
-            self.cards = []
+    def pop(self) -> Card:
+        """
+        Remove the card at the end of the card list.
+
+        """
+        if self.undo_log is not None:
+            self.undo_log.save(self)
+        card = self.cards.pop()
+        if self._hash is not None:
+            self._hash = (self._hash - card.hash_key) & MASK
+        self._reordered()
+        if self.on_remove is not None:
+            self.on_remove(card)
+        return card
+
+    def insert(self, index: int, card: Card) -> None:
+        """
+        Add a card at a position in the card list.
+
+        """
+        if self.undo_log is not None:
+            self.undo_log.save(self)
+        self.cards.insert(index, card)
+        if self._hash is not None:
+            self._hash = (self._hash + card.hash_key) & MASK
+        self._reordered()
+        if self.on_add is not None:
+            self.on_add(card)
+
+    def clear(self) -> None:
+        """
+        Remove all cards without firing callbacks, reusing the card list.
+
+        """
+        if self.undo_log is not None:
+            self.undo_log.save(self)
+        self.cards.clear()
+        if self._hash is not None:
+            self._hash = 0
+        self._reordered()
+
+    def add_cards(self, cards: List[Card]) -> None:
+        """
+        Add several cards at once.
+
+        """
+        if self.undo_log is not None:
+            self.undo_log.save(self)
+        self.cards += cards
+        if self._hash is not None:
+            self._hash = (self._hash + sum(card.hash_key for card in cards)) & MASK
+        self._reordered()
+        if self.on_add is not None:
+            for card in cards:
+                self.on_add(card)
+
+    def remove_cards(self, cards: List[Card]) -> None:
+        """
+        Remove several cards in a single pass over the deck.
 
-            if destination.on_add is not None:
-                for card in cards:
-                    destination.on_add(card)
+        """
+        if self.undo_log is not None:
+            self.undo_log.save(self)
+        to_remove = Counter(cards)
+        kept: List[Card] = []
+        for card in self.cards:
+            if to_remove[card] > 0:
+                to_remove[card] -= 1
+            else:
+                kept.append(card)
+        if len(self.cards) - len(kept) != len(cards):
+            raise ValueError(f"Cannot remove {cards}, not all cards are present")
+
+        tracked_hash = self._get_tracked_hash()
+        self.cards = kept
+        if tracked_hash is not None:
+            self._hash = (tracked_hash - sum(card.hash_key for card in cards)) & MASK
+            self._hashed_cards = kept
+        self._reordered()
+        if self.on_remove is not None:
+            for card in cards:
+                self.on_remove(card)
 
-            if self.on_remove is not None:
-                for card in cards:
-                    self.on_remove(card)
+    def move_to(self, destination: "AbstractDeck") -> None:
+        if self.undo_log is not None:
+            self.undo_log.save(self)
+        if destination.undo_log is not None:
+            destination.undo_log.save(destination)
+        cards = self.cards
+        destination.cards += cards
+        if destination._hash is not None:
+            destination._hash = (destination._hash + self.get_hash()) & MASK
+        destination._reordered()
+        tracked = self._get_tracked_hash() is not None
+        self.cards = []
+        self._hash = 0 if tracked else None
+        self._hashed_cards = self.cards
+        self._reordered()
+
+        if destination.on_add is not None:
+            for card in cards:
+                destination.on_add(card)
+
+        if self.on_remove is not None:
+            for card in cards:
+                self.on_remove(card)
 
 
 class Deck(AbstractDeck):
+    """
+    A player's draw pile. The top of the deck is the end of the card list.
+
+    With lazy_shuffle set, shuffling does not reorder the cards. Instead each
+    draw takes a uniformly random card from the not yet shuffled cards (a
+    partial Fisher-Yates shuffle), which gives the same distribution as a
+    full shuffle. Accessing the cards list finishes the shuffle first, so
+    anything that inspects or reorders the deck sees a properly shuffled deck.
+
+    Shuffles use rng, which defaults to the random module. Games give each
+    deck the game's own random number generator.
+
+    Besides the hash of its cards, a deck keeps a hash of their order once
+    it has been asked for. Cards that are not yet shuffled count as being in
+    no particular order.
+
+    """
+
+    __slots__ = ("on_shuffle", "lazy_shuffle", "rng", "_cards", "_unshuffled", "_order_hash")
+
     def __init__(
             self,
             cards: Optional[List[Card]] = None,
             on_add: Optional[Callable[[Card], None]] = None,
             on_remove: Optional[Callable[[Card], None]] = None,
             on_shuffle: Optional[Callable[[], None]] = None,
+            lazy_shuffle: bool = False,
+            rng: Optional[random.Random] = None,
     ):
         super().__init__(cards, on_add, on_remove)
         self.on_shuffle = on_shuffle
+        self.lazy_shuffle = lazy_shuffle
+        self.rng = random if rng is None else rng
+
+    def __repr__(self):
+        return str(DeckCounter(self._cards))
+
+    def __len__(self):
+        return len(self._cards)
+
+    def snapshot(self) -> Any:
+        return self._cards[:], self._unshuffled, self._hash, self._order_hash
+
+    def restore(self, snapshot: Any) -> None:
+        self._cards, self._unshuffled, self._hash, self._order_hash = snapshot
+
+    def get_hash(self) -> int:
+        if self._hash is None:
+            self._hash = sum(card.hash_key for card in self._cards) & MASK
+        return self._hash
+
+    def _get_tracked_hash(self) -> Optional[int]:
+        # replacing the card list resets the hash, so it is never stale
+        return self._hash
+
+    def get_order_hash(self) -> int:
+        """
+        Get a 64-bit hash of the cards in the deck and their order.
+
+        """
+        if self._order_hash is None:
+            order_hash = 0
+            for index, card in enumerate(self._cards):
+                order_hash += card.hash_key * self._get_position_factor(index)
+            self._order_hash = order_hash & MASK
+        return self._order_hash
+
+    def _get_position_factor(self, index: int) -> int:
+        if index < self._unshuffled:
+            return UNORDERED_FACTOR
+        return get_position_factor(index)
+
+    def _reordered(self) -> None:
+        self._order_hash = None
+
+    @property
+    def cards(self) -> List[Card]:
+        # the first _unshuffled cards are in no particular order yet
+        if self._unshuffled > 0:
+            if self.undo_log is not None:
+                self.undo_log.save(self)
+            unshuffled = self._cards[:self._unshuffled]
+            self.rng.shuffle(unshuffled)
+            self._cards[:self._unshuffled] = unshuffled
+            self._unshuffled = 0
+            self._order_hash = None
+        return self._cards
+
+    @cards.setter
+    def cards(self, cards: List[Card]) -> None:
+        # not saved to the undo log, methods replacing the list save the deck first
+        self._cards = cards
+        self._unshuffled = 0
+        self._hash = None
+        self._order_hash = None
+
+    def clear(self) -> None:
+        if self.undo_log is not None:
+            self.undo_log.save(self)
+        self._cards.clear()
+        self._unshuffled = 0
+        if self._hash is not None:
+            self._hash = 0
+        if self._order_hash is not None:
+            self._order_hash = 0
+
+    def get_cards_unordered(self) -> List[Card]:
+        """
+        Get the cards in the deck without finishing a pending lazy shuffle.
+        Only use this when the order of the cards does not matter.
+
+        """
+        return self._cards
+
+    def add(self, card: Card) -> None:
+        # cards added to the top are above any unshuffled cards
+        if self.undo_log is not None:
+            self.undo_log.save(self)
+        if self._order_hash is not None:
+            self._order_hash = (
+                self._order_hash + card.hash_key * get_position_factor(len(self._cards))
+            ) & MASK
+        self._cards.append(card)
+        if self._hash is not None:
+            self._hash = (self._hash + card.hash_key) & MASK
+        if self.on_add is not None:
+            self.on_add(card)
+
+    def remove(self, card: Card) -> Card:
+        if self.undo_log is not None:
+            self.undo_log.save(self)
+        index = self._cards.index(card)
+        if self._order_hash is not None:
+            if index == len(self._cards) - 1:
+                self._order_hash = (
+                    self._order_hash - card.hash_key * self._get_position_factor(index)
+                ) & MASK
+            else:
+                self._order_hash = None
+        del self._cards[index]
+        if index < self._unshuffled:
+            self._unshuffled -= 1
+        if self._hash is not None:
+            self._hash = (self._hash - card.hash_key) & MASK
+        if self.on_remove is not None:
+            self.on_remove(card)
+        return card
 
     def draw(self) -> Card:
-        drawn_card = self.cards.pop()
+        if self.undo_log is not None:
+            self.undo_log.save(self)
+        cards = self._cards
+        if self._order_hash is not None:
+            factor = self._get_position_factor(len(cards) - 1)
+        if self._unshuffled > 0 and len(cards) == self._unshuffled:
+            # pick the top card at random from the unshuffled cards
+            last = self._unshuffled - 1
+            index = self.rng.randrange(self._unshuffled)
+            cards[index], cards[last] = cards[last], cards[index]
+            self._unshuffled = last
+        drawn_card = cards.pop()
+        if self._hash is not None:
+            self._hash = (self._hash - drawn_card.hash_key) & MASK
+        if self._order_hash is not None:
+            self._order_hash = (self._order_hash - drawn_card.hash_key * factor) & MASK
         if self.on_remove is not None:
             self.on_remove(drawn_card)
         return drawn_card
 
     def shuffle(self) -> None:
-        random.shuffle(self.cards)
+        if self.undo_log is not None:
+            self.undo_log.save(self)
+        if self.lazy_shuffle:
+            self._unshuffled = len(self._cards)
+            self._order_hash = None if self._hash is None else self._hash * UNORDERED_FACTOR & MASK
+        else:
+            self.rng.shuffle(self.cards)
+            self._order_hash = None
         if self.on_shuffle is not None:
             self.on_shuffle()
 
 
 class DiscardPile(AbstractDeck):
+    __slots__ = ()
+
     def __init__(self, cards: Optional[List[Card]] = None):
         super().__init__(cards)
 
 
 class Hand(AbstractDeck):
+    """
+    A player's hand. Keeps a count of the reaction cards it holds so attacks
+    only need to consult players that can react.
+
+    The counts are kept by the hand's methods, so the cards list must not be
+    changed in place, for example by assigning to an index of it. Replacing
+    the whole list is allowed and the counts are rebuilt.
+
+    """
+
+    __slots__ = ("_reactions", "_counted_cards", "_counted_len")
+
     def __init__(
             self,
             cards: Optional[List[Card]] = None,
@@ -245,9 +672,78 @@ class Hand(AbstractDeck):
             on_remove: Optional[Callable[[Card], None]] = None,
     ):
         super().__init__(cards, on_add, on_remove)
+        self._reactions: Dict[str, int] = {}
+        self._counted_cards: Optional[List[Card]] = None
+        self._counted_len = 0
+
+    def restore(self, snapshot: Any) -> None:
+        super().restore(snapshot)
+        # rebuild the reaction counts on the next query
+        self._counted_cards = None
+
+    def add(self, card: Card) -> None:
+        if self.undo_log is not None:
+            self.undo_log.save(self)
+        self.cards.append(card)
+        if self._hash is not None:
+            self._hash = (self._hash + card.hash_key) & MASK
+        self._counted_len += 1
+        if card.is_reaction:
+            self._reactions[card.name] = self._reactions.get(card.name, 0) + 1
+        if self.on_add is not None:
+            self.on_add(card)
+
+    def remove(self, card: Card) -> Card:
+        if self.undo_log is not None:
+            self.undo_log.save(self)
+        self.cards.remove(card)
+        if self._hash is not None:
+            self._hash = (self._hash - card.hash_key) & MASK
+        self._counted_len -= 1
+        if card.is_reaction:
+            count = self._reactions.get(card.name, 0) - 1
+            if count > 0:
+                self._reactions[card.name] = count
+            else:
+                self._reactions.pop(card.name, None)
+        if self.on_remove is not None:
+            self.on_remove(card)
+        return card
+
+    def clear(self) -> None:
+        if self.undo_log is not None:
+            self.undo_log.save(self)
+        self.cards.clear()
+        if self._hash is not None:
+            self._hash = 0
+        self._reactions = {}
+        self._counted_cards = self.cards
+        self._counted_len = 0
+
+    def get_reactions(self) -> Dict[str, int]:
+        """
+        Get the number of each reaction card in hand, keyed by card name.
+
+        Counts are kept up to date by add and remove. If the card list was
+        replaced or resized directly, the counts are rebuilt, but changes to
+        the list that keep its length are not noticed.
+
+        """
+        cards = self.cards
+        if cards is not self._counted_cards or len(cards) != self._counted_len:
+            reactions: Dict[str, int] = {}
+            for card in cards:
+                if card.is_reaction:
+                    reactions[card.name] = reactions.get(card.name, 0) + 1
+            self._reactions = reactions
+            self._counted_cards = cards
+            self._counted_len = len(cards)
+        return self._reactions
 
 
 class Pile(AbstractDeck):
+    __slots__ = ("name",)
+
     def __init__(self, cards: List[Card]):
         super().__init__(cards)
         assert len(cards) > 0
@@ -270,11 +766,15 @@ class Pile(AbstractDeck):
 
 
 class Playmat(AbstractDeck):
+    __slots__ = ()
+
     def __init__(self, cards: Optional[List[Card]] = None):
         super().__init__(cards)
 
 
 class Trash(AbstractDeck):
+    __slots__ = ()
+
     def __init__(self, cards: Optional[List[Card]] = None):
         super().__init__(cards)
 
@@ -296,6 +796,18 @@ class Supply:
         self.kingdom_piles = kingdom_piles
         self.piles = basic_score_piles + basic_treasure_piles + kingdom_piles
 
+        self._piles_by_name: Dict[str, Pile] = {pile.name: pile for pile in self.piles}
+
+        # a card from each pile, used to price the pile after it has been emptied
+        self._pile_cards: List[Card] = [pile.cards[0] for pile in self.piles]
+
+        # piles sorted by their current cost, rebuilt when the game's cost version changes.
+        # piles whose cards override get_cost are priced on every query instead
+        self._cost_version = -1
+        self._costs: List[int] = []
+        self._cost_piles: List[Tuple[int, Pile]] = []
+        self._dynamic_cost_piles: List[Tuple[int, Pile]] = []
+
     def __repr__(self):
         return str(self.available_cards())
 
@@ -328,10 +840,10 @@ class Supply:
         Get a pile by name.
 
         """
-        for pile in self.piles:
-            if pile.name == pile_name:
-                return pile
-        raise PileNotFound(f"{pile_name} pile is not valid")
+        try:
+            return self._piles_by_name[pile_name]
+        except KeyError:
+            raise PileNotFound(f"{pile_name} pile is not valid") from None
 
     def gain_card(self, card: Card) -> Card:
         """
@@ -361,6 +873,58 @@ class Supply:
         cards = [pile.cards[0] for pile in self.piles if pile]
         return cards
 
+    def _update_cost_index(self, player: "Player", game: "Game") -> None:
+        if self._cost_version == game.cost_version:
+            return
+
+        priced: List[Tuple[int, int, Pile]] = []
+        dynamic: List[Tuple[int, Pile]] = []
+        for index, (pile, card) in enumerate(zip(self.piles, self._pile_cards)):
+            if type(card).get_cost is Card.get_cost:
+                priced.append((card.get_cost(player, game), index, pile))
+            else:
+                dynamic.append((index, pile))
+        priced.sort(key=itemgetter(0, 1))
+
+        self._costs = [cost for cost, _, _ in priced]
+        self._cost_piles = [(index, pile) for _, index, pile in priced]
+        self._dynamic_cost_piles = dynamic
+        self._cost_version = game.cost_version
+
+    def _available_cards_in_cost_range(
+            self,
+            min_cost: int,
+            max_cost: int,
+            player: "Player",
+            game: "Game",
+    ) -> List[Card]:
+        self._update_cost_index(player, game)
+
+        start = bisect_left(self._costs, min_cost)
+        end = bisect_right(self._costs, max_cost)
+        found = [entry for entry in self._cost_piles[start:end] if entry[1].cards]
+        for index, pile in self._dynamic_cost_piles:
+            if pile.cards and min_cost <= pile.cards[0].get_cost(player, game) <= max_cost:
+                found.append((index, pile))
+
+        # return the cards in supply order, the same order as available_cards
+        found.sort(key=itemgetter(0))
+        return [pile.cards[0] for _, pile in found]
+
+    def available_cards_up_to_cost(self, max_cost: int, player: "Player", game: "Game") -> List[Card]:
+        """
+        Returns a card from each non-empty pile in the supply that costs at most max_cost.
+
+        """
+        return self._available_cards_in_cost_range(0, max_cost, player, game)
+
+    def available_cards_at_cost(self, cost: int, player: "Player", game: "Game") -> List[Card]:
+        """
+        Returns a card from each non-empty pile in the supply that costs exactly cost.
+
+        """
+        return self._available_cards_in_cost_range(cost, cost, player, game)
+
     def num_empty_piles(self) -> int:
         """
         Returns the number of empty piles in the supply.
@@ -387,7 +951,7 @@ def get_action_cards(cards: Iterable[Card]) -> Iterator[Action]:
 
     """
     for card in cards:
-        if CardType.Action in card.type:
+        if card.is_action:
             assert isinstance(card, Action)
             yield card
 
@@ -398,7 +962,7 @@ def get_treasure_cards(cards: Iterable[Card]) -> Iterator[Treasure]:
 
     """
     for card in cards:
-        if CardType.Treasure in card.type:
+        if card.is_treasure:
             assert isinstance(card, Treasure)
             yield card
 
@@ -409,7 +973,7 @@ def get_victory_cards(cards: Iterable[Card]) -> Iterator[Victory]:
 
     """
     for card in cards:
-        if CardType.Victory in card.type:
+        if card.is_victory:
             assert isinstance(card, Victory)
             yield card
 
@@ -420,6 +984,6 @@ def get_score_cards(cards: Iterable[Card]) -> Iterator[ScoreCard]:
 
     """
     for card in cards:
-        if CardType.Victory in card.type or CardType.Curse in card.type:
+        if card.is_victory or card.is_curse:
             assert isinstance(card, ScoreCard)
             yield card
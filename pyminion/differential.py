@@ -0,0 +1,283 @@
+import random
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional, Sequence
+
+from pyminion.bots.optimized_bot import OptimizedBot, OptimizedBotDecider
+from pyminion.core import Card
+from pyminion.decider import Decider
+from pyminion.effects import Effect
+from pyminion.game import Game
+from pyminion.player import Player
+from pyminion.spec import GameSpec, PlayerSpec, SeatPolicy
+
+# an engine mode, given as a function that turns an unstarted game into the
+# game to play with that engine
+Engine = Callable[[Game], Game]
+
+
+def reference_engine(game: Game) -> Game:
+    return game
+
+
+@dataclass
+class Event:
+    """
+    A decision made by a player, or the end of a game.
+
+    """
+
+    __slots__ = ("index", "turn", "player_id", "name", "args", "result", "state")
+
+    index: int
+    turn: int
+    player_id: str
+    name: str
+    args: str
+    result: str
+    state: str
+
+    def __repr__(self):
+        return (
+            f"[{self.index}] turn {self.turn} {self.player_id} {self.name}({self.args}) "
+            f"-> {self.result} | {self.state}"
+        )
+
+    def same_as(self, other: "Event") -> bool:
+        return (
+            self.turn == other.turn
+            and self.player_id == other.player_id
+            and self.name == other.name
+            and self.args == other.args
+            and self.result == other.result
+            and self.state == other.state
+        )
+
+
+def describe(value: Any) -> str:
+    """
+    Describe a decision argument or result by card names, so that events of
+    different engines can be compared.
+
+    """
+    if isinstance(value, Card):
+        return value.name
+    if isinstance(value, Effect):
+        return value.get_name()
+    if isinstance(value, Player):
+        return value.player_id
+    if isinstance(value, (list, tuple)):
+        return "[" + ", ".join(describe(v) for v in value) + "]"
+    return repr(value)
+
+
+def describe_state(player: Player, game: Game) -> str:
+    hand = sorted(card.name for card in player.hand.cards)
+    playmat = sorted(card.name for card in player.playmat.cards)
+    supply = sum(len(pile) for pile in game.supply.piles)
+    return (
+        f"hand={hand} playmat={playmat} deck={len(player.deck)} discard={len(player.discard_pile)} "
+        f"{player.state} trash={len(game.trash)} supply={supply}"
+    )
+
+
+class RecordingDecider:
+    """
+    Wraps a player's decider and records every decision it makes as an
+    event, together with the state of the player and game.
+
+    """
+
+    def __init__(self, decider: Decider, player: Player, game: Game, events: List[Event]):
+        self.decider = decider
+        self.player = player
+        self.game = game
+        self.events = events
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self.decider, name)
+        if not name.endswith("_decision"):
+            return attr
+
+        def record(*args: Any, **kwargs: Any) -> Any:
+            state = describe_state(self.player, self.game)
+            result = attr(*args, **kwargs)
+            described_args = ", ".join(
+                describe(value)
+                for value in list(args) + list(kwargs.values())
+                if not isinstance(value, (Player, Game))
+            )
+            self.events.append(
+                Event(
+                    index=len(self.events),
+                    turn=self.player.turns,
+                    player_id=self.player.player_id,
+                    name=name,
+                    args=described_args,
+                    result=describe(result),
+                    state=state,
+                )
+            )
+            return result
+
+        return record
+
+
+def record_game(game: Game) -> List[Event]:
+    """
+    Play an unstarted game and record the decisions of all players. The last
+    event is the outcome of the game, or the error the game raised.
+
+    """
+    events: List[Event] = []
+    for player in game.players:
+        player.decider = RecordingDecider(player.decider, player, game, events)
+
+    try:
+        result = game.play()
+        outcome = "; ".join(
+            f"{s.player.player_id} score={s.score} turns={s.turns} shuffles={s.shuffles}"
+            for s in result.player_summaries
+        )
+        name = "result"
+        winners = describe(result.winners)
+    except Exception as e:
+        outcome = f"{type(e).__name__}: {e}"
+        name = "error"
+        winners = ""
+
+    events.append(Event(len(events), -1, "", name, winners, outcome, ""))
+    return events
+
+
+@dataclass
+class Divergence:
+    """
+    The first event where an engine played differently from the reference.
+
+    """
+
+    __slots__ = ("spec", "game_index", "index", "reference", "other", "context")
+
+    spec: GameSpec
+    game_index: int
+    index: int
+    reference: Optional[Event]
+    other: Optional[Event]
+    context: List[Event]
+
+    def __repr__(self):
+        context = "\n".join(f"    {event}" for event in self.context)
+        return (
+            f"Engines diverge at event {self.index} of game {self.game_index} of {self.spec}\n"
+            f"  reference: {self.reference}\n"
+            f"  engine:    {self.other}\n"
+            f"  preceding events:\n{context}"
+        )
+
+
+def compare_engines(
+    spec: GameSpec,
+    engine: Engine,
+    reference: Engine = reference_engine,
+    game_index: int = 0,
+    context: int = 5,
+) -> Optional[Divergence]:
+    """
+    Play the game built from a spec with the reference engine and with
+    another engine, and compare the decisions and outcome move by move.
+
+    Returns the first divergence, or None if both engines played the same
+    game. The spec should be seeded, and its players must decide the same
+    way given the same situations.
+
+    """
+    reference_events = record_game(reference(spec.build(game_index)))
+    engine_events = record_game(engine(spec.build(game_index)))
+
+    for i in range(max(len(reference_events), len(engine_events))):
+        reference_event = reference_events[i] if i < len(reference_events) else None
+        engine_event = engine_events[i] if i < len(engine_events) else None
+        if reference_event is None or engine_event is None or not reference_event.same_as(engine_event):
+            return Divergence(
+                spec=spec,
+                game_index=game_index,
+                index=i,
+                reference=reference_event,
+                other=engine_event,
+                context=reference_events[max(0, i - context):i],
+            )
+    return None
+
+
+class FuzzBotDecider(OptimizedBotDecider):
+    """
+    Plays and buys random cards using its own seeded random number
+    generator, and makes all other decisions like the OptimizedBot. The
+    same seed gives the same decisions in the same situations.
+
+    """
+
+    def __init__(self, seed: int):
+        self.rng = random.Random(seed)
+
+    def action_phase_decision(
+        self,
+        valid_actions: List[Card],
+        player: Player,
+        game: Game,
+    ) -> Optional[Card]:
+        return self.rng.choice(valid_actions)
+
+    def buy_phase_decision(
+        self,
+        valid_cards: List[Card],
+        player: Player,
+        game: Game,
+    ) -> Optional[Card]:
+        if len(valid_cards) == 0 or self.rng.random() < 0.2:
+            return None
+        return self.rng.choice(valid_cards)
+
+
+class FuzzBot(OptimizedBot):
+    def __init__(
+        self,
+        seed: int = 0,
+        player_id: str = "fuzz_bot",
+    ):
+        super().__init__(decider=FuzzBotDecider(seed), player_id=player_id)
+
+
+def fuzz_engines(
+    engine: Engine,
+    games: int = 100,
+    seed: int = 0,
+    expansions: Sequence[str] = ("base", "intrigue"),
+    reference: Engine = reference_engine,
+    context: int = 5,
+) -> List[Divergence]:
+    """
+    Compare an engine with the reference on games between FuzzBots with
+    random kingdoms from the expansions and two to four players.
+
+    Returns the divergences found, which is empty if the engine played
+    every game the same as the reference.
+
+    """
+    rng = random.Random(seed)
+    divergences = []
+    for i in range(games):
+        num_players = rng.randint(2, 4)
+        spec = GameSpec(
+            players=[
+                PlayerSpec(FuzzBot, seed=rng.getrandbits(32), player_id=f"fuzz_{j}")
+                for j in range(num_players)
+            ],
+            expansions=expansions,
+            seat_policy=SeatPolicy.Random,
+            seed=rng.getrandbits(32),
+        )
+        divergence = compare_engines(spec, engine, reference, context=context)
+        if divergence is not None:
+            divergences.append(divergence)
+    return divergences
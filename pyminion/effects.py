@@ -1,5 +1,5 @@
 from enum import IntEnum, unique
-from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Sequence, Set, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Sequence, Set, Tuple, Union
 
 if TYPE_CHECKING:
     from pyminion.core import Card
@@ -21,29 +21,71 @@ class EffectAction(IntEnum):
     HandAddRemoveCards = 3
 
 
-class Effect:
-    _next_id = 0
+@unique
+class EffectLifetime(IntEnum):
+    """
+    How long a registered effect stays registered.
 
-    @staticmethod
-    def reset_id() -> None:
-        Effect._next_id = 0
+    Game effects stay until they are unregistered or the registry is reset.
+    Turn effects are unregistered together at the end of the current turn.
 
-    def __init__(self, name: str):
-        self._id = Effect._next_id
-        Effect._next_id += 1
+    """
+    Game = 0
+    Turn = 1
+
+
+def _always_triggered_player_game(player: "Player", game: "Game") -> bool:
+    return True
+
+
+def _always_triggered_player_card_game(player: "Player", card: "Card", game: "Game") -> bool:
+    return True
+
+
+class Effect:
+    __slots__ = ("_name", "_card_names")
+
+    def __init__(self, name: str, card_names: Optional[Iterable[str]] = None):
         self._name = name
+        self._card_names = None if card_names is None else frozenset(card_names)
 
     def get_id(self) -> int:
-        return self._id
+        """
+        Identifier that is unique among the effects that currently exist.
+
+        """
+        return id(self)
 
     def get_name(self) -> str:
         return self._name
 
+    def get_card_names(self) -> Optional[FrozenSet[str]]:
+        """
+        Names of the cards this effect can be triggered by. None means the
+        effect may be triggered by any card.
+
+        """
+        return self._card_names
+
     def get_action(self) -> EffectAction:
         raise NotImplementedError("Effect get_action is not implemented")
 
+    def get_state(self) -> Any:
+        """
+        Get the state of an effect that changes while it is registered, so
+        that undoing a game can restore it. Such effects must be registered
+        with a turn lifetime.
+
+        """
+        return None
+
+    def set_state(self, state: Any) -> None:
+        pass
+
 
 class PlayerGameEffect(Effect):
+    __slots__ = ()
+
     def __init__(self, name: str):
         super().__init__(name)
 
@@ -55,6 +97,8 @@ class PlayerGameEffect(Effect):
 
 
 class FuncPlayerGameEffect(PlayerGameEffect):
+    __slots__ = ("_action", "handler_func", "is_triggered_func")
+
     def __init__(
         self,
         name: str,
@@ -68,7 +112,7 @@ class FuncPlayerGameEffect(PlayerGameEffect):
 
         self.is_triggered_func: PlayerGameEffectTriggerHandler
         if is_triggered_func is None:
-            self.is_triggered_func = lambda p, g: True
+            self.is_triggered_func = _always_triggered_player_game
         else:
             self.is_triggered_func = is_triggered_func
 
@@ -83,8 +127,10 @@ class FuncPlayerGameEffect(PlayerGameEffect):
 
 
 class PlayerCardGameEffect(Effect):
-    def __init__(self, name: str):
-        super().__init__(name)
+    __slots__ = ()
+
+    def __init__(self, name: str, card_names: Optional[Iterable[str]] = None):
+        super().__init__(name, card_names)
 
     def is_triggered(self, player: "Player", card: "Card", game: "Game") -> bool:
         raise NotImplementedError("PlayerCardGameEffect is_triggered is not implemented")
@@ -94,20 +140,23 @@ class PlayerCardGameEffect(Effect):
 
 
 class FuncPlayerCardGameEffect(PlayerCardGameEffect):
+    __slots__ = ("_action", "handler_func", "is_triggered_func")
+
     def __init__(
         self,
         name: str,
         action: EffectAction,
         handler_func: PlayerCardGameEffectHandler,
         is_triggered_func: Optional[PlayerCardGameEffectTriggerHandler] = None,
+        card_names: Optional[Iterable[str]] = None,
     ):
-        super().__init__(name)
+        super().__init__(name, card_names)
         self._action = action
         self.handler_func = handler_func
 
         self.is_triggered_func: PlayerCardGameEffectTriggerHandler
         if is_triggered_func is None:
-            self.is_triggered_func = lambda p, c, g: True
+            self.is_triggered_func = _always_triggered_player_card_game
         else:
             self.is_triggered_func = is_triggered_func
 
@@ -122,8 +171,10 @@ class FuncPlayerCardGameEffect(PlayerCardGameEffect):
 
 
 class AttackEffect(Effect):
-    def __init__(self, name: str, action: EffectAction):
-        super().__init__(name)
+    __slots__ = ("_action",)
+
+    def __init__(self, name: str, action: EffectAction, card_names: Optional[Iterable[str]] = None):
+        super().__init__(name, card_names)
         self._action = action
 
     def get_action(self) -> EffectAction:
@@ -143,6 +194,7 @@ class EffectRegistry:
     """
     def __init__(self):
         self.attack_effects: List[AttackEffect] = []
+        self.reaction_effects: List[AttackEffect] = []
         self.buy_effects: List[PlayerCardGameEffect] = []
         self.discard_effects: List[PlayerCardGameEffect] = []
         self.gain_effects: List[PlayerCardGameEffect] = []
@@ -156,14 +208,37 @@ class EffectRegistry:
         self.turn_end_effects: List[PlayerGameEffect] = []
         self.cleanup_start_effects: List[PlayerGameEffect] = []
 
+        # effect lists consulted for each card event, in trigger order
+        self._card_event_effects: Dict[str, Tuple[List[PlayerCardGameEffect], ...]] = {
+            "buy": (self.gain_effects, self.buy_effects),
+            "discard": (self.discard_effects,),
+            "gain": (self.gain_effects,),
+            "hand_add": (self.hand_add_effects,),
+            "hand_remove": (self.hand_remove_effects,),
+            "play": (self.play_effects,),
+            "reveal": (self.reveal_effects,),
+            "trash": (self.trash_effects,),
+        }
+
+        # cache of the effects that may trigger for an (event, card name) pair.
+        # cleared whenever an effect is registered or unregistered
+        self._card_effects: Dict[Tuple[str, str], List[PlayerCardGameEffect]] = {}
+
+        # effects that expire at the end of the current turn, with the list they are registered in
+        self._turn_effects: List[Tuple[List[Effect], Effect]] = []
+
+        # called when the hand add or hand remove effect lists become empty or non-empty,
+        # so the game only observes hands while someone is listening
+        self.on_hand_listeners_changed: Optional[Callable[[], None]] = None
+        self._hand_listeners: Tuple[bool, bool] = (False, False)
+
     def reset(self) -> None:
         """
         Reset the registry for a new game.
 
         """
-        Effect.reset_id()
-
         self.attack_effects.clear()
+        self.reaction_effects.clear()
         self.buy_effects.clear()
         self.discard_effects.clear()
         self.gain_effects.clear()
@@ -176,6 +251,81 @@ class EffectRegistry:
         self.turn_start_effects.clear()
         self.turn_end_effects.clear()
         self.cleanup_start_effects.clear()
+        self._effects_changed()
+        self._turn_effects.clear()
+
+    def _get_effect_lists(self) -> List[list]:
+        return [
+            self.attack_effects,
+            self.reaction_effects,
+            self.buy_effects,
+            self.discard_effects,
+            self.gain_effects,
+            self.hand_add_effects,
+            self.hand_remove_effects,
+            self.play_effects,
+            self.reveal_effects,
+            self.shuffle_effects,
+            self.trash_effects,
+            self.turn_start_effects,
+            self.turn_end_effects,
+            self.cleanup_start_effects,
+        ]
+
+    def snapshot(self) -> List[list]:
+        """
+        Capture the registered effects, and which of them expire at the end
+        of the turn together with their state, so they can be restored later.
+
+        """
+        turn_effects = [(effect_list, effect, effect.get_state()) for effect_list, effect in self._turn_effects]
+        return [effect_list[:] for effect_list in self._get_effect_lists()] + [turn_effects]
+
+    def restore(self, snapshot: List[list]) -> None:
+        """
+        Restore the effects captured by snapshot, reusing the effect lists and
+        effect objects. Effects registered since the snapshot are dropped.
+
+        """
+        for effect_list, effects in zip(self._get_effect_lists(), snapshot):
+            effect_list[:] = effects
+        self._turn_effects[:] = [(effect_list, effect) for effect_list, effect, _ in snapshot[-1]]
+        for _, effect, state in snapshot[-1]:
+            effect.set_state(state)
+        self._effects_changed()
+
+    def _effects_changed(self) -> None:
+        self._card_effects.clear()
+
+        hand_listeners = (len(self.hand_add_effects) > 0, len(self.hand_remove_effects) > 0)
+        if hand_listeners != self._hand_listeners:
+            self._hand_listeners = hand_listeners
+            if self.on_hand_listeners_changed is not None:
+                self.on_hand_listeners_changed()
+
+    def has_hand_add_effects(self) -> bool:
+        return self._hand_listeners[0]
+
+    def has_hand_remove_effects(self) -> bool:
+        return self._hand_listeners[1]
+
+    def get_card_effects(self, event: str, card_name: str) -> List[PlayerCardGameEffect]:
+        """
+        Get the effects registered for a card event that may be triggered by
+        the named card, in the order they would be evaluated.
+
+        """
+        key = (event, card_name)
+        effects = self._card_effects.get(key)
+        if effects is None:
+            effects = [
+                effect
+                for effect_list in self._card_event_effects[event]
+                for effect in effect_list
+                if effect.get_card_names() is None or card_name in effect.get_card_names()  # type: ignore
+            ]
+            self._card_effects[key] = effects
+        return effects
 
     def _need_player_order(self, effects: Sequence[Effect]) -> bool:
         # if there is only one effect left, no need to prompt player
@@ -209,101 +359,118 @@ class EffectRegistry:
         if len(effects) == 0:
             return
 
-        handled_ids: Set[int] = set()
+        handled_effects: Set[Effect] = set()
 
         # one effect may change others, so after handling each effect we need to
         # reevaluate which other effects need to be handled
-        effect_ids = set(e.get_id() for e in effects if e.is_triggered(player, game))
-        while not effect_ids.issubset(handled_ids):
-            # handle all effects where order doesn't matter
-            handled_other = False
+        while True:
+            # handle effects where order doesn't matter first, in registration order
+            order_effects: List[PlayerGameEffect] = []
+            other_effect: Optional[PlayerGameEffect] = None
             for effect in effects:
-                if effect.get_id() not in handled_ids and effect.get_action() == EffectAction.Other and effect.is_triggered(player, game):
-                    effect.handler(player, game)
-                    handled_ids.add(effect.get_id())
-                    handled_other = True
+                if effect in handled_effects or not effect.is_triggered(player, game):
+                    continue
+                if effect.get_action() == EffectAction.Other:
+                    other_effect = effect
                     break
-
-            # if there were no "other" effects to handle, check if there were non-"other" effects
-            if not handled_other:
-                # build data structures of non-"other" effects that are triggered
-                order_effects: List[PlayerGameEffect] = [
-                    effect for effect in effects
-                    if effect.get_id() not in handled_ids and effect.get_action() != EffectAction.Other and effect.is_triggered(player, game)
-                ]
-
-                # if there were no more effects to handle we should have exited the loop by now
-                assert len(order_effects) > 0
-
-                if self._need_player_order(order_effects):
-                    # ask user to specify next effect to execute
-                    effect_index = player.decider.effects_order_decision(
-                        order_effects,
-                        player,
-                        game,
-                    )
-                else:
-                    effect_index = 0
-
+                order_effects.append(effect)
+
+            if other_effect is not None:
+                effect = other_effect
+            elif len(order_effects) == 0:
+                return
+            elif self._need_player_order(order_effects):
+                # ask user to specify next effect to execute
+                effect_index = player.decider.effects_order_decision(
+                    order_effects,
+                    player,
+                    game,
+                )
                 effect = order_effects[effect_index]
-                effect.handler(player, game)
-                handled_ids.add(effect.get_id())
+            else:
+                effect = order_effects[0]
 
-            # reevaluate which effects need to be handled
-            effect_ids = set(e.get_id() for e in effects if e.is_triggered(player, game))
+            effect.handler(player, game)
+            handled_effects.add(effect)
 
     def _handle_player_card_game_effects(
             self,
-            effects: List[PlayerCardGameEffect],
+            event: str,
             player: "Player",
             card: "Card",
             game: "Game",
     ) -> None:
+        effects = self.get_card_effects(event, card.name)
         if len(effects) == 0:
             return
 
-        handled_ids: Set[int] = set()
+        handled_effects: Set[Effect] = set()
 
         # one effect may change others, so after handling each effect we need to
         # reevaluate which other effects need to be handled
-        effect_ids = set(e.get_id() for e in effects if e.is_triggered(player, card, game))
-        while not effect_ids.issubset(handled_ids):
-            # handle all effects where order doesn't matter
-            handled_other = False
+        while True:
+            # handle effects where order doesn't matter first, in registration order
+            order_effects: List[PlayerCardGameEffect] = []
+            other_effect: Optional[PlayerCardGameEffect] = None
             for effect in effects:
-                if effect.get_id() not in handled_ids and effect.get_action() == EffectAction.Other and effect.is_triggered(player, card, game):
-                    effect.handler(player, card, game)
-                    handled_ids.add(effect.get_id())
-                    handled_other = True
+                if effect in handled_effects or not effect.is_triggered(player, card, game):
+                    continue
+                if effect.get_action() == EffectAction.Other:
+                    other_effect = effect
                     break
+                order_effects.append(effect)
+
+            if other_effect is not None:
+                effect = other_effect
+            elif len(order_effects) == 0:
+                return
+            elif self._need_player_order(order_effects):
+                # ask user to specify next effect to execute
+                effect_index = player.decider.effects_order_decision(
+                    order_effects,
+                    player,
+                    game,
+                )
+                effect = order_effects[effect_index]
+            else:
+                effect = order_effects[0]
 
-            # if there were no "other" effects to handle, check if there were non-"other" effects
-            if not handled_other:
-                # build data structures of non-"other" effects that are triggered
-                order_effects: List[PlayerCardGameEffect] = [
-                    effect for effect in effects
-                    if effect.get_id() not in handled_ids and effect.get_action() != EffectAction.Other and effect.is_triggered(player, card, game)
-                ]
+            effect.handler(player, card, game)
+            handled_effects.add(effect)
 
-                # if there were no more effects to handle we should have exited the loop by now
-                assert len(order_effects) > 0
+            # handlers may register or unregister effects
+            effects = self.get_card_effects(event, card.name)
 
-                if self._need_player_order(order_effects):
-                    # ask user to specify next effect to execute
-                    effect_index = player.decider.effects_order_decision(
-                        order_effects,
-                        player,
-                        game,
-                    )
-                else:
-                    effect_index = 0
+    def _register_effect(
+            self,
+            effect: Effect,
+            effect_list: Union[List[PlayerGameEffect], List[PlayerCardGameEffect], List[AttackEffect]],
+            lifetime: EffectLifetime,
+    ) -> None:
+        effect_list.append(effect)  # type: ignore
+        self._effects_changed()
+        if lifetime == EffectLifetime.Turn:
+            self._turn_effects.append((effect_list, effect))  # type: ignore
 
-                effect = order_effects[effect_index]
-                effect.handler(player, card, game)
-                handled_ids.add(effect.get_id())
+    def expire_turn_effects(self) -> None:
+        """
+        Unregister all effects registered with a turn lifetime.
 
-            # reevaluate which effects need to be handled
-            effect_ids = set(e.get_id() for e in effects if e.is_triggered(player, card, game))
+        """
+        if len(self._turn_effects) == 0:
+            return
+
+        expired: Dict[int, Tuple[List[Effect], Set[int]]] = {}
+        for effect_list, effect in self._turn_effects:
+            if id(effect_list) not in expired:
+                expired[id(effect_list)] = (effect_list, set())
+            expired[id(effect_list)][1].add(id(effect))
+
+        for effect_list, effect_ids in expired.values():
+            effect_list[:] = [e for e in effect_list if id(e) not in effect_ids]
+
+        self._turn_effects.clear()
+        self._effects_changed()
 
     def _unregister_effects(
             self,
@@ -321,109 +488,120 @@ class EffectRegistry:
             else:
                 i += 1
 
+        if unregister_count > 0:
+            self._effects_changed()
+
+    def _get_attack_effects(self, defending_player: "Player") -> List[AttackEffect]:
+        # reactions are only consulted for cards the defending player holds
+        if len(self.reaction_effects) > 0:
+            reactions = defending_player.hand.get_reactions()
+            if reactions:
+                held_effects = [
+                    effect
+                    for effect in self.reaction_effects
+                    if any(name in reactions for name in effect.get_card_names())  # type: ignore
+                ]
+                if held_effects:
+                    return held_effects + self.attack_effects
+
+        return self.attack_effects
+
     def on_attack(self, attacking_player: "Player", defending_player: "Player", attack_card: "Card", game: "Game") -> bool:
         """
-        Trigger attacking effects.
+        Trigger attacking effects and the reactions of the defending player.
 
         """
-        if len(self.attack_effects) == 0:
+        effects = self._get_attack_effects(defending_player)
+        if len(effects) == 0:
             return True
 
         attacked = True
 
-        handled_ids: Set[int] = set()
+        handled_effects: Set[Effect] = set()
 
         # one effect may change others, so after handling each effect we need to
         # reevaluate which other effects need to be handled
-        effect_ids = set(e.get_id() for e in self.attack_effects if e.is_triggered(attacking_player, defending_player, attack_card, game))
-        while not effect_ids.issubset(handled_ids):
-            # handle all effects where order doesn't matter
-            handled_other = False
-            for effect in self.attack_effects:
-                if effect.get_id() not in handled_ids and effect.get_action() == EffectAction.Other and effect.is_triggered(attacking_player, defending_player, attack_card, game):
-                    attacked &= effect.handler(attacking_player, defending_player, attack_card, game)
-                    handled_ids.add(effect.get_id())
-                    handled_other = True
+        while True:
+            # handle effects where order doesn't matter first, in registration order
+            order_effects: List[AttackEffect] = []
+            other_effect: Optional[AttackEffect] = None
+            for effect in effects:
+                if effect in handled_effects or not effect.is_triggered(attacking_player, defending_player, attack_card, game):
+                    continue
+                if effect.get_action() == EffectAction.Other:
+                    other_effect = effect
                     break
-
-            # if there were no "other" effects to handle, check if there were non-"other" effects
-            if not handled_other:
-                # build data structures of non-"other" effects that are triggered
-                order_effects: List[AttackEffect] = [
-                    effect for effect in self.attack_effects
-                    if effect.get_id() not in handled_ids and effect.get_action() != EffectAction.Other and effect.is_triggered(attacking_player, defending_player, attack_card, game)
-                ]
-
-                # if there were no more effects to handle we should have exited the loop by now
-                assert len(order_effects) > 0
-
-                if self._need_player_order(order_effects):
-                    # ask user to specify next effect to execute
-                    effect_index = defending_player.decider.effects_order_decision(
-                        order_effects,
-                        defending_player,
-                        game,
-                    )
-                else:
-                    effect_index = 0
-
+                order_effects.append(effect)
+
+            if other_effect is not None:
+                effect = other_effect
+            elif len(order_effects) == 0:
+                return attacked
+            elif self._need_player_order(order_effects):
+                # ask user to specify next effect to execute
+                effect_index = defending_player.decider.effects_order_decision(
+                    order_effects,
+                    defending_player,
+                    game,
+                )
                 effect = order_effects[effect_index]
-                attacked &= effect.handler(attacking_player, defending_player, attack_card, game)
-                handled_ids.add(effect.get_id())
+            else:
+                effect = order_effects[0]
 
-            # reevaluate which effects need to be handled
-            effect_ids = set(e.get_id() for e in self.attack_effects if e.is_triggered(attacking_player, defending_player, attack_card, game))
+            attacked &= effect.handler(attacking_player, defending_player, attack_card, game)
+            handled_effects.add(effect)
 
-        return attacked
+            # reactions may change the cards in the defending player's hand
+            effects = self._get_attack_effects(defending_player)
 
     def on_buy(self, player: "Player", card: "Card", game: "Game") -> None:
         """
         Trigger buying effects.
 
         """
-        self._handle_player_card_game_effects(self.gain_effects + self.buy_effects, player, card, game)
+        self._handle_player_card_game_effects("buy", player, card, game)
 
     def on_discard(self, player: "Player", card: "Card", game: "Game") -> None:
         """
         Trigger discarding effects.
 
         """
-        self._handle_player_card_game_effects(self.discard_effects, player, card, game)
+        self._handle_player_card_game_effects("discard", player, card, game)
 
     def on_gain(self, player: "Player", card: "Card", game: "Game") -> None:
         """
         Trigger gaining effects.
 
         """
-        self._handle_player_card_game_effects(self.gain_effects, player, card, game)
+        self._handle_player_card_game_effects("gain", player, card, game)
 
     def on_hand_add(self, player: "Player", card: "Card", game: "Game") -> None:
         """
         Trigger hand adding effects.
 
         """
-        self._handle_player_card_game_effects(self.hand_add_effects, player, card, game)
+        self._handle_player_card_game_effects("hand_add", player, card, game)
 
     def on_hand_remove(self, player: "Player", card: "Card", game: "Game") -> None:
         """
         Trigger hand removing effects.
 
         """
-        self._handle_player_card_game_effects(self.hand_remove_effects, player, card, game)
+        self._handle_player_card_game_effects("hand_remove", player, card, game)
 
     def on_play(self, player: "Player", card: "Card", game: "Game") -> None:
         """
         Trigger playing effects.
 
         """
-        self._handle_player_card_game_effects(self.play_effects, player, card, game)
+        self._handle_player_card_game_effects("play", player, card, game)
 
     def on_reveal(self, player: "Player", card: "Card", game: "Game") -> None:
         """
         Trigger revealing effects.
 
         """
-        self._handle_player_card_game_effects(self.reveal_effects, player, card, game)
+        self._handle_player_card_game_effects("reveal", player, card, game)
 
     def on_shuffle(self, player: "Player", game: "Game") -> None:
         """
@@ -437,7 +615,7 @@ class EffectRegistry:
         Trigger trashing effects.
 
         """
-        self._handle_player_card_game_effects(self.trash_effects, player, card, game)
+        self._handle_player_card_game_effects("trash", player, card, game)
 
     def on_turn_start(self, player: "Player", game: "Game") -> None:
         """
@@ -448,10 +626,11 @@ class EffectRegistry:
 
     def on_turn_end(self, player: "Player", game: "Game") -> None:
         """
-        Trigger turn end effects.
+        Trigger turn end effects, then expire effects registered for the turn.
 
         """
         self._handle_player_game_effects(self.turn_end_effects, player, game)
+        self.expire_turn_effects()
 
     def on_cleanup_start(self, player: "Player", game: "Game") -> None:
         """
@@ -460,12 +639,12 @@ class EffectRegistry:
         """
         self._handle_player_game_effects(self.cleanup_start_effects, player, game)
 
-    def register_attack_effect(self, effect: AttackEffect) -> None:
+    def register_attack_effect(self, effect: AttackEffect, lifetime: EffectLifetime = EffectLifetime.Game) -> None:
         """
         Register an effect to be triggered on attacking.
 
         """
-        self.attack_effects.append(effect)
+        self._register_effect(effect, self.attack_effects, lifetime)
 
     def unregister_attack_effects(self, name: str, max_unregister: int = -1) -> None:
         """
@@ -474,12 +653,28 @@ class EffectRegistry:
         """
         self._unregister_effects(name, self.attack_effects, max_unregister)
 
-    def register_buy_effect(self, effect: PlayerCardGameEffect) -> None:
+    def register_reaction_effect(self, effect: AttackEffect, lifetime: EffectLifetime = EffectLifetime.Game) -> None:
+        """
+        Register an effect to be triggered on attacking while the defending
+        player has one of the effect's cards in hand.
+
+        """
+        assert effect.get_card_names() is not None
+        self._register_effect(effect, self.reaction_effects, lifetime)
+
+    def unregister_reaction_effects(self, name: str, max_unregister: int = -1) -> None:
+        """
+        Unregister a reaction effect from being triggered on attacking.
+
+        """
+        self._unregister_effects(name, self.reaction_effects, max_unregister)
+
+    def register_buy_effect(self, effect: PlayerCardGameEffect, lifetime: EffectLifetime = EffectLifetime.Game) -> None:
         """
         Register an effect to be triggered on buying.
 
         """
-        self.buy_effects.append(effect)
+        self._register_effect(effect, self.buy_effects, lifetime)
 
     def unregister_buy_effects(self, name: str, max_unregister: int = -1) -> None:
         """
@@ -488,12 +683,12 @@ class EffectRegistry:
         """
         self._unregister_effects(name, self.buy_effects, max_unregister)
 
-    def register_discard_effect(self, effect: PlayerCardGameEffect) -> None:
+    def register_discard_effect(self, effect: PlayerCardGameEffect, lifetime: EffectLifetime = EffectLifetime.Game) -> None:
         """
         Register an effect to be triggered on discarding.
 
         """
-        self.discard_effects.append(effect)
+        self._register_effect(effect, self.discard_effects, lifetime)
 
     def unregister_discard_effects(self, name: str, max_unregister: int = -1) -> None:
         """
@@ -502,12 +697,12 @@ class EffectRegistry:
         """
         self._unregister_effects(name, self.discard_effects, max_unregister)
 
-    def register_gain_effect(self, effect: PlayerCardGameEffect) -> None:
+    def register_gain_effect(self, effect: PlayerCardGameEffect, lifetime: EffectLifetime = EffectLifetime.Game) -> None:
         """
         Register an effect to be triggered on gaining.
 
         """
-        self.gain_effects.append(effect)
+        self._register_effect(effect, self.gain_effects, lifetime)
 
     def unregister_gain_effects(self, name: str, max_unregister: int = -1) -> None:
         """
@@ -516,12 +711,12 @@ class EffectRegistry:
         """
         self._unregister_effects(name, self.gain_effects, max_unregister)
 
-    def register_hand_add_effect(self, effect: PlayerCardGameEffect) -> None:
+    def register_hand_add_effect(self, effect: PlayerCardGameEffect, lifetime: EffectLifetime = EffectLifetime.Game) -> None:
         """
         Register an effect to be triggered on hand adding.
 
         """
-        self.hand_add_effects.append(effect)
+        self._register_effect(effect, self.hand_add_effects, lifetime)
 
     def unregister_hand_add_effects(self, name: str, max_unregister: int = -1) -> None:
         """
@@ -530,12 +725,12 @@ class EffectRegistry:
         """
         self._unregister_effects(name, self.hand_add_effects, max_unregister)
 
-    def register_hand_remove_effect(self, effect: PlayerCardGameEffect) -> None:
+    def register_hand_remove_effect(self, effect: PlayerCardGameEffect, lifetime: EffectLifetime = EffectLifetime.Game) -> None:
         """
         Register an effect to be triggered on hand removing.
 
         """
-        self.hand_remove_effects.append(effect)
+        self._register_effect(effect, self.hand_remove_effects, lifetime)
 
     def unregister_hand_remove_effects(self, name: str, max_unregister: int = -1) -> None:
         """
@@ -544,12 +739,12 @@ class EffectRegistry:
         """
         self._unregister_effects(name, self.hand_remove_effects, max_unregister)
 
-    def register_play_effect(self, effect: PlayerCardGameEffect) -> None:
+    def register_play_effect(self, effect: PlayerCardGameEffect, lifetime: EffectLifetime = EffectLifetime.Game) -> None:
         """
         Register an effect to be triggered on playing.
 
         """
-        self.play_effects.append(effect)
+        self._register_effect(effect, self.play_effects, lifetime)
 
     def unregister_play_effects(self, name: str, max_unregister: int = -1) -> None:
         """
@@ -558,12 +753,12 @@ class EffectRegistry:
         """
         self._unregister_effects(name, self.play_effects, max_unregister)
 
-    def register_reveal_effect(self, effect: PlayerCardGameEffect) -> None:
+    def register_reveal_effect(self, effect: PlayerCardGameEffect, lifetime: EffectLifetime = EffectLifetime.Game) -> None:
         """
         Register an effect to be triggered on revealing.
 
         """
-        self.reveal_effects.append(effect)
+        self._register_effect(effect, self.reveal_effects, lifetime)
 
     def unregister_reveal_effects(self, name: str, max_unregister: int = -1) -> None:
         """
@@ -572,12 +767,12 @@ class EffectRegistry:
         """
         self._unregister_effects(name, self.reveal_effects, max_unregister)
 
-    def register_shuffle_effect(self, effect: PlayerGameEffect) -> None:
+    def register_shuffle_effect(self, effect: PlayerGameEffect, lifetime: EffectLifetime = EffectLifetime.Game) -> None:
         """
         Register an effect to be triggered on shuffling.
 
         """
-        self.shuffle_effects.append(effect)
+        self._register_effect(effect, self.shuffle_effects, lifetime)
 
     def unregister_shuffle_effects(self, name: str, max_unregister: int = -1) -> None:
         """
@@ -586,12 +781,12 @@ class EffectRegistry:
         """
         self._unregister_effects(name, self.shuffle_effects, max_unregister)
 
-    def register_trash_effect(self, effect: PlayerCardGameEffect) -> None:
+    def register_trash_effect(self, effect: PlayerCardGameEffect, lifetime: EffectLifetime = EffectLifetime.Game) -> None:
         """
         Register an effect to be triggered on trashing.
 
         """
-        self.trash_effects.append(effect)
+        self._register_effect(effect, self.trash_effects, lifetime)
 
     def unregister_trash_effects(self, name: str, max_unregister: int = -1) -> None:
         """
@@ -600,12 +795,12 @@ class EffectRegistry:
         """
         self._unregister_effects(name, self.trash_effects, max_unregister)
 
-    def register_turn_start_effect(self, effect: PlayerGameEffect) -> None:
+    def register_turn_start_effect(self, effect: PlayerGameEffect, lifetime: EffectLifetime = EffectLifetime.Game) -> None:
         """
         Register an effect to be triggered on turn start.
 
         """
-        self.turn_start_effects.append(effect)
+        self._register_effect(effect, self.turn_start_effects, lifetime)
 
     def unregister_turn_start_effects(self, name: str, max_unregister: int = -1) -> None:
         """
@@ -614,12 +809,12 @@ class EffectRegistry:
         """
         self._unregister_effects(name, self.turn_start_effects, max_unregister)
 
-    def register_turn_end_effect(self, effect: PlayerGameEffect) -> None:
+    def register_turn_end_effect(self, effect: PlayerGameEffect, lifetime: EffectLifetime = EffectLifetime.Game) -> None:
         """
         Register an effect to be triggered on turn end.
 
         """
-        self.turn_end_effects.append(effect)
+        self._register_effect(effect, self.turn_end_effects, lifetime)
 
     def unregister_turn_end_effects(self, name: str, max_unregister: int = -1) -> None:
         """
@@ -628,12 +823,12 @@ class EffectRegistry:
         """
         self._unregister_effects(name, self.turn_end_effects, max_unregister)
 
-    def register_cleanup_start_effect(self, effect: PlayerGameEffect) -> None:
+    def register_cleanup_start_effect(self, effect: PlayerGameEffect, lifetime: EffectLifetime = EffectLifetime.Game) -> None:
         """
         Register an effect to be triggered on clean-up start.
 
         """
-        self.cleanup_start_effects.append(effect)
+        self._register_effect(effect, self.cleanup_start_effects, lifetime)
 
     def unregister_cleanup_start_effects(self, name: str, max_unregister: int = -1) -> None:
         """
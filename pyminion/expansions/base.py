@@ -1,18 +1,16 @@
-import logging
 import math
-from typing import TYPE_CHECKING, List, Tuple
+from typing import TYPE_CHECKING, List, Mapping, Tuple
 
 from pyminion.core import AbstractDeck, CardType, Action, Card, ScoreCard, Treasure, Victory
-from pyminion.effects import AttackEffect, EffectAction, FuncPlayerCardGameEffect, FuncPlayerGameEffect, PlayerCardGameEffect
+from pyminion.effects import AttackEffect, EffectAction, EffectLifetime, PlayerCardGameEffect
 from pyminion.exceptions import EmptyPile
 from pyminion.player import Player
+from pyminion.log import logger
 
 if TYPE_CHECKING:
     from pyminion.game import Game
 
 
-logger = logging.getLogger()
-
 
 class Copper(Treasure):
     def __init__(
@@ -28,11 +26,6 @@ class Copper(Treasure):
         num_players = len(game.players)
         return 60 - (7 * num_players)
 
-    def play(self, player: Player, game: "Game") -> None:
-        player.playmat.add(self)
-        player.hand.remove(self)
-        player.state.money += self.money
-
 
 class Silver(Treasure):
     def __init__(
@@ -47,11 +40,6 @@ class Silver(Treasure):
     def get_pile_starting_count(self, game: "Game") -> int:
         return 40
 
-    def play(self, player: Player, game: "Game") -> None:
-        player.playmat.add(self)
-        player.hand.remove(self)
-        player.state.money += self.money
-
 
 class Gold(Treasure):
     def __init__(
@@ -66,11 +54,6 @@ class Gold(Treasure):
     def get_pile_starting_count(self, game: "Game") -> int:
         return 30
 
-    def play(self, player: Player, game: "Game") -> None:
-        player.playmat.add(self)
-        player.hand.remove(self)
-        player.state.money += self.money
-
 
 class Estate(Victory):
     def __init__(
@@ -153,11 +136,16 @@ class Gardens(Victory):
     ):
         super().__init__(name, cost, type)
 
+    score_dependencies = (ScoreCard.ALL_CARDS,)
+
     def score(self, player: Player) -> int:
         total_count = len(player.get_all_cards())
         vp = math.floor(total_count / 10)
         return vp
 
+    def score_from_counts(self, player: Player, counts: Mapping[str, int], total_count: int) -> int:
+        return total_count // 10
+
 
 class Smithy(Action):
     """
@@ -367,9 +355,7 @@ class Workshop(Action):
         gain_cards = player.decider.gain_decision(
             prompt="Gain a card costing up to 4 money: ",
             card=self,
-            valid_cards=[
-                card for card in game.supply.available_cards() if card.get_cost(player, game) <= 4
-            ],
+            valid_cards=game.supply.available_cards_up_to_cost(4, player, game),
             player=player,
             game=game,
             min_num_gain=1,
@@ -478,7 +464,7 @@ class Vassal(Action):
 
         player.discard(game, discard_card, temp)
 
-        if CardType.Action not in discard_card.type:
+        if not discard_card.is_action:
             return
 
         decision = player.decider.binary_decision(
@@ -491,7 +477,7 @@ class Vassal(Action):
         if not decision:
             return
 
-        played_card = player.discard_pile.cards.pop()
+        played_card = player.discard_pile.pop()
         player.playmat.add(played_card)
         player.exact_play(card=player.playmat.cards[-1], game=game, generic_play=False)
 
@@ -521,9 +507,7 @@ class Artisan(Action):
         gain_cards = player.decider.gain_decision(
             prompt="Gain a card costing up to 5 money: ",
             card=self,
-            valid_cards=[
-                card for card in game.supply.available_cards() if card.get_cost(player, game) <= 5
-            ],
+            valid_cards=game.supply.available_cards_up_to_cost(5, player, game),
             player=player,
             game=game,
             min_num_gain=1,
@@ -676,12 +660,13 @@ class Moat(Action):
     """
 
     class MoatAttackEffect(AttackEffect):
-        def __init__(self, player: Player):
-            super().__init__(f"Moat: {player.player_id} block attack", EffectAction.Other)
-            self.player = player
+        __slots__ = ()
+
+        def __init__(self):
+            super().__init__("Moat: block attack", EffectAction.Other, card_names=(moat.name,))
 
         def is_triggered(self, attacking_player: Player, defending_player: Player, attack_card: Card, game: "Game") -> bool:
-            return self.player.player_id == defending_player.player_id
+            return True
 
         def handler(self, attacking_player: Player, defending_player: Player, attack_card: Card, game: "Game") -> bool:
             block = defending_player.decider.binary_decision(
@@ -707,28 +692,7 @@ class Moat(Action):
         super().__init__(name, cost, type, draw=draw)
 
     def set_up(self, game: "Game") -> None:
-        hand_add_effect = FuncPlayerCardGameEffect(
-            "Moat: Hand Add",
-            EffectAction.Other,
-            self.on_hand_add,
-            lambda p, c, g: c.name == self.name,
-        )
-        game.effect_registry.register_hand_add_effect(hand_add_effect)
-
-        hand_remove_effect = FuncPlayerCardGameEffect(
-            "Moat: Hand Remove",
-            EffectAction.Other,
-            self.on_hand_remove,
-            lambda p, c, g: c.name == self.name,
-        )
-        game.effect_registry.register_hand_remove_effect(hand_remove_effect)
-
-    def on_hand_add(self, player: Player, card: Card, game: "Game") -> None:
-        effect = Moat.MoatAttackEffect(player)
-        game.effect_registry.register_attack_effect(effect)
-
-    def on_hand_remove(self, player: Player, card: Card, game: "Game") -> None:
-        game.effect_registry.unregister_attack_effects(f"Moat: {player.player_id} block attack")
+        game.effect_registry.register_reaction_effect(Moat.MoatAttackEffect())
 
 
 class Merchant(Action):
@@ -742,20 +706,28 @@ class Merchant(Action):
     MONEY_EFFECT_NAME = "Merchant: +$1"
 
     class MoneyEffect(PlayerCardGameEffect):
+        __slots__ = ("first_play",)
+
         def __init__(self):
-            super().__init__(Merchant.MONEY_EFFECT_NAME)
+            super().__init__(Merchant.MONEY_EFFECT_NAME, card_names=(silver.name,))
             self.first_play = True
 
         def get_action(self) -> EffectAction:
             return EffectAction.Other
 
         def is_triggered(self, player: Player, card: Card, game: "Game") -> bool:
-            return card.name == "Silver" and self.first_play
+            return self.first_play
 
         def handler(self, player: Player, card: Card, game: "Game") -> None:
             player.state.money += 1
             self.first_play = False
 
+        def get_state(self) -> bool:
+            return self.first_play
+
+        def set_state(self, state: bool) -> None:
+            self.first_play = state
+
     def __init__(
         self,
         name: str = "Merchant",
@@ -773,13 +745,7 @@ class Merchant(Action):
         super().play(player, game, generic_play)
 
         money_effect = Merchant.MoneyEffect()
-        game.effect_registry.register_play_effect(money_effect)
-
-        reset_effect = FuncPlayerGameEffect("Merchant: reset", EffectAction.Other, self.remove_play_handlers)
-        game.effect_registry.register_turn_end_effect(reset_effect)
-
-    def remove_play_handlers(self, player: "Player", game: "Game") -> None:
-        game.effect_registry.unregister_play_effects(self.MONEY_EFFECT_NAME)
+        game.effect_registry.register_play_effect(money_effect, EffectLifetime.Turn)
 
 
 class Bandit(Action):
@@ -825,7 +791,7 @@ class Bandit(Action):
                         elif card.name == "Gold" and not trash_card:
                             trash_card = card
                         elif (
-                            CardType.Treasure in card.type
+                            card.is_treasure
                             and card.name != "Copper"
                             and not trash_card
                         ):
@@ -833,6 +799,7 @@ class Bandit(Action):
 
                     if trash_card:
                         game.trash.add(revealed_cards.remove(trash_card))
+                        game.scoreboard.remove_card(opponent, trash_card)
 
                     revealed_cards_copy = revealed_cards.cards[:]
                     for card in revealed_cards_copy:
@@ -873,7 +840,7 @@ class Bureaucrat(Action):
 
                 victory_cards = []
                 for card in opponent.hand.cards:
-                    if CardType.Victory in card.type:
+                    if card.is_victory:
                         victory_cards.append(card)
 
                 if not victory_cards:
@@ -916,7 +883,7 @@ class ThroneRoom(Action):
 
         super().play(player, game, generic_play)
 
-        action_cards = [card for card in player.hand.cards if CardType.Action in card.type]
+        action_cards = [card for card in player.hand.cards if card.is_action]
 
         if not action_cards:
             return
@@ -976,11 +943,7 @@ class Remodel(Action):
         gain_cards = player.decider.gain_decision(
             prompt=f"Gain a card costing up to {max_cost} money: ",
             card=self,
-            valid_cards=[
-                card
-                for card in game.supply.available_cards()
-                if card.get_cost(player, game) <= max_cost
-            ],
+            valid_cards=game.supply.available_cards_up_to_cost(max_cost, player, game),
             player=player,
             game=game,
             min_num_gain=1,
@@ -1014,7 +977,7 @@ class Mine(Action):
 
         super().play(player, game, generic_play)
 
-        treasures = [card for card in player.hand.cards if CardType.Treasure in card.type]
+        treasures = [card for card in player.hand.cards if card.is_treasure]
 
         if not treasures:
             return
@@ -1041,8 +1004,8 @@ class Mine(Action):
             card=self,
             valid_cards=[
                 card
-                for card in game.supply.available_cards()
-                if CardType.Treasure in card.type and card.get_cost(player, game) <= trash_card.get_cost(player, game) + 3
+                for card in game.supply.available_cards_up_to_cost(max_cost, player, game)
+                if card.is_treasure
             ],
             player=player,
             game=game,
@@ -1051,7 +1014,7 @@ class Mine(Action):
         )
         assert len(gain_cards) == 1
         gain_card = gain_cards[0]
-        assert CardType.Treasure in gain_card.type
+        assert gain_card.is_treasure
         assert gain_card.get_cost(player, game) <= max_cost
 
         player.trash(trash_card, game=game)
@@ -1216,7 +1179,7 @@ class Library(Action):
             player.draw(num_cards=1, destination=set_aside)
             drawn_card = set_aside.cards[-1]
 
-            if CardType.Action in drawn_card.type:
+            if drawn_card.is_action:
                 should_skip = player.decider.binary_decision(
                     prompt=f"You drew {drawn_card}, would you like to skip it? y/n: ",
                     card=self,
@@ -1,19 +1,17 @@
 from enum import IntEnum, unique
-import logging
-from typing import TYPE_CHECKING, Any, List
+from typing import TYPE_CHECKING, Any, List, Mapping
 
 from pyminion.core import AbstractDeck, Action, Card, CardType, Treasure, Victory, get_score_cards
 from pyminion.player import Player
-from pyminion.effects import AttackEffect, EffectAction, FuncPlayerCardGameEffect, FuncPlayerGameEffect
+from pyminion.effects import AttackEffect, EffectAction
 from pyminion.exceptions import EmptyPile
 from pyminion.expansions.base import curse, duchy, estate, gold, silver
+from pyminion.log import logger
 
 if TYPE_CHECKING:
     from pyminion.game import Game
 
 
-logger = logging.getLogger()
-
 
 class Baron(Action):
     """
@@ -223,12 +221,13 @@ class Diplomat(Action):
     """
 
     class DiplomatAttackEffect(AttackEffect):
-        def __init__(self, player: Player):
-            super().__init__(f"Diplomat: {player.player_id} attack reaction", EffectAction.HandAddRemoveCards)
-            self.player = player
+        __slots__ = ()
+
+        def __init__(self):
+            super().__init__("Diplomat: attack reaction", EffectAction.HandAddRemoveCards, card_names=(diplomat.name,))
 
         def is_triggered(self, attacking_player: Player, defending_player: Player, attack_card: Card, game: "Game") -> bool:
-            return self.player.player_id == defending_player.player_id and len(defending_player.hand) >= 5
+            return len(defending_player.hand) >= 5
 
         def handler(self, attacking_player: Player, defending_player: Player, attack_card: Card, game: "Game") -> bool:
             reveal = defending_player.decider.binary_decision(
@@ -274,28 +273,7 @@ class Diplomat(Action):
             player.state.actions += 2
 
     def set_up(self, game: "Game") -> None:
-        hand_add_effect = FuncPlayerCardGameEffect(
-            "Diplomat: Hand Add",
-            EffectAction.Other,
-            self.on_hand_add,
-            lambda p, c, g: c.name == self.name,
-        )
-        game.effect_registry.register_hand_add_effect(hand_add_effect)
-
-        hand_remove_effect = FuncPlayerCardGameEffect(
-            "Diplomat: Hand Remove",
-            EffectAction.Other,
-            self.on_hand_remove,
-            lambda p, c, g: c.name == self.name,
-        )
-        game.effect_registry.register_hand_remove_effect(hand_remove_effect)
-
-    def on_hand_add(self, player: Player, card: Card, game: "Game") -> None:
-        effect = Diplomat.DiplomatAttackEffect(player)
-        game.effect_registry.register_attack_effect(effect)
-
-    def on_hand_remove(self, player: Player, card: Card, game: "Game") -> None:
-        game.effect_registry.unregister_attack_effects(f"Diplomat: {player.player_id} attack reaction")
+        game.effect_registry.register_reaction_effect(Diplomat.DiplomatAttackEffect())
 
 
 class Duke(Victory):
@@ -307,6 +285,8 @@ class Duke(Victory):
     def __init__(self):
         super().__init__("Duke", 5, (CardType.Victory,))
 
+    score_dependencies = (duchy.name,)
+
     def score(self, player: Player) -> int:
         vp = 0
         for card in player.get_all_cards():
@@ -314,6 +294,9 @@ class Duke(Victory):
                 vp += 1
         return vp
 
+    def score_from_counts(self, player: Player, counts: Mapping[str, int], total_count: int) -> int:
+        return counts.get(duchy.name, 0)
+
 
 class Harem(Treasure, Victory):
     def __init__(self):
@@ -325,11 +308,6 @@ class Harem(Treasure, Victory):
             money=2,
         )
 
-    def play(self, player: Player, game: "Game") -> None:
-        player.playmat.add(self)
-        player.hand.remove(self)
-        player.state.money += self.money
-
     def score(self, player: Player) -> int:
         vp = 2
         return vp
@@ -358,9 +336,7 @@ class Ironworks(Action):
         gain_cards = player.decider.gain_decision(
             prompt="Gain a card costing up to 4 money: ",
             card=self,
-            valid_cards=[
-                card for card in game.supply.available_cards() if card.get_cost(player, game) <= 4
-            ],
+            valid_cards=game.supply.available_cards_up_to_cost(4, player, game),
             player=player,
             game=game,
             min_num_gain=1,
@@ -372,13 +348,13 @@ class Ironworks(Action):
 
         player.gain(card=gain_card, game=game)
 
-        if CardType.Action in gain_card.type:
+        if gain_card.is_action:
             player.state.actions += 1
 
-        if CardType.Treasure in gain_card.type:
+        if gain_card.is_treasure:
             player.state.money += 1
 
-        if CardType.Victory in gain_card.type:
+        if gain_card.is_victory:
             player.draw(1)
 
 
@@ -405,10 +381,10 @@ class Lurker(Action):
         super().play(player, game, generic_play)
 
         supply_action_cards = [
-            c for c in game.supply.available_cards() if CardType.Action in c.type
+            c for c in game.supply.available_cards() if c.is_action
         ]
         trash_action_cards = [
-            c for c in game.trash.cards if CardType.Action in c.type
+            c for c in game.trash.cards if c.is_action
         ]
 
         if len(supply_action_cards) == 0 and len(trash_action_cards) == 0:
@@ -513,6 +489,8 @@ class Masquerade(Action):
             next_idx = (idx + 1) % len(valid_players)
             next_player = valid_players[next_idx]
             next_player.hand.add(c)
+            game.scoreboard.remove_card(p, c)
+            game.scoreboard.add_card(next_player, c)
             logger.info(f"{p} passes {c} to {next_player}")
 
         if len(player.hand) == 0:
@@ -880,11 +858,7 @@ class Replace(Action):
         gain_cards = player.decider.gain_decision(
             prompt=f"Gain a card costing up to {max_cost} money: ",
             card=self,
-            valid_cards=[
-                card
-                for card in game.supply.available_cards()
-                if card.get_cost(player, game) <= max_cost
-            ],
+            valid_cards=game.supply.available_cards_up_to_cost(max_cost, player, game),
             player=player,
             game=game,
             min_num_gain=1,
@@ -896,12 +870,12 @@ class Replace(Action):
 
         player.trash(trash_card, game=game)
 
-        if CardType.Action in gain_card.type or CardType.Treasure in gain_card.type:
+        if gain_card.is_action or gain_card.is_treasure:
             player.gain(gain_card, game, destination=player.deck)
         else:
             player.gain(gain_card, game)
 
-        if CardType.Victory in gain_card.type:
+        if gain_card.is_victory:
             for opponent in game.players:
                 if opponent is not player and opponent.is_attacked(player, self, game):
                     # attempt to gain a curse. if curse pile is empty, proceed
@@ -955,7 +929,7 @@ class SecretPassage(Action):
             assert 0 <= index <= len_deck
 
         player.hand.remove(insert_card)
-        player.deck.cards.insert(index, insert_card)
+        player.deck.insert(index, insert_card)
 
 
 class ShantyTown(Action):
@@ -978,7 +952,7 @@ class ShantyTown(Action):
 
         player.reveal(player.hand.cards, game)
 
-        if not any(CardType.Action in c.type for c in player.hand.cards):
+        if not any(c.is_action for c in player.hand.cards):
             player.draw(2)
 
 
@@ -1073,11 +1047,7 @@ class Swindler(Action):
                 opponent.trash(trashed_card, game, source=revealed_cards)
                 trashed_cost = trashed_card.get_cost(player, game)
 
-                valid_cards = [
-                    c
-                    for c in game.supply.available_cards()
-                    if c.get_cost(player, game) == trashed_cost
-                ]
+                valid_cards = game.supply.available_cards_at_cost(trashed_cost, player, game)
                 if len(valid_cards) == 0:
                     continue
 
@@ -1245,11 +1215,7 @@ class Upgrade(Action):
         player.trash(trash_card, game=game)
 
         new_cost = trash_card.get_cost(player, game) + 1
-        valid_cards = [
-            card
-            for card in game.supply.available_cards()
-            if card.get_cost(player, game) == new_cost
-        ]
+        valid_cards = game.supply.available_cards_at_cost(new_cost, player, game)
 
         if len(valid_cards) == 0:
             return
@@ -0,0 +1,823 @@
+import random
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional
+
+from pyminion.core import AbstractDeck, Card, Deck, DeckCounter, DiscardPile, Hand, Pile, Playmat, Supply
+from pyminion.exceptions import EmptyPile, InvalidGameSetup
+from pyminion.game import Game
+from pyminion.hashing import MASK, UNORDERED_FACTOR, get_position_factor
+from pyminion.quiet import QuietGame
+
+if TYPE_CHECKING:
+    from pyminion.player import Player
+
+# type code of the arrays of card ids and pile counts
+ID_TYPE = "H"
+
+
+class CardTable(dict):
+    """
+    Numbers the cards of a game, so that zones can hold arrays of card ids
+    instead of lists of cards. Looking up a card gives its id.
+
+    A card is given the next id the first time it is looked up. Ids stand
+    for card objects, not card names, so a zone gives back the same objects
+    that were put into it.
+
+    """
+
+    __slots__ = ("cards", "hash_keys")
+
+    def __init__(self):
+        super().__init__()
+        self.cards: List[Card] = []
+        self.hash_keys: List[int] = []
+
+    def __missing__(self, card: Card) -> int:
+        card_id = len(self.cards)
+        self[card] = card_id
+        self.cards.append(card)
+        self.hash_keys.append(card.hash_key)
+        return card_id
+
+    def get_ids(self, cards: Iterable[Card]) -> array:
+        return array(ID_TYPE, map(self.__getitem__, cards))
+
+    def get_cards(self, ids: Iterable[int]) -> List[Card]:
+        return list(map(self.cards.__getitem__, ids))
+
+    def get_hash(self, ids: Iterable[int]) -> int:
+        return sum(map(self.hash_keys.__getitem__, ids)) & MASK
+
+
+def _remove_ids(ids: array, to_remove: array, cards: List[Card]) -> array:
+    """
+    Get a copy of ids without the first occurrences of the ids in to_remove,
+    as removing the cards one by one would leave them.
+
+    """
+    kept = ids[:]
+    try:
+        for card_id in to_remove:
+            kept.remove(card_id)
+    except ValueError:
+        raise ValueError(f"Cannot remove {cards}, not all cards are present") from None
+    return kept
+
+
+class _CardIdZone(AbstractDeck):
+    """
+    A zone that keeps its cards as an array of card ids.
+
+    The cards list is built from the ids the first time it is asked for.
+    From then on it is kept up to date along with the ids until the zone
+    replaces its list, as Game's zones do, so code holding the list sees
+    the same cards as with Game. The zone must be changed through its
+    methods or by replacing the whole list.
+
+    """
+
+    __slots__ = ()
+
+    table: CardTable
+    _ids: array
+    _view: Optional[List[Card]]
+
+    def __repr__(self):
+        return str(DeckCounter(self.cards))
+
+    def __len__(self):
+        return len(self._ids)
+
+    @property
+    def cards(self) -> List[Card]:
+        view = self._view
+        if view is None:
+            view = self._view = self.table.get_cards(self._ids)
+        return view
+
+    @cards.setter
+    def cards(self, cards: List[Card]) -> None:
+        self._ids = self.table.get_ids(cards)
+        self._view = None
+        self._hash = None
+
+    def get_ids(self) -> array:
+        """
+        Get the ids of the cards, in the order of the cards list.
+
+        """
+        return self._ids
+
+    def snapshot(self) -> Any:
+        return self._ids[:], self._hash
+
+    def restore(self, snapshot: Any) -> None:
+        self._ids, self._hash = snapshot
+        self._view = None
+
+    def get_hash(self) -> int:
+        if self._hash is None:
+            self._hash = self.table.get_hash(self._ids)
+        return self._hash
+
+    def _get_tracked_hash(self) -> Optional[int]:
+        return self._hash
+
+    def add(self, card: Card) -> None:
+        if self.undo_log is not None:
+            self.undo_log.save(self)
+        self._ids.append(self.table[card])
+        if self._view is not None:
+            self._view.append(card)
+        if self._hash is not None:
+            self._hash = (self._hash + card.hash_key) & MASK
+        if self.on_add is not None:
+            self.on_add(card)
+
+    def remove(self, card: Card) -> Card:
+        if self.undo_log is not None:
+            self.undo_log.save(self)
+        self._ids.remove(self.table[card])
+        if self._view is not None:
+            self._view.remove(card)
+        if self._hash is not None:
+            self._hash = (self._hash - card.hash_key) & MASK
+        if self.on_remove is not None:
+            self.on_remove(card)
+        return card
+
+    def pop(self) -> Card:
+        if self.undo_log is not None:
+            self.undo_log.save(self)
+        card = self.table.cards[self._ids.pop()]
+        if self._view is not None:
+            self._view.pop()
+        if self._hash is not None:
+            self._hash = (self._hash - card.hash_key) & MASK
+        self._reordered()
+        if self.on_remove is not None:
+            self.on_remove(card)
+        return card
+
+    def insert(self, index: int, card: Card) -> None:
+        if self.undo_log is not None:
+            self.undo_log.save(self)
+        self._ids.insert(index, self.table[card])
+        if self._view is not None:
+            self._view.insert(index, card)
+        if self._hash is not None:
+            self._hash = (self._hash + card.hash_key) & MASK
+        self._reordered()
+        if self.on_add is not None:
+            self.on_add(card)
+
+    def clear(self) -> None:
+        if self.undo_log is not None:
+            self.undo_log.save(self)
+        del self._ids[:]
+        if self._view is not None:
+            self._view.clear()
+        if self._hash is not None:
+            self._hash = 0
+        self._reordered()
+
+    def add_cards(self, cards: List[Card]) -> None:
+        if self.undo_log is not None:
+            self.undo_log.save(self)
+        self._extend(self.table.get_ids(cards))
+        self._reordered()
+        if self.on_add is not None:
+            for card in cards:
+                self.on_add(card)
+
+    def _extend(self, ids: array) -> None:
+        """
+        Add cards by their ids at the end of the cards list.
+
+        """
+        self._ids.extend(ids)
+        if self._view is not None:
+            self._view += self.table.get_cards(ids)
+        if self._hash is not None:
+            self._hash = (self._hash + self.table.get_hash(ids)) & MASK
+
+    def remove_cards(self, cards: List[Card]) -> None:
+        if self.undo_log is not None:
+            self.undo_log.save(self)
+        self._ids = _remove_ids(self._ids, self.table.get_ids(cards), cards)
+        self._view = None
+        if self._hash is not None:
+            self._hash = (self._hash - sum(card.hash_key for card in cards)) & MASK
+        self._reordered()
+        if self.on_remove is not None:
+            for card in cards:
+                self.on_remove(card)
+
+    def move_to(self, destination: AbstractDeck) -> None:
+        if not isinstance(destination, (_CardIdZone, FastDeck)) or destination.table is not self.table:
+            super().move_to(destination)
+            return
+
+        if self.undo_log is not None:
+            self.undo_log.save(self)
+        if destination.undo_log is not None:
+            destination.undo_log.save(destination)
+        ids = self._take_ids()
+        destination._extend(ids)
+        destination._reordered()
+        self._reordered()
+
+        if destination.on_add is not None or self.on_remove is not None:
+            cards = self.table.get_cards(ids)
+            if destination.on_add is not None:
+                for card in cards:
+                    destination.on_add(card)
+            if self.on_remove is not None:
+                for card in cards:
+                    self.on_remove(card)
+
+    def _take_ids(self) -> array:
+        """
+        Remove all cards, replacing the cards list, and return their ids.
+
+        """
+        ids = self._ids
+        self._ids = array(ID_TYPE)
+        self._view = None
+        if self._hash is not None:
+            self._hash = 0
+        return ids
+
+
+class FastDiscardPile(_CardIdZone, DiscardPile):
+    __slots__ = ("table", "_ids", "_view")
+
+    def __init__(self, table: CardTable, cards: Optional[List[Card]] = None):
+        self.table = table
+        super().__init__(cards)
+
+
+class FastPlaymat(_CardIdZone, Playmat):
+    __slots__ = ("table", "_ids", "_view")
+
+    def __init__(self, table: CardTable, cards: Optional[List[Card]] = None):
+        self.table = table
+        super().__init__(cards)
+
+
+class FastHand(_CardIdZone, Hand):
+    """
+    A hand that keeps its cards as an array of card ids, with the counts of
+    its reaction cards.
+
+    """
+
+    __slots__ = ("table", "_ids", "_view")
+
+    def __init__(
+            self,
+            table: CardTable,
+            cards: Optional[List[Card]] = None,
+            on_add: Optional[Callable[[Card], None]] = None,
+            on_remove: Optional[Callable[[Card], None]] = None,
+    ):
+        self.table = table
+        super().__init__(cards, on_add, on_remove)
+
+    def add(self, card: Card) -> None:
+        if self.undo_log is not None:
+            self.undo_log.save(self)
+        self._ids.append(self.table[card])
+        if self._view is not None:
+            self._view.append(card)
+        if self._hash is not None:
+            self._hash = (self._hash + card.hash_key) & MASK
+        self._counted_len += 1
+        if card.is_reaction:
+            self._reactions[card.name] = self._reactions.get(card.name, 0) + 1
+        if self.on_add is not None:
+            self.on_add(card)
+
+    def remove(self, card: Card) -> Card:
+        if self.undo_log is not None:
+            self.undo_log.save(self)
+        self._ids.remove(self.table[card])
+        if self._view is not None:
+            self._view.remove(card)
+        if self._hash is not None:
+            self._hash = (self._hash - card.hash_key) & MASK
+        self._counted_len -= 1
+        if card.is_reaction:
+            count = self._reactions.get(card.name, 0) - 1
+            if count > 0:
+                self._reactions[card.name] = count
+            else:
+                self._reactions.pop(card.name, None)
+        if self.on_remove is not None:
+            self.on_remove(card)
+        return card
+
+    def clear(self) -> None:
+        super().clear()
+        self._reactions = {}
+        self._counted_cards = self._ids
+        self._counted_len = 0
+
+    def get_reactions(self) -> Dict[str, int]:
+        # the counts are rebuilt when the ids were replaced or changed other than by add and remove
+        ids = self._ids
+        if ids is not self._counted_cards or len(ids) != self._counted_len:
+            reactions: Dict[str, int] = {}
+            for card in self.cards:
+                if card.is_reaction:
+                    reactions[card.name] = reactions.get(card.name, 0) + 1
+            self._reactions = reactions
+            self._counted_cards = ids
+            self._counted_len = len(ids)
+        return self._reactions
+
+
+class FastDeck(Deck):
+    """
+    A draw pile that keeps its cards as an array of card ids.
+
+    It shuffles, draws and hashes exactly as Deck does, using the random
+    number generator in the same way, so a game plays out the same with
+    either. Like the other zones of a FastGame, its cards list is built
+    from the ids when asked for and then kept up to date.
+
+    """
+
+    __slots__ = ("table", "_ids", "_view")
+
+    def __init__(
+            self,
+            table: CardTable,
+            cards: Optional[List[Card]] = None,
+            on_add: Optional[Callable[[Card], None]] = None,
+            on_remove: Optional[Callable[[Card], None]] = None,
+            on_shuffle: Optional[Callable[[], None]] = None,
+            lazy_shuffle: bool = False,
+            rng: Optional[random.Random] = None,
+    ):
+        self.table = table
+        super().__init__(cards, on_add, on_remove, on_shuffle, lazy_shuffle, rng)
+
+    def __repr__(self):
+        return str(DeckCounter(self.get_cards_unordered()))
+
+    def __len__(self):
+        return len(self._ids)
+
+    def get_ids(self) -> array:
+        """
+        Get the ids of the cards, with the top card last. Cards that are not
+        yet shuffled are in no particular order.
+
+        """
+        return self._ids
+
+    def snapshot(self) -> Any:
+        return self._ids[:], self._unshuffled, self._hash, self._order_hash
+
+    def restore(self, snapshot: Any) -> None:
+        self._ids, self._unshuffled, self._hash, self._order_hash = snapshot
+        self._view = None
+
+    def get_hash(self) -> int:
+        if self._hash is None:
+            self._hash = self.table.get_hash(self._ids)
+        return self._hash
+
+    def get_order_hash(self) -> int:
+        if self._order_hash is None:
+            keys = self.table.hash_keys
+            order_hash = 0
+            for index, card_id in enumerate(self._ids):
+                order_hash += keys[card_id] * self._get_position_factor(index)
+            self._order_hash = order_hash & MASK
+        return self._order_hash
+
+    def _finish_shuffle(self) -> None:
+        # the first _unshuffled cards are in no particular order yet
+        if self._unshuffled > 0:
+            if self.undo_log is not None:
+                self.undo_log.save(self)
+            unshuffled = self._ids[:self._unshuffled]
+            self.rng.shuffle(unshuffled)
+            self._ids[:self._unshuffled] = unshuffled
+            if self._view is not None:
+                self._view[:self._unshuffled] = self.table.get_cards(unshuffled)
+            self._unshuffled = 0
+            self._order_hash = None
+
+    @property
+    def cards(self) -> List[Card]:
+        self._finish_shuffle()
+        return self.get_cards_unordered()
+
+    @cards.setter
+    def cards(self, cards: List[Card]) -> None:
+        # not saved to the undo log, methods replacing the list save the deck first
+        self._ids = self.table.get_ids(cards)
+        self._view = None
+        self._unshuffled = 0
+        self._hash = None
+        self._order_hash = None
+
+    def get_cards_unordered(self) -> List[Card]:
+        view = self._view
+        if view is None:
+            view = self._view = self.table.get_cards(self._ids)
+        return view
+
+    def clear(self) -> None:
+        if self.undo_log is not None:
+            self.undo_log.save(self)
+        del self._ids[:]
+        if self._view is not None:
+            self._view.clear()
+        self._unshuffled = 0
+        if self._hash is not None:
+            self._hash = 0
+        if self._order_hash is not None:
+            self._order_hash = 0
+
+    def add(self, card: Card) -> None:
+        # cards added to the top are above any unshuffled cards
+        if self.undo_log is not None:
+            self.undo_log.save(self)
+        if self._order_hash is not None:
+            self._order_hash = (
+                self._order_hash + card.hash_key * get_position_factor(len(self._ids))
+            ) & MASK
+        self._ids.append(self.table[card])
+        if self._view is not None:
+            self._view.append(card)
+        if self._hash is not None:
+            self._hash = (self._hash + card.hash_key) & MASK
+        if self.on_add is not None:
+            self.on_add(card)
+
+    def remove(self, card: Card) -> Card:
+        if self.undo_log is not None:
+            self.undo_log.save(self)
+        index = self._ids.index(self.table[card])
+        if self._order_hash is not None:
+            if index == len(self._ids) - 1:
+                self._order_hash = (
+                    self._order_hash - card.hash_key * self._get_position_factor(index)
+                ) & MASK
+            else:
+                self._order_hash = None
+        del self._ids[index]
+        if self._view is not None:
+            del self._view[index]
+        if index < self._unshuffled:
+            self._unshuffled -= 1
+        if self._hash is not None:
+            self._hash = (self._hash - card.hash_key) & MASK
+        if self.on_remove is not None:
+            self.on_remove(card)
+        return card
+
+    def draw(self) -> Card:
+        if self.undo_log is not None:
+            self.undo_log.save(self)
+        ids = self._ids
+        view = self._view
+        if self._order_hash is not None:
+            factor = self._get_position_factor(len(ids) - 1)
+        if self._unshuffled > 0 and len(ids) == self._unshuffled:
+            # pick the top card at random from the unshuffled cards
+            last = self._unshuffled - 1
+            index = self.rng.randrange(self._unshuffled)
+            ids[index], ids[last] = ids[last], ids[index]
+            if view is not None:
+                view[index], view[last] = view[last], view[index]
+            self._unshuffled = last
+        drawn_card = self.table.cards[ids.pop()]
+        if view is not None:
+            view.pop()
+        if self._hash is not None:
+            self._hash = (self._hash - drawn_card.hash_key) & MASK
+        if self._order_hash is not None:
+            self._order_hash = (self._order_hash - drawn_card.hash_key * factor) & MASK
+        if self.on_remove is not None:
+            self.on_remove(drawn_card)
+        return drawn_card
+
+    def shuffle(self) -> None:
+        if self.undo_log is not None:
+            self.undo_log.save(self)
+        if self.lazy_shuffle:
+            self._unshuffled = len(self._ids)
+            self._order_hash = None if self._hash is None else self._hash * UNORDERED_FACTOR & MASK
+        else:
+            self._finish_shuffle()
+            self.rng.shuffle(self._ids)
+            if self._view is not None:
+                self._view[:] = self.table.get_cards(self._ids)
+            self._order_hash = None
+        if self.on_shuffle is not None:
+            self.on_shuffle()
+
+    def pop(self) -> Card:
+        if self.undo_log is not None:
+            self.undo_log.save(self)
+        self._finish_shuffle()
+        card = self.table.cards[self._ids.pop()]
+        if self._view is not None:
+            self._view.pop()
+        if self._hash is not None:
+            self._hash = (self._hash - card.hash_key) & MASK
+        self._reordered()
+        if self.on_remove is not None:
+            self.on_remove(card)
+        return card
+
+    def insert(self, index: int, card: Card) -> None:
+        if self.undo_log is not None:
+            self.undo_log.save(self)
+        self._finish_shuffle()
+        self._ids.insert(index, self.table[card])
+        if self._view is not None:
+            self._view.insert(index, card)
+        if self._hash is not None:
+            self._hash = (self._hash + card.hash_key) & MASK
+        self._reordered()
+        if self.on_add is not None:
+            self.on_add(card)
+
+    def add_cards(self, cards: List[Card]) -> None:
+        if self.undo_log is not None:
+            self.undo_log.save(self)
+        self._extend(self.table.get_ids(cards))
+        if self.on_add is not None:
+            for card in cards:
+                self.on_add(card)
+
+    def _extend(self, ids: array) -> None:
+        """
+        Add cards by their ids on top of the deck. As with Deck, a pending
+        lazy shuffle is finished first and the hashes are computed again
+        when next asked for.
+
+        """
+        self._finish_shuffle()
+        self._ids.extend(ids)
+        if self._view is not None:
+            self._view += self.table.get_cards(ids)
+        self._hash = None
+        self._order_hash = None
+
+    def remove_cards(self, cards: List[Card]) -> None:
+        if self.undo_log is not None:
+            self.undo_log.save(self)
+        self._finish_shuffle()
+        self._ids = _remove_ids(self._ids, self.table.get_ids(cards), cards)
+        self._view = None
+        if self._hash is not None:
+            self._hash = (self._hash - sum(card.hash_key for card in cards)) & MASK
+        self._order_hash = None
+        if self.on_remove is not None:
+            for card in cards:
+                self.on_remove(card)
+
+    def move_to(self, destination: AbstractDeck) -> None:
+        self._finish_shuffle()
+        if not isinstance(destination, (_CardIdZone, FastDeck)) or destination.table is not self.table:
+            super().move_to(destination)
+            return
+
+        if self.undo_log is not None:
+            self.undo_log.save(self)
+        if destination.undo_log is not None:
+            destination.undo_log.save(destination)
+        ids = self._take_ids()
+        destination._extend(ids)
+        destination._reordered()
+
+        if destination.on_add is not None or self.on_remove is not None:
+            cards = self.table.get_cards(ids)
+            if destination.on_add is not None:
+                for card in cards:
+                    destination.on_add(card)
+            if self.on_remove is not None:
+                for card in cards:
+                    self.on_remove(card)
+
+    def _take_ids(self) -> array:
+        """
+        Remove all cards, replacing the cards list, and return their ids.
+
+        """
+        ids = self._ids
+        self._ids = array(ID_TYPE)
+        self._view = None
+        self._unshuffled = 0
+        if self._hash is not None:
+            self._hash = 0
+        self._order_hash = None
+        return ids
+
+
+class CountPile(Pile):
+    """
+    A supply pile of copies of a single card, kept as a count in the supply's
+    count vector rather than as a list of cards.
+
+    """
+
+    __slots__ = ("counts", "index", "card")
+
+    def __init__(self, card: Card, count: int, counts: array, index: int):
+        self.counts = counts
+        self.index = index
+        self.card = card
+        AbstractDeck.__init__(self)
+        self.name = card.name
+        counts[index] = count
+
+    def __len__(self):
+        return self.counts[self.index]
+
+    @property
+    def cards(self) -> List[Card]:
+        return [self.card] * self.counts[self.index]
+
+    @cards.setter
+    def cards(self, cards: List[Card]) -> None:
+        if any(card is not self.card for card in cards):
+            raise ValueError(f"A {self.card.name} pile can only hold {self.card.name} cards")
+        self.counts[self.index] = len(cards)
+
+    def snapshot(self) -> Any:
+        return self.counts[self.index]
+
+    def restore(self, snapshot: Any) -> None:
+        self.counts[self.index] = snapshot
+
+    def get_hash(self) -> int:
+        return self.counts[self.index] * self.card.hash_key & MASK
+
+    def _get_tracked_hash(self) -> Optional[int]:
+        return None
+
+    def _check_card(self, card: Card) -> None:
+        if card is not self.card:
+            raise ValueError(f"A {self.card.name} pile can only hold {self.card.name} cards")
+
+    def add(self, card: Card) -> None:
+        self._check_card(card)
+        if self.undo_log is not None:
+            self.undo_log.save(self)
+        self.counts[self.index] += 1
+        if self.on_add is not None:
+            self.on_add(card)
+
+    def remove(self, card: Card) -> Card:
+        if self.counts[self.index] < 1:
+            raise EmptyPile(f"{self.name} pile is empty, cannot gain card")
+        self._check_card(card)
+        if self.undo_log is not None:
+            self.undo_log.save(self)
+        self.counts[self.index] -= 1
+        if self.on_remove is not None:
+            self.on_remove(card)
+        return card
+
+    def pop(self) -> Card:
+        return self.remove(self.card)
+
+    def insert(self, index: int, card: Card) -> None:
+        self.add(card)
+
+    def clear(self) -> None:
+        if self.undo_log is not None:
+            self.undo_log.save(self)
+        self.counts[self.index] = 0
+
+
+class FastSupply(Supply):
+    """
+    A supply that keeps the number of cards in each pile in a count vector,
+    counts, in the order of piles.
+
+    Every pile must hold copies of a single card, as the piles of the base
+    and intrigue sets do.
+
+    """
+
+    def __init__(
+            self,
+            basic_score_piles: List[Pile],
+            basic_treasure_piles: List[Pile],
+            kingdom_piles: List[Pile],
+    ):
+        self.counts = array(ID_TYPE, [0] * (len(basic_score_piles) + len(basic_treasure_piles) + len(kingdom_piles)))
+        index = 0
+        groups: List[List[Pile]] = []
+        for piles in (basic_score_piles, basic_treasure_piles, kingdom_piles):
+            count_piles: List[Pile] = []
+            for pile in piles:
+                card = pile.cards[0]
+                if any(pile_card is not card for pile_card in pile.cards):
+                    raise InvalidGameSetup(
+                        f"Invalid game setup: the {pile.name} pile holds more than one card, "
+                        "which FastSupply cannot count"
+                    )
+                count_piles.append(CountPile(card, len(pile), self.counts, index))
+                index += 1
+            groups.append(count_piles)
+        super().__init__(*groups)
+
+        self._province_index = next(
+            (index for index, pile in enumerate(self.piles) if pile.name == "Province"), None
+        )
+
+    def available_cards(self) -> List[Card]:
+        return [card for card, count in zip(self._pile_cards, self.counts) if count]
+
+    def _available_cards_in_cost_range(
+            self,
+            min_cost: int,
+            max_cost: int,
+            player: "Player",
+            game: "Game",
+    ) -> List[Card]:
+        self._update_cost_index(player, game)
+
+        counts = self.counts
+        pile_cards = self._pile_cards
+        start = bisect_left(self._costs, min_cost)
+        end = bisect_right(self._costs, max_cost)
+        found = [index for index, _ in self._cost_piles[start:end] if counts[index]]
+        for index, _ in self._dynamic_cost_piles:
+            if counts[index] and min_cost <= pile_cards[index].get_cost(player, game) <= max_cost:
+                found.append(index)
+
+        # return the cards in supply order, the same order as available_cards
+        found.sort()
+        return [pile_cards[index] for index in found]
+
+    def num_empty_piles(self) -> int:
+        return self.counts.count(0)
+
+    def is_over(self) -> bool:
+        """
+        Check the end conditions of Game.is_over on the counts: the
+        province pile or any 3 piles are empty.
+
+        """
+        counts = self.counts
+        if self._province_index is not None and counts[self._province_index] == 0:
+            return True
+        return counts.count(0) >= 3
+
+
+class FastGame(QuietGame):
+    """
+    Array-backed game engine for simulations.
+
+    Plays exactly the same game as Game, with the same card logic, deciders
+    and GameResult, and like QuietGame never logs. Each player's deck,
+    discard pile, hand and playmat keep their cards as an array of card ids,
+    numbered by the game's card_table, and the supply keeps a count vector
+    of its piles instead of lists of cards. Moving a zone into another, as
+    drawing after a shuffle and cleaning up do, copies ids without building
+    card lists, and supply queries read the counts. Card lists are built only
+    when card code asks for them.
+
+    Starting the game gives its players new zones, which stay with them
+    after the game. The trash is kept as in Game. Only supply piles of copies
+    of a single card are supported, which covers the base and intrigue sets.
+
+    Attributes:
+        players: List of players in the game.
+        expansions: List expansions (and their cards) eligible to be used in the game's supply.
+        kingdom_cards: Specify any specific cards to be used in the supply.
+        start_deck: List of cards each player will start the game with. Default = [7 Coppers + 3 Estates].
+        random_order: If True, scrambles the order of players (to offset first player advantage).
+        lazy_shuffle: If True, player decks are shuffled lazily, one card per draw.
+        seed: If set, the game's random number generator is seeded with it when the game starts.
+
+    """
+
+    def start(self) -> None:
+        self.card_table = CardTable()
+        for player in self.players:
+            player.deck = FastDeck(self.card_table)
+            player.discard_pile = FastDiscardPile(self.card_table)
+            player.hand = FastHand(self.card_table)
+            player.playmat = FastPlaymat(self.card_table)
+        super().start()
+
+    def _create_supply(self) -> Supply:
+        supply = super()._create_supply()
+        return FastSupply(supply.basic_score_piles, supply.basic_treasure_piles, supply.kingdom_piles)
+
+    def is_over(self) -> bool:
+        return self.supply.is_over()
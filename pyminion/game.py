@@ -1,17 +1,75 @@
+from contextvars import ContextVar
 from enum import IntEnum, unique
+from functools import partial, wraps
 import logging
 import random
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
 
-from pyminion.core import CardType, Card, Deck, DeckCounter, DiscardPile, Pile, Supply, Trash
+from pyminion.core import AbstractDeck, CardType, Card, Deck, DeckCounter, Pile, Supply, Trash
 from pyminion.effects import EffectRegistry
 from pyminion.exceptions import InvalidGameSetup, InvalidPlayerCount
+from pyminion.hashing import MASK, combine
 from pyminion.expansions.base import (copper, curse, duchy, estate, gold,
                                       province, silver)
 from pyminion.player import Player
 from pyminion.result import GameOutcome, GameResult, PlayerSummary
+from pyminion.scoreboard import Scoreboard
+from pyminion.step import DecisionRequest, GameStepper
+from pyminion.undo import GameMark, UndoLog
+from pyminion.log import logger, logging_disabled
 
-logger = logging.getLogger()
+
+# log handlers of the game running in the current thread or task
+_game_log_handlers: ContextVar[Tuple[logging.Handler, ...]] = ContextVar(
+    "pyminion_game_log_handlers", default=()
+)
+
+
+class GameLogDispatcher(logging.Handler):
+    """
+    Forwards log records to the handlers of the game that is running in the
+    current thread or task.
+
+    Games log through the root logger but keep their handlers to
+    themselves, so games running at the same time on different threads each
+    write only their own log.
+
+    """
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        for handler in _game_log_handlers.get():
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        return True
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.handle(record)
+
+
+logging.getLogger().addHandler(GameLogDispatcher())
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def _logs_to_game(method: F) -> F:
+    """
+    Run a method of a game, or of an object with the game's log_handlers and
+    log_enabled, with the game's log handlers active. Informational logging
+    is switched off while it runs if the game does not log.
+
+    """
+    @wraps(method)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        token = _game_log_handlers.set(self.log_handlers)
+        try:
+            if self.log_enabled:
+                return method(self, *args, **kwargs)
+            with logging_disabled():
+                return method(self, *args, **kwargs)
+        finally:
+            _game_log_handlers.reset(token)
+
+    return wrapper  # type: ignore
 
 
 class Game:
@@ -27,9 +85,20 @@ class Game:
         log_stdout: If True, logs game to stdout.
         log_file: If True, logs game to log file.
         log_file_name: Name of the file to be logged to. Default = "game.log"
+        lazy_shuffle: If True, player decks are shuffled lazily, one card per draw.
+            Gives the same distribution as a full shuffle but uses the random number generator differently.
+        seed: If set, the game's random number generator is seeded with it when the game starts.
+            Otherwise it is seeded from the random module.
+
+    Each game has its own random number generator and log handlers, so
+    separate games can be played at the same time on different threads.
+    The game's log is written while it is started or played.
 
     """
 
+    # subclasses that never log set this to False to skip building log messages
+    log_enabled = True
+
     @unique
     class Phase(IntEnum):
         Action = 0
@@ -46,6 +115,8 @@ class Game:
         log_stdout: bool = True,
         log_file: bool = False,
         log_file_name: str = "game.log",
+        lazy_shuffle: bool = False,
+        seed: Optional[int] = None,
     ):
 
         if len(players) < 1:
@@ -56,21 +127,32 @@ class Game:
         self.expansions = expansions
         self.kingdom_cards = [] if kingdom_cards is None else kingdom_cards
         self.all_game_cards: List[Card] = []
-        self.card_cost_reduction = 0
+        self.cost_version = 0
+        self._card_cost_reduction = 0
         self.start_deck = start_deck
         self.random_order = random_order
+        self.lazy_shuffle = lazy_shuffle
+        self.seed = seed
+        self.rng = random.Random(seed)
         self.trash = Trash()
         self.current_phase: Game.Phase = Game.Phase.Action
 
         self.effect_registry = EffectRegistry()
+        self.undo_log: Optional[UndoLog] = None
+        self.stepper: Optional[GameStepper] = None
+        self.effect_registry.on_hand_listeners_changed = self.update_hand_callbacks
 
+        # live victory points of each player
+        self.scoreboard = Scoreboard(self.players)
+
+        handlers: List[logging.Handler] = []
         if log_stdout:
             # Set up a handler that logs to stdout
             c_handler = logging.StreamHandler()
             c_handler.setLevel(logging.INFO)
             c_format = logging.Formatter("%(message)s")
             c_handler.setFormatter(c_format)
-            logger.addHandler(c_handler)
+            handlers.append(c_handler)
 
         if log_file:
             # Set up a handler that dumps the log to a file
@@ -78,7 +160,24 @@ class Game:
             f_handler.setLevel(logging.INFO)
             f_format = logging.Formatter("%(message)s")
             f_handler.setFormatter(f_format)
-            logger.addHandler(f_handler)
+            handlers.append(f_handler)
+
+        self.log_handlers: Tuple[logging.Handler, ...] = tuple(handlers)
+
+    @property
+    def card_cost_reduction(self) -> int:
+        return self._card_cost_reduction
+
+    @card_cost_reduction.setter
+    def card_cost_reduction(self, value: int) -> None:
+        """
+        Set the cost reduction for all cards. Changing it invalidates
+        cached card costs.
+
+        """
+        if value != self._card_cost_reduction:
+            self._card_cost_reduction = value
+            self.cost_version += 1
 
     def _create_basic_score_piles(self) -> List[Pile]:
         """
@@ -152,7 +251,7 @@ class Game:
         if chosen_cards:
             for card in self.kingdom_cards:
                 kingdom_options.remove(card)  # Do not duplicate any user chosen cards
-        kingdom_ten = random.sample(kingdom_options, KINGDOM_PILES - chosen_cards)
+        kingdom_ten = self.rng.sample(kingdom_options, KINGDOM_PILES - chosen_cards)
         random_piles = [Pile([card] * card.get_pile_starting_count(self)) for card in kingdom_ten]
 
         piles = chosen_piles + random_piles
@@ -177,19 +276,32 @@ class Game:
         self.all_game_cards = [pile.cards[0] for pile in all_piles]
         return Supply(basic_score_piles, basic_treasure_piles, kingdom_piles)
 
+    @_logs_to_game
     def start(self) -> None:
         logger.info("\nStarting Game...\n")
+        self.clear_marks()
 
-        self.effect_registry.reset()
+        # seeding from the random module keeps unseeded games reproducible with random.seed
+        self.rng = random.Random(self.seed if self.seed is not None else random.getrandbits(64))
+
+        # a fresh trash, effect registry and scoreboard so that copies of an
+        # unstarted game do not share them. The registry reinstalls the hand
+        # callbacks of this game, not of the game it was copied from
+        self.trash = Trash()
+        self.card_cost_reduction = 0
+        self.effect_registry = EffectRegistry()
+        self.effect_registry.on_hand_listeners_changed = self.update_hand_callbacks
+        self.scoreboard = Scoreboard(self.players)
 
         self.supply = self._create_supply()
-        logger.info(self.supply.get_pretty_string(self.players[0], self))
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(self.supply.get_pretty_string(self.players[0], self))
 
         for card in self.all_game_cards:
             card.set_up(self)
 
         if self.random_order:
-            random.shuffle(self.players)
+            self.rng.shuffle(self.players)
         if not self.start_deck:
             self.start_deck = []
             for _ in range(7):
@@ -199,13 +311,163 @@ class Game:
 
         for player in self.players:
             player.reset()
-            player.hand.on_add = lambda card, player=player: self.effect_registry.on_hand_add(player, card, self)
-            player.hand.on_remove = lambda card, player=player: self.effect_registry.on_hand_remove(player, card, self)
-            player.deck.on_shuffle = lambda player=player: self.effect_registry.on_shuffle(player, self)
-            player.discard_pile = DiscardPile(self.start_deck[:])
-            logger.info(f"\n{player} starts with {player.discard_pile}")
+            self.set_hand_callbacks(player)
+            player.deck.lazy_shuffle = self.lazy_shuffle
+            player.deck.rng = self.rng
+            player.deck.on_shuffle = partial(self.effect_registry.on_shuffle, player, self)
+            player.discard_pile.add_cards(self.start_deck)
+            logger.info("\n%s starts with %s", player, player.discard_pile)
             player.draw(5)
 
+    def set_hand_callbacks(self, player: Player) -> None:
+        """
+        Install the hand callbacks for a player. Callbacks are only installed
+        while hand add or hand remove effects are registered, so cards moving
+        in and out of hands cost nothing extra otherwise.
+
+        """
+        registry = self.effect_registry
+        if registry.has_hand_add_effects():
+            player.hand.on_add = partial(registry.on_hand_add, player, game=self)
+        else:
+            player.hand.on_add = None
+        if registry.has_hand_remove_effects():
+            player.hand.on_remove = partial(registry.on_hand_remove, player, game=self)
+        else:
+            player.hand.on_remove = None
+
+    def update_hand_callbacks(self) -> None:
+        """
+        Re-install the hand callbacks for all players after the registered
+        hand effects change.
+
+        """
+        for player in self.players:
+            self.set_hand_callbacks(player)
+
+    def _get_decks(self) -> List[AbstractDeck]:
+        decks: List[AbstractDeck] = [self.trash]
+        decks += self.supply.piles
+        for player in self.players:
+            decks += [player.deck, player.discard_pile, player.hand, player.playmat]
+        return decks
+
+    def mark(self) -> GameMark:
+        """
+        Mark the current state of a started game, so it can be restored with
+        undo_to.
+
+        After the first mark, every change to a deck is logged until
+        clear_marks is called or the game is started again. Marks can be
+        nested and a mark can be undone to any number of times, but undoing
+        to a mark discards the marks made after it. Marks should be made
+        between moves, not while a card is being played. The state of
+        deciders is not restored.
+
+        """
+        if self.undo_log is None:
+            self.undo_log = UndoLog()
+            for deck in self._get_decks():
+                deck.undo_log = self.undo_log
+                # decks copied from another process may carry epochs of its logs
+                deck._undo_epoch = -1
+
+        return GameMark(
+            position=self.undo_log.mark(),
+            rng_state=self.rng.getstate(),
+            phase=self.current_phase,
+            cost_reduction=self.card_cost_reduction,
+            effects=self.effect_registry.snapshot(),
+            players=[
+                (
+                    player.state.actions,
+                    player.state.money,
+                    player.state.buys,
+                    player.turns,
+                    player.shuffles,
+                    player.actions_played_this_turn,
+                )
+                for player in self.players
+            ],
+        )
+
+    def undo_to(self, mark: GameMark) -> None:
+        """
+        Restore the game to the state it was in when the mark was made.
+
+        """
+        if self.undo_log is None:
+            raise ValueError("Cannot undo, no marks have been made")
+
+        self.undo_log.undo_to(mark.position)
+        self.rng.setstate(mark.rng_state)
+        self.current_phase = mark.phase
+        self.card_cost_reduction = mark.cost_reduction
+        self.effect_registry.restore(mark.effects)
+        for player, values in zip(self.players, mark.players):
+            (
+                player.state.actions,
+                player.state.money,
+                player.state.buys,
+                player.turns,
+                player.shuffles,
+                player.actions_played_this_turn,
+            ) = values
+
+        # scores are rebuilt from the restored cards when next needed
+        self.scoreboard.reset()
+
+    def clear_marks(self) -> None:
+        """
+        Forget all marks and stop logging changes to decks.
+
+        """
+        if self.undo_log is None:
+            return
+        for deck in self._get_decks():
+            deck.undo_log = None
+        self.undo_log = None
+
+    def state_hash(self, perspective: Optional[Player] = None) -> int:
+        """
+        Get a 64-bit hash of the state of a started game: the cards in each
+        player's deck, hand, discard pile and playmat, the order of the decks,
+        the players' turn state, the trash, the supply and the phase.
+
+        If perspective is a player, information hidden from that player is
+        left out: the order of all decks and which of another player's cards
+        are in their hand and which in their deck. Positions the player cannot
+        tell apart then have the same hash.
+
+        Card hashes are kept up to date as cards move once they have been
+        asked for, so the hash is cheap to get after every move. Effects
+        registered by cards are not part of the hash.
+
+        """
+        state_hash = combine(self.current_phase, self.card_cost_reduction)
+        for player in self.players:
+            state = player.state
+            state_hash = combine(state_hash, state.actions)
+            state_hash = combine(state_hash, state.money)
+            state_hash = combine(state_hash, state.buys)
+            state_hash = combine(state_hash, player.turns)
+            state_hash = combine(state_hash, player.actions_played_this_turn)
+            if perspective is None:
+                state_hash = combine(state_hash, player.deck.get_order_hash())
+                state_hash = combine(state_hash, player.hand.get_hash())
+            elif player is perspective:
+                state_hash = combine(state_hash, player.deck.get_hash())
+                state_hash = combine(state_hash, player.hand.get_hash())
+            else:
+                state_hash = combine(state_hash, (player.deck.get_hash() + player.hand.get_hash()) & MASK)
+                state_hash = combine(state_hash, len(player.hand))
+            state_hash = combine(state_hash, player.discard_pile.get_hash())
+            state_hash = combine(state_hash, player.playmat.get_hash())
+        state_hash = combine(state_hash, self.trash.get_hash())
+        for pile in self.supply.piles:
+            state_hash = combine(state_hash, pile.get_hash())
+        return state_hash
+
     def is_over(self) -> bool:
         """
         The game is over if any 3 supply piles are empty or
@@ -231,6 +493,14 @@ class Game:
 
     def play(self) -> GameResult:
         self.start()
+        return self.play_turns()
+
+    @_logs_to_game
+    def play_turns(self) -> GameResult:
+        """
+        Play turns of a started game until it is over and return the result.
+
+        """
         while True:
             for player in self.players:
                 player.take_turn(self)
@@ -240,10 +510,34 @@ class Game:
 
                 if self.is_over():
                     result = self.summarize_game()
-                    logging.info(f"\n{result}")
+                    logger.info("\n%s", result)
                     return result
 
-    def get_winners(self) -> List[Player]:
+    def start_steps(self, players: Optional[List[Player]] = None) -> Optional[DecisionRequest]:
+        """
+        Start the game to be played step by step, as an alternative to play.
+
+        The game runs until one of the given players, or any player if none
+        are given, has to make a decision, and returns a request for it.
+        Answer it with step. The other players decide with their deciders.
+        Returns None if the game ended without a decision of the players.
+
+        """
+        self.stepper = GameStepper(self, players)
+        return self.stepper.start()
+
+    def step(self, answer: Any) -> Optional[DecisionRequest]:
+        """
+        Answer the pending decision request of a stepped game and run the game
+        until the next decision. Returns the request for that decision, or
+        None once the game is over and can be summarized.
+
+        """
+        if self.stepper is None:
+            raise ValueError("The game is not being stepped, call start_steps first")
+        return self.stepper.step(answer)
+
+    def get_winners(self, scores: Optional[Dict[Player, int]] = None) -> List[Player]:
         """
         The player with the most victory points wins.
         If the highest scores are tied at the end of the game,
@@ -254,18 +548,23 @@ class Game:
         the list, that is the sole winner. If there are multiple players
         in the list, they are have tied for first.
 
+        Scores can be passed in if they have already been counted.
+
         """
         # if one player only, they win by default
         if len(self.players) == 1:
             return [self.players[0]]
 
+        if scores is None:
+            scores = {player: player.get_victory_points() for player in self.players}
+
         # temporarily set first player as winner
-        high_score = self.players[0].get_victory_points()
+        high_score = scores[self.players[0]]
         winners = [self.players[0]]
 
         # iterate the rest of the players in the game
         for player in self.players[1:]:
-            score = player.get_victory_points()
+            score = scores[player]
 
             # if this player scored more,
             # mark them as winner and high score
@@ -299,7 +598,8 @@ class Game:
         """
 
         player_summaries = []
-        winners = self.get_winners()
+        scores = {player: player.get_victory_points() for player in self.players}
+        winners = self.get_winners(scores)
 
         for order, player in enumerate(self.players):
 
@@ -318,7 +618,7 @@ class Game:
             summary = PlayerSummary(
                 player=player,
                 result=result,
-                score=player.get_victory_points(),
+                score=scores[player],
                 turns=player.turns,
                 shuffles=player.shuffles,
                 turn_order=order + 1,
@@ -333,3 +633,73 @@ class Game:
             player_summaries=player_summaries,
         )
         return game_result
+
+
+class GameTemplate:
+    """
+    A fixed game setup that a game can be reset to quickly.
+
+    The game is started once to choose the kingdom and set up the cards.
+    Resetting refills the same supply piles, restores the effects registered
+    during card set up and deals the start deck again, reusing the existing
+    piles, card lists and effect objects instead of building new ones.
+    Effects registered by a card's set_up are shared by every reset, so they
+    must not hold per-game state.
+
+    """
+
+    def __init__(self, game: Game):
+        game.start()
+        self.game = game
+        self.pile_cards = [pile.cards[:] for pile in game.supply.piles]
+        self.effects = game.effect_registry.snapshot()
+        assert game.start_deck is not None
+        self.start_deck: List[Card] = game.start_deck[:]
+
+    @property
+    def log_handlers(self) -> Tuple[logging.Handler, ...]:
+        return self.game.log_handlers
+
+    @property
+    def log_enabled(self) -> bool:
+        return self.game.log_enabled
+
+    @_logs_to_game
+    def reset(self) -> Game:
+        """
+        Reset the game to its starting state.
+
+        """
+        game = self.game
+        logger.info("\nStarting Game...\n")
+        game.clear_marks()
+
+        game.effect_registry.restore(self.effects)
+        game.scoreboard.reset()
+        game.trash.clear()
+        game.card_cost_reduction = 0
+        game.current_phase = Game.Phase.Action
+
+        for pile, cards in zip(game.supply.piles, self.pile_cards):
+            pile.clear()
+            pile.add_cards(cards)
+
+        if game.random_order:
+            game.rng.shuffle(game.players)
+
+        for player in game.players:
+            player.reset()
+            game.set_hand_callbacks(player)
+            player.deck.lazy_shuffle = game.lazy_shuffle
+            player.deck.rng = game.rng
+            player.discard_pile.add_cards(self.start_deck)
+            player.draw(5)
+
+        return game
+
+    def play(self) -> GameResult:
+        """
+        Reset the game and play it to the end.
+
+        """
+        return self.reset().play_turns()
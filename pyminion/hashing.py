@@ -0,0 +1,43 @@
+from hashlib import blake2b
+from typing import List
+
+# hashes are 64-bit unsigned integers, kept in range by masking after each operation
+MASK = (1 << 64) - 1
+
+# multiplier combining the parts of a game state, the 64-bit FNV prime
+_COMBINE_PRIME = 0x100000001B3
+
+# base of the polynomial hash of ordered cards, and the factor of cards in no particular order
+_POSITION_BASE = 0x9E3779B97F4A7C15
+UNORDERED_FACTOR = 0xD6E8FEB86659FD93
+
+_position_factors: List[int] = [1]
+
+
+def get_card_key(name: str) -> int:
+    """
+    Get the random looking 64-bit key of a card name. Keys are the same in
+    every process, so hashes can be compared and stored between runs.
+
+    """
+    return int.from_bytes(blake2b(name.encode(), digest_size=8).digest(), "little")
+
+
+def get_position_factor(index: int) -> int:
+    """
+    Get the factor of a card at a position of an ordered list of cards, so
+    that the hash of the list depends on the order of its cards.
+
+    """
+    factors = _position_factors
+    while len(factors) <= index:
+        factors.append(factors[-1] * _POSITION_BASE & MASK)
+    return factors[index]
+
+
+def combine(state_hash: int, value: int) -> int:
+    """
+    Add a value to the hash of a sequence of values.
+
+    """
+    return (state_hash ^ (value & MASK)) * _COMBINE_PRIME & MASK
@@ -1,5 +1,4 @@
 import functools
-import logging
 from collections import Counter
 from typing import TYPE_CHECKING, Callable, List, Optional, Sequence, Tuple, Type, Union
 
@@ -10,13 +9,12 @@ from pyminion.exceptions import (InsufficientMoney, InvalidBinaryInput,
                                  InvalidSingleCardInput, InvalidDeckPositionInput,
                                  InvalidEffectsOrderInput)
 from pyminion.player import Player
+from pyminion.log import logger
 
 if TYPE_CHECKING:
     from pyminion.game import Game
 
 
-logger = logging.getLogger()
-
 
 def get_matches(input_str: str, options: List[str]) -> List[str]:
     """
@@ -578,6 +576,8 @@ class Human(Player):
 
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         deck: Optional[Deck] = None,
@@ -0,0 +1,46 @@
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+# False while a game that does not log runs in the current thread or task
+_game_logging: ContextVar[bool] = ContextVar("pyminion_game_logging", default=True)
+
+
+class EngineLogger(logging.Logger):
+    """
+    Logger of the game engine. Records propagate to the root logger, which
+    also sets the level.
+
+    Informational logging can be switched off for the current thread or task
+    with logging_disabled. The logger then reports INFO as disabled, so the
+    engine skips creating and formatting records. Warnings and errors are
+    still logged.
+
+    """
+
+    def isEnabledFor(self, level: int) -> bool:
+        if level < logging.WARNING and not _game_logging.get():
+            return False
+        # not cached, as the logging module only clears the caches of the
+        # loggers it created when levels change
+        if self.manager.disable >= level:
+            return False
+        return level >= self.getEffectiveLevel()
+
+
+logger = EngineLogger("pyminion")
+logger.parent = logging.getLogger()
+
+
+@contextmanager
+def logging_disabled() -> Iterator[None]:
+    """
+    Switch off informational engine logging in the current thread or task.
+
+    """
+    token = _game_logging.set(False)
+    try:
+        yield
+    finally:
+        _game_logging.reset(token)
@@ -0,0 +1,266 @@
+from itertools import combinations, combinations_with_replacement
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from pyminion.core import Card
+from pyminion.step import DecisionRequest
+
+if TYPE_CHECKING:
+    from pyminion.game import Game
+
+# at most this many moves are listed for a decision
+DEFAULT_MAX_MOVES = 256
+
+
+class ActionSpace:
+    """
+    A fixed numbering of the parts that moves are made of, so that moves
+    can be given to search and learning code as small tuples of integers.
+
+    Index 0 is No (no card, an empty choice or False), index 1 is Yes
+    (True), the next num_options indexes are options chosen by position
+    (options of a card, the order of effects or a deck position) and the
+    rest are the cards of the space, one index per card name.
+
+    A deck position decision has a position for each card in the deck and
+    one below the bottom card. Its moves are listed only if num_options
+    covers all positions, otherwise get_legal_moves raises ValueError, so
+    num_options must be larger than the decks the space is used with.
+
+    """
+
+    NO = 0
+    YES = 1
+
+    def __init__(self, cards: Iterable[Card], num_options: int = 64):
+        self.num_options = num_options
+        self.cards: List[Card] = []
+        self._card_indexes: Dict[str, int] = {}
+        for card in cards:
+            if card.name not in self._card_indexes:
+                self._card_indexes[card.name] = 2 + num_options + len(self.cards)
+                self.cards.append(card)
+
+    def __len__(self):
+        return 2 + self.num_options + len(self.cards)
+
+    @classmethod
+    def from_game(cls, game: "Game", num_options: int = 64) -> "ActionSpace":
+        """
+        Create the action space of a game's supply and start deck.
+
+        """
+        cards = [pile_card for pile in game.supply.piles for pile_card in pile.cards[:1]]
+        return cls(cards + list(game.start_deck or []), num_options)
+
+    @classmethod
+    def from_expansions(cls, expansions: Sequence[str] = ("base", "intrigue"), num_options: int = 64) -> "ActionSpace":
+        """
+        Create an action space of all the cards of expansions, so that moves
+        have the same encoding in every kingdom.
+
+        """
+        from pyminion.spec import BASIC_CARDS, EXPANSIONS
+
+        cards = list(BASIC_CARDS)
+        for expansion in expansions:
+            cards += EXPANSIONS[expansion]
+        return cls(cards, num_options)
+
+    def option_index(self, option: int) -> int:
+        if not 0 <= option < self.num_options:
+            raise ValueError(f"Option {option} is outside of the action space")
+        return 2 + option
+
+    def card_index(self, card: Card) -> int:
+        try:
+            return self._card_indexes[card.name]
+        except KeyError:
+            raise ValueError(f"{card.name} is not in the action space") from None
+
+    def describe(self, index: int) -> str:
+        if index == ActionSpace.NO:
+            return "No"
+        if index == ActionSpace.YES:
+            return "Yes"
+        if index < 2 + self.num_options:
+            return f"Option {index - 2}"
+        return self.cards[index - 2 - self.num_options].name
+
+
+class Move:
+    """
+    A legal answer to a decision request, with its compact encoding: the
+    sorted action space indexes of the cards or options it chooses.
+
+    """
+
+    __slots__ = ("answer", "action")
+
+    def __init__(self, answer: Any, action: Tuple[int, ...]):
+        self.answer = answer
+        self.action = action
+
+    def __repr__(self):
+        return f"Move({self.answer})"
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Move) and self.action == other.action
+
+    def __hash__(self):
+        return hash(self.action)
+
+
+def _get_distinct_cards(cards: Sequence[Card]) -> List[Card]:
+    distinct: Dict[str, Card] = {}
+    for card in cards:
+        distinct.setdefault(card.name, card)
+    return list(distinct.values())
+
+
+def _iter_card_choices(cards: Sequence[Card], min_num: int, max_num: int, descending: bool) -> Iterator[List[Card]]:
+    """
+    Iterate over the different choices of min_num to max_num of the cards.
+    Copies of a card are interchangeable, so choices differ in how many of
+    each card they choose.
+
+    """
+    distinct = _get_distinct_cards(cards)
+    counts: Dict[str, int] = {}
+    for card in cards:
+        counts[card.name] = counts.get(card.name, 0) + 1
+
+    def choose(index: int, num: int) -> Iterator[List[Card]]:
+        if num == 0:
+            yield []
+            return
+        if index == len(distinct):
+            return
+        card = distinct[index]
+        for count in range(min(num, counts[card.name]), -1, -1):
+            for rest in choose(index + 1, num - count):
+                yield [card] * count + rest
+
+    sizes = range(max_num, min_num - 1, -1) if descending else range(min_num, max_num + 1)
+    for size in sizes:
+        yield from choose(0, size)
+
+
+def _iter_moves(request: DecisionRequest, space: ActionSpace) -> Iterator[Move]:
+    no = (ActionSpace.NO,)
+    card_index = space.card_index
+
+    def card_move(card: Card) -> Move:
+        return Move(card, (card_index(card),))
+
+    def cards_move(cards: List[Card]) -> Move:
+        action = tuple(sorted(card_index(card) for card in cards)) if cards else no
+        return Move(cards, action)
+
+    type = request.type
+    args = request.args
+    if type in ("action_phase", "buy_phase"):
+        assert request.valid_cards is not None
+        yield Move(None, no)
+        for card in _get_distinct_cards(request.valid_cards):
+            yield card_move(card)
+    elif type == "multi_play":
+        assert request.valid_cards is not None
+        if not args["required"]:
+            yield Move(None, no)
+        for card in _get_distinct_cards(request.valid_cards):
+            yield card_move(card)
+    elif type == "binary":
+        yield Move(False, no)
+        yield Move(True, (ActionSpace.YES,))
+    elif type == "effects_order":
+        for i in range(len(args["effects"])):
+            yield Move(i, (space.option_index(i),))
+    elif type == "deck_position":
+        num_positions = args["num_deck_cards"] + 1
+        if num_positions > space.num_options:
+            raise ValueError(
+                f"A deck of {args['num_deck_cards']} cards has more positions than "
+                f"the {space.num_options} options of the action space"
+            )
+        for i in range(num_positions):
+            yield Move(i, (space.option_index(i),))
+    elif type == "multiple_option":
+        indexes = range(len(args["options"]))
+        choose = combinations if args["unique"] else combinations_with_replacement
+        for choice in choose(indexes, args["num_choices"]):
+            yield Move(list(choice), tuple(space.option_index(i) for i in choice))
+    else:
+        assert request.valid_cards is not None
+        assert request.min_num is not None and request.max_num is not None
+        descending = type == "treasure_phase"
+        for cards in _iter_card_choices(request.valid_cards, request.min_num, request.max_num, descending):
+            yield cards_move(cards)
+
+
+def encode_answer(request: DecisionRequest, answer: Any, space: ActionSpace) -> Tuple[int, ...]:
+    """
+    Get the compact encoding of an answer to a decision request, such as
+    the answer of a bot's decider.
+
+    """
+    if answer is None or answer is False:
+        return (ActionSpace.NO,)
+    if answer is True:
+        return (ActionSpace.YES,)
+    if isinstance(answer, Card):
+        return (space.card_index(answer),)
+    if isinstance(answer, int):
+        return (space.option_index(answer),)
+    if len(answer) == 0:
+        return (ActionSpace.NO,)
+    if request.type == "multiple_option":
+        return tuple(sorted(space.option_index(i) for i in answer))
+    return tuple(sorted(space.card_index(card) for card in answer))
+
+
+def get_legal_moves(
+    request: DecisionRequest,
+    space: ActionSpace,
+    max_moves: int = DEFAULT_MAX_MOVES,
+) -> List[Move]:
+    """
+    List the legal answers to a decision request as moves.
+
+    Choices of several cards or options are listed as every combination,
+    up to max_moves. Treasures to play are listed from the most treasures
+    down, so playing all of them comes first. Other choices of cards are
+    listed from the fewest cards up.
+
+    """
+    moves = []
+    for move in _iter_moves(request, space):
+        if len(moves) == max_moves:
+            break
+        moves.append(move)
+    return moves
+
+
+def get_action_mask(moves: Iterable[Move], space: ActionSpace) -> List[bool]:
+    """
+    Get a mask over the action space of the indexes used by any of the
+    moves. For decisions of a single card or option it marks exactly the
+    legal moves.
+
+    """
+    mask = [False] * len(space)
+    for move in moves:
+        for index in move.action:
+            mask[index] = True
+    return mask
+
+
+def find_move(moves: Sequence[Move], action: Sequence[int]) -> Optional[Move]:
+    """
+    Find the move with an action, given in any order.
+
+    """
+    action = tuple(sorted(action))
+    for move in moves:
+        if move.action == action:
+            return move
+    return None
@@ -1,31 +1,39 @@
 import logging
-from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, List, Optional, Union
 
-from pyminion.core import (AbstractDeck, Action, CardType, Card, Deck, DiscardPile, Hand,
-                           Playmat, Supply, Trash, Treasure, get_action_cards, get_treasure_cards,
+from pyminion.core import (AbstractDeck, Action, Card, Deck, DiscardPile, Hand,
+                           Pile, Playmat, Supply, Trash, Treasure, get_action_cards, get_treasure_cards,
                            get_score_cards)
 from pyminion.decider import Decider
-from pyminion.exceptions import (CardNotFound, EmptyPile, InsufficientBuys,
+from pyminion.exceptions import (CardNotFound, EmptyPile, InsufficientActions, InsufficientBuys,
                                  InsufficientMoney, InvalidCardPlay)
+from pyminion.log import logger
 
 if TYPE_CHECKING:
     from pyminion.game import Game
 
 
-logger = logging.getLogger()
 
-
-@dataclass
 class State:
     """
     Hold state during a player's turn
 
     """
 
-    actions: int = 1
-    money: int = 0
-    buys: int = 1
+    __slots__ = ("actions", "money", "buys")
+
+    def __init__(self, actions: int = 1, money: int = 0, buys: int = 1):
+        self.actions = actions
+        self.money = money
+        self.buys = buys
+
+    def __repr__(self):
+        return f"State(actions={self.actions}, money={self.money}, buys={self.buys})"
+
+    def __eq__(self, other):
+        if not isinstance(other, State):
+            return NotImplemented
+        return (self.actions, self.money, self.buys) == (other.actions, other.money, other.buys)
 
 
 class Player:
@@ -35,6 +43,11 @@ class Player:
 
     """
 
+    __slots__ = (
+        "decider", "deck", "discard_pile", "hand", "playmat", "state",
+        "player_id", "turns", "shuffles", "actions_played_this_turn",
+    )
+
     def __init__(
         self,
         decider: Decider,
@@ -68,9 +81,10 @@ class Player:
         self.turns = 0
         self.shuffles = 0
         self.actions_played_this_turn = 0
-        self.deck.cards = []
-        self.discard_pile.cards = []
-        self.hand.cards = []
+        self.deck.clear()
+        self.discard_pile.clear()
+        self.hand.clear()
+        self.playmat.clear()
 
     def draw(
         self,
@@ -88,6 +102,7 @@ class Player:
         """
         if destination is None:
             destination = self.hand
+        log_draws = not silent and logger.isEnabledFor(logging.INFO)
         drawn_cards: AbstractDeck = AbstractDeck()
         for _ in range(num_cards):
             # Both deck and discard empty -> do nothing
@@ -96,17 +111,18 @@ class Player:
             else:
                 # Deck is empty -> shuffle discard pile into deck
                 if len(self.deck) == 0:
-                    logger.info(f"{self} shuffles their deck")
+                    logger.info("%s shuffles their deck", self)
                     self.discard_pile.move_to(self.deck)
                     self.deck.shuffle()
                     self.shuffles += 1
 
                 draw_card = self.deck.draw()
                 destination.add(draw_card)
-                drawn_cards.add(draw_card)
+                if log_draws:
+                    drawn_cards.add(draw_card)
 
-        if not silent:
-            logger.info(f"{self} draws {drawn_cards}")
+        if log_draws:
+            logger.info("%s draws %s", self, drawn_cards)
 
     def discard(
             self,
@@ -142,13 +158,11 @@ class Player:
             raise CardNotFound(f"Invalid play, {target_card} not in hand")
         for card in self.hand.cards:
             if card.name == target_card.name:
-                if CardType.Action in card.type:
+                if card.is_action:
                     assert isinstance(card, Action)
-                    self.actions_played_this_turn += 1
-                    card.play(player=self, game=game, generic_play=generic_play)
-                    game.effect_registry.on_play(self, card, game)
+                    self._play_action(card, game, generic_play)
                     return
-                if CardType.Treasure in card.type:
+                if card.is_treasure:
                     assert isinstance(card, Treasure)
                     card.play(player=self, game=game)
                     game.effect_registry.on_play(self, card, game)
@@ -161,25 +175,87 @@ class Player:
         This is method is necessary when playing cards not in the player's hand, such as vassal.
 
         """
-        if CardType.Action in card.type:
+        if card.is_action:
             assert isinstance(card, Action)
-            self.actions_played_this_turn += 1
-            card.play(player=self, game=game, generic_play=generic_play)
-            game.effect_registry.on_play(self, card, game)
-        elif CardType.Treasure in card.type:
+            self._play_action(card, game, generic_play)
+        elif card.is_treasure:
             assert isinstance(card, Treasure)
             card.play(player=self, game=game)
             game.effect_registry.on_play(self, card, game)
         else:
             raise InvalidCardPlay(f"Unable to play {card} with type {card.type}")
 
+    def _play_action(self, card: Action, game: "Game", generic_play: bool) -> None:
+        self.actions_played_this_turn += 1
+
+        if not card.vanilla_play:
+            card.play(player=self, game=game, generic_play=generic_play)
+            game.effect_registry.on_play(self, card, game)
+            return
+
+        # same as Action.play, applied directly from the card's fields
+        logger.info("%s plays %s", self, card)
+        state = self.state
+        if generic_play:
+            if state.actions < 1:
+                raise InsufficientActions(
+                    f"{self.player_id}: Not enough actions to play {card.name}"
+                )
+            self.playmat.add(card)
+            self.hand.remove(card)
+            state.actions -= 1
+
+        if card.draw > 0:
+            self.draw(card.draw)
+        state.actions += card.actions
+        state.money += card.money
+        state.buys += card.buys
+
+        registry = game.effect_registry
+        if len(registry.get_card_effects("play", card.name)) > 0:
+            registry.on_play(self, card, game)
+
+    def play_treasures(self, cards: List[Card], game: "Game") -> None:
+        """
+        Play several cards from the player's hand in order.
+
+        Runs of treasures that use the default Treasure.play and have no play
+        effects registered for them are moved to the playmat together and
+        their money is added at once. Other cards are played one at a time
+        with exact_play.
+
+        """
+        registry = game.effect_registry
+        batch: List[Card] = []
+        for card in cards:
+            if (
+                card.is_treasure
+                and type(card).play is Treasure.play
+                and len(registry.get_card_effects("play", card.name)) == 0
+            ):
+                batch.append(card)
+                continue
+
+            if len(batch) > 0:
+                self._play_treasure_batch(batch)
+                batch = []
+            self.exact_play(card, game)
+
+        if len(batch) > 0:
+            self._play_treasure_batch(batch)
+
+    def _play_treasure_batch(self, cards: List[Card]) -> None:
+        self.hand.remove_cards(cards)
+        self.playmat.add_cards(cards)
+        self.state.money += sum(card.money for card in cards)
+
     def multi_play(self, card: Card, game: "Game", state: Any, generic_play: bool = True) -> Any:
         """
         Similar to previous exact_play method, except card's multi_play method is called.
         This method is necessary when playing "Throne Room variants".
 
         """
-        if CardType.Action in card.type:
+        if card.is_action:
             assert isinstance(card, Action)
             self.actions_played_this_turn += 1
             state = card.multi_play(player=self, game=game, state=state, generic_play=generic_play)
@@ -195,7 +271,8 @@ class Player:
 
         """
         assert isinstance(card, Card)
-        if card.get_cost(self, game) > self.state.money:
+        cost = card.get_cost(self, game)
+        if cost > self.state.money:
             raise InsufficientMoney(
                 f"{self.player_id}: Not enough money to buy {card.name}"
             )
@@ -207,11 +284,12 @@ class Player:
             game.supply.gain_card(card)
         except EmptyPile as e:
             raise e
-        self.state.money -= card.get_cost(self, game)
+        self.state.money -= cost
         self.state.buys -= 1
         self.discard_pile.add(card)
+        game.scoreboard.add_card(self, card)
         game.effect_registry.on_buy(self, card, game)
-        logger.info(f"{self} buys {card}")
+        logger.info("%s buys %s", self, card)
 
     def gain(
         self,
@@ -232,8 +310,9 @@ class Player:
 
         gain_card = source.remove(card)
         destination.add(gain_card)
+        game.scoreboard.add_card(self, gain_card)
         game.effect_registry.on_gain(self, card, game)
-        logger.info(f"{self} gains {gain_card}")
+        logger.info("%s gains %s", self, gain_card)
 
     def trash(
         self, target_card: Card, game: "Game", source: Optional[AbstractDeck] = None
@@ -249,6 +328,9 @@ class Player:
         for card in source.cards:
             if card == target_card:
                 game.trash.add(source.remove(card))
+                if not isinstance(source, Pile):
+                    # trashing from the supply does not change what the player owns
+                    game.scoreboard.remove_card(self, card)
                 game.effect_registry.on_trash(self, card, game)
                 logger.info(f"{self} trashes {card}")
 
@@ -261,10 +343,10 @@ class Player:
         """
         if isinstance(cards, Card):
             cards = [cards]
-        if message is None:
-            message = f"{self} reveals "
-
-        logger.info(message + ", ".join(card.name for card in cards))
+        if logger.isEnabledFor(logging.INFO):
+            if message is None:
+                message = f"{self} reveals "
+            logger.info(message + ", ".join(card.name for card in cards))
         for card in cards:
             game.effect_registry.on_reveal(self, card, game)
 
@@ -283,9 +365,9 @@ class Player:
         game.current_phase = game.Phase.Action
 
         while self.state.actions > 0:
-            logger.info(f"{self.player_id}'s hand: {self.hand}")
+            logger.info("%s's hand: %s", self.player_id, self.hand)
 
-            viable_actions = [card for card in self.hand.cards if CardType.Action in card.type]
+            viable_actions = [card for card in self.hand.cards if card.is_action]
             if not viable_actions:
                 return
 
@@ -298,32 +380,29 @@ class Player:
     def start_treasure_phase(self, game: "Game") -> None:
         game.current_phase = game.Phase.Buy
 
-        viable_treasures = [card for card in self.hand.cards if CardType.Treasure in card.type]
+        viable_treasures = [card for card in self.hand.cards if card.is_treasure]
         while len(viable_treasures) > 0:
-            logger.info(f"Hand: {self.hand}")
+            logger.info("Hand: %s", self.hand)
 
             cards = self.decider.treasure_phase_decision(viable_treasures, self, game)
             if len(cards) == 0:
                 break
 
-            for card in cards:
-                self.exact_play(card, game)
-            cards_str = ", ".join([str(c) for c in cards])
-            logger.info(f"{self.player_id} played {cards_str}")
+            self.play_treasures(cards, game)
+            if logger.isEnabledFor(logging.INFO):
+                cards_str = ", ".join([str(c) for c in cards])
+                logger.info(f"{self.player_id} played {cards_str}")
 
-            viable_treasures = [card for card in self.hand.cards if CardType.Treasure in card.type]
+            viable_treasures = [card for card in self.hand.cards if card.is_treasure]
 
     def start_buy_phase(self, game: "Game") -> None:
         while self.state.buys > 0:
-            logger.info(game.supply.get_pretty_string(self, game))
-            logger.info(f"Money: {self.state.money}")
-            logger.info(f"Buys: {self.state.buys}")
-
-            valid_cards = [
-                c
-                for c in game.supply.available_cards()
-                if c.get_cost(self, game) <= self.state.money
-            ]
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(game.supply.get_pretty_string(self, game))
+                logger.info(f"Money: {self.state.money}")
+                logger.info(f"Buys: {self.state.buys}")
+
+            valid_cards = game.supply.available_cards_up_to_cost(self.state.money, self, game)
             card = self.decider.buy_phase_decision(
                 valid_cards=valid_cards,
                 player=self,
@@ -344,12 +423,17 @@ class Player:
         game.current_phase = game.Phase.CleanUp
         game.effect_registry.on_cleanup_start(self, game)
 
-        hand_copy = self.hand.cards[:]
-        for card in hand_copy:
-            self.discard(game, card, silent=True)
-        playmat_copy = self.playmat.cards[:]
-        for card in playmat_copy:
-            self.discard(game, card, self.playmat, silent=True)
+        if len(game.effect_registry.discard_effects) == 0:
+            # nothing reacts to discarding so move the cards all at once
+            self.hand.move_to(self.discard_pile)
+            self.playmat.move_to(self.discard_pile)
+        else:
+            hand_copy = self.hand.cards[:]
+            for card in hand_copy:
+                self.discard(game, card, silent=True)
+            playmat_copy = self.playmat.cards[:]
+            for card in playmat_copy:
+                self.discard(game, card, self.playmat, silent=True)
         self.draw(5)
         self.state.actions = 1
         self.state.money = 0
@@ -359,7 +443,7 @@ class Player:
         game.effect_registry.on_turn_start(self, game)
 
         self.start_turn()
-        logger.info(f"\nTurn {self.turns} - {self.player_id}")
+        logger.info("\nTurn %s - %s", self.turns, self.player_id)
         self.start_action_phase(game)
         self.start_treasure_phase(game)
         self.start_buy_phase(game)
@@ -373,7 +457,7 @@ class Player:
 
         """
         all_cards = (
-            self.deck.cards
+            self.deck.get_cards_unordered()
             + self.discard_pile.cards
             + self.playmat.cards
             + self.hand.cards
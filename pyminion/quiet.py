@@ -0,0 +1,67 @@
+from typing import List, Optional
+
+from pyminion.core import Card
+from pyminion.game import Game
+from pyminion.player import Player
+
+
+class QuietGame(Game):
+    """
+    Logging-free game mode for simulations.
+
+    Plays exactly the same game as Game, with the same card logic, deciders
+    and GameResult, but never logs. Building log messages, in particular the
+    supply and hand strings logged every turn, is most of the cost of a bot
+    game, so the engine skips it: informational logging is switched off in
+    the thread running the game, and no log records are created.
+
+    Attributes:
+        players: List of players in the game.
+        expansions: List expansions (and their cards) eligible to be used in the game's supply.
+        kingdom_cards: Specify any specific cards to be used in the supply.
+        start_deck: List of cards each player will start the game with. Default = [7 Coppers + 3 Estates].
+        random_order: If True, scrambles the order of players (to offset first player advantage).
+        lazy_shuffle: If True, player decks are shuffled lazily, one card per draw.
+        seed: If set, the game's random number generator is seeded with it when the game starts.
+
+    """
+
+    log_enabled = False
+
+    def __init__(
+        self,
+        players: List[Player],
+        expansions: List[List[Card]],
+        kingdom_cards: Optional[List[Card]] = None,
+        start_deck: Optional[List[Card]] = None,
+        random_order: bool = True,
+        lazy_shuffle: bool = False,
+        seed: Optional[int] = None,
+    ):
+        super().__init__(
+            players=players,
+            expansions=expansions,
+            kingdom_cards=kingdom_cards,
+            start_deck=start_deck,
+            random_order=random_order,
+            log_stdout=False,
+            log_file=False,
+            lazy_shuffle=lazy_shuffle,
+            seed=seed,
+        )
+
+    @classmethod
+    def from_game(cls, game: Game) -> "QuietGame":
+        """
+        Create a quiet game with the same players and setup as an unstarted game.
+
+        """
+        return cls(
+            players=list(game.players),
+            expansions=game.expansions,
+            kingdom_cards=game.kingdom_cards,
+            start_deck=game.start_deck,
+            random_order=game.random_order,
+            lazy_shuffle=game.lazy_shuffle,
+            seed=game.seed,
+        )
@@ -26,6 +26,8 @@ class PlayerSummary:
 
     """
 
+    __slots__ = ("player", "result", "score", "turns", "shuffles", "turn_order", "deck")
+
     player: "Player"
     result: GameOutcome
     score: int
@@ -67,6 +69,8 @@ class GameResult:
 
     """
 
+    __slots__ = ("game", "winners", "turns", "player_summaries")
+
     game: "Game"
     winners: List["Player"]
     turns: int
@@ -87,6 +91,8 @@ class GameResult:
 
 @dataclass
 class PlayerSimulatorResult:
+    __slots__ = ("player", "wins", "losses", "ties")
+
     player: "Player"
     wins: int
     losses: int
@@ -100,6 +106,8 @@ class SimulatorResult:
 
     """
 
+    __slots__ = ("iterations", "game_results", "player_results")
+
     iterations: int
     game_results: List[GameResult]
     player_results: List[PlayerSimulatorResult]
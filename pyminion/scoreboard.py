@@ -0,0 +1,156 @@
+from typing import TYPE_CHECKING, Dict, List, Set
+
+from pyminion.core import Card, ScoreCard
+
+if TYPE_CHECKING:
+    from pyminion.player import Player
+
+
+class PlayerScore:
+    """
+    Card counts and victory points of a single player, updated as the
+    player gains and loses cards.
+
+    Each score card's contribution is recomputed only when the count of a
+    card listed in its score_dependencies changes.
+
+    """
+
+    __slots__ = (
+        "counts", "total_count", "victory_points",
+        "_score_cards", "_terms", "_dependents", "_total_dependents",
+    )
+
+    def __init__(self, player: "Player"):
+        self.counts: Dict[str, int] = {}
+        self.total_count = 0
+        self.victory_points = 0
+
+        # a card for each score card name the player has owned
+        self._score_cards: Dict[str, ScoreCard] = {}
+
+        # victory points contributed by all copies of each score card
+        self._terms: Dict[str, int] = {}
+
+        # score card names whose score depends on the count of a card name,
+        # or on the total number of cards
+        self._dependents: Dict[str, Set[str]] = {}
+        self._total_dependents: Set[str] = set()
+
+        for card in player.get_all_cards():
+            self.counts[card.name] = self.counts.get(card.name, 0) + 1
+            self.total_count += 1
+            self._track_score_card(card)
+
+        for name in self._score_cards:
+            self._update_term(player, name)
+
+    def _track_score_card(self, card: Card) -> None:
+        if card.name in self._score_cards or not (card.is_victory or card.is_curse):
+            return
+
+        assert isinstance(card, ScoreCard)
+        self._score_cards[card.name] = card
+        for dependency in card.score_dependencies:
+            if dependency == ScoreCard.ALL_CARDS:
+                self._total_dependents.add(card.name)
+            else:
+                self._dependents.setdefault(dependency, set()).add(card.name)
+
+    def _update_term(self, player: "Player", name: str) -> None:
+        count = self.counts.get(name, 0)
+        if count > 0:
+            card = self._score_cards[name]
+            term = count * card.score_from_counts(player, self.counts, self.total_count)
+        else:
+            term = 0
+        self.victory_points += term - self._terms.get(name, 0)
+        self._terms[name] = term
+
+    def change_count(self, player: "Player", card: Card, delta: int) -> None:
+        name = card.name
+        count = self.counts.get(name, 0) + delta
+        if count > 0:
+            self.counts[name] = count
+        else:
+            self.counts.pop(name, None)
+        self.total_count += delta
+
+        self._track_score_card(card)
+        if name in self._score_cards:
+            self._update_term(player, name)
+        for dependent in self._dependents.get(name, ()):
+            self._update_term(player, dependent)
+        for dependent in self._total_dependents:
+            self._update_term(player, dependent)
+
+
+class Scoreboard:
+    """
+    Live victory point totals for the players in a game.
+
+    A player's score is built from their cards the first time it is asked
+    for and then kept up to date as cards are gained, trashed or passed, so
+    deciders can check scores cheaply.
+
+    """
+
+    __slots__ = ("players", "_scores")
+
+    def __init__(self, players: List["Player"]):
+        self.players = players
+        self._scores: Dict["Player", PlayerScore] = {}
+
+    def reset(self) -> None:
+        """
+        Drop all tracked scores. They are rebuilt from the players' cards on
+        the next query.
+
+        """
+        self._scores.clear()
+
+    def get_player_score(self, player: "Player") -> PlayerScore:
+        score = self._scores.get(player)
+        if score is None:
+            score = PlayerScore(player)
+            self._scores[player] = score
+        return score
+
+    def get_victory_points(self, player: "Player") -> int:
+        return self.get_player_score(player).victory_points
+
+    def get_card_count(self, player: "Player", card_name: str) -> int:
+        return self.get_player_score(player).counts.get(card_name, 0)
+
+    def get_total_card_count(self, player: "Player") -> int:
+        return self.get_player_score(player).total_count
+
+    def get_lead(self, player: "Player") -> int:
+        """
+        Get the player's victory points minus the highest victory points of
+        their opponents. Negative if the player is behind.
+
+        """
+        victory_points = self.get_victory_points(player)
+        opponent_points = [self.get_victory_points(p) for p in self.players if p is not player]
+        if len(opponent_points) == 0:
+            return 0
+        return victory_points - max(opponent_points)
+
+    def add_card(self, player: "Player", card: Card) -> None:
+        """
+        Record that the player has come to own a card.
+
+        """
+        score = self._scores.get(player)
+        if score is not None:
+            score.change_count(player, card, 1)
+
+    def remove_card(self, player: "Player", card: Card) -> None:
+        """
+        Record that the player no longer owns a card.
+
+        """
+        score = self._scores.get(player)
+        if score is not None:
+            score.change_count(player, card, -1)
@@ -1,12 +1,14 @@
 import copy
-import logging
-from typing import Dict, List
+import gc
+from typing import Dict, List, Union
 
-from pyminion.game import Game
+from pyminion.fast import FastGame
+from pyminion.game import Game, GameTemplate
 from pyminion.player import Player
+from pyminion.quiet import QuietGame
 from pyminion.result import GameResult, PlayerSimulatorResult, SimulatorResult
-
-logger = logging.getLogger()
+from pyminion.spec import GameSpec
+from pyminion.log import logger
 
 
 def get_percent(occurrence: int, total: int) -> float:
@@ -22,51 +24,130 @@ class Simulator:
     Simulate multiple games of dominion and compute statistics
 
     Attributes:
-        game: pyminion game instance.
+        game: pyminion game instance, or a game spec to build a new game from
+            for every iteration. Games built from a spec share no state. Each
+            iteration plays a copy of a game instance, and iteration i of a
+            seeded game uses seed + i.
         iterations: number of times the game will be simulated.
+        use_template: If True, the game is set up once and every iteration resets it
+            to that setup. The kingdom is then the same for all iterations.
+        gc_interval: Number of games between garbage collections while simulating.
+            Automatic collection is paused during the run. 0 leaves the garbage collector alone.
+        quiet: If True, games are played as QuietGame, which plays the same
+            games without logging.
+        fast: If True, games are played as FastGame, which plays the same
+            games without logging, keeping the cards as arrays of card ids.
 
     """
 
-    def __init__(self, game: Game, iterations: int = 100):
+    def __init__(
+        self,
+        game: Union[Game, GameSpec],
+        iterations: int = 100,
+        use_template: bool = False,
+        gc_interval: int = 100,
+        quiet: bool = False,
+        fast: bool = False,
+    ):
         self.game = game
         self.iterations = iterations
+        self.use_template = use_template
+        self.gc_interval = gc_interval
+        self.quiet = quiet
+        self.fast = fast
         self.results: List[GameResult] = []
 
+        # players that results are reported for. Games built from a spec have
+        # their own players, which are mapped to these by their position in the spec
+        if isinstance(game, GameSpec):
+            self.players = game.build_players()
+        else:
+            self.players = game.players
+        self._result_players: List[List[Player]] = []
+
     def run(self) -> SimulatorResult:
-        logger.info(f"Simulating {self.iterations} games...")
-        for _ in range(self.iterations):
-            game = copy.copy((self.game))
-            result = game.play()
-            self.results.append(result)
+        logger.info("Simulating %s games...", self.iterations)
+
+        spec = self.game if isinstance(self.game, GameSpec) else None
+        if spec is not None:
+            game = None
+            template = None
+        else:
+            game = self._from_game(self.game)
+            template = GameTemplate(game) if self.use_template else None
+
+        gc_was_enabled = gc.isenabled()
+        if self.gc_interval > 0:
+            gc.disable()
+        try:
+            for i in range(self.iterations):
+                if spec is not None:
+                    players = spec.build_players()
+                    built_game = self._from_game(spec.build(i, players))
+                    result = built_game.play()
+                    self._result_players.append(players)
+                elif template is not None:
+                    result = template.play()
+                else:
+                    # each copy has its own seat order, so the template's players are not shuffled
+                    game_copy = copy.copy(game)
+                    game_copy.players = list(game.players)
+                    if game.seed is not None:
+                        game_copy.seed = game.seed + i
+                    result = game_copy.play()
+                self.results.append(result)
+
+                if self.gc_interval > 0 and (i + 1) % self.gc_interval == 0:
+                    # games are short lived, so the young generations hold most of their garbage
+                    gc.collect(1)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
 
         return self.get_sim_result()
 
+    def _from_game(self, game: Game) -> Game:
+        """
+        Get the game to play for a game, in the engine chosen by fast and quiet.
+
+        """
+        if self.fast:
+            return FastGame.from_game(game)
+        if self.quiet:
+            return QuietGame.from_game(game)
+        return game
+
     def get_sim_result(self) -> SimulatorResult:
 
         # make temp hashmap to store player sim results
         player_results: Dict[Player, PlayerSimulatorResult] = {}
 
         # initialize each player result with default values
-        for player in self.game.players:
+        for player in self.players:
             player_results[player] = PlayerSimulatorResult(
                 player=player, wins=0, losses=0, ties=0
             )
 
         # iterate through each simulated game to determine win record
-        for result in self.results:
+        for i, result in enumerate(self.results):
+            if i < len(self._result_players):
+                seat_of = {id(p): seat for seat, p in enumerate(self._result_players[i])}
+                winners = [self.players[seat_of[id(p)]] for p in result.winners]
+            else:
+                winners = result.winners
 
             # single player wins
-            if len(result.winners) == 1:
-                player_results[result.winners[0]].wins += 1
+            if len(winners) == 1:
+                player_results[winners[0]].wins += 1
 
             # multiple players tie
             else:
-                for player in result.winners:
+                for player in winners:
                     player_results[player].ties += 1
 
             # rest of players are losers
-            for player in self.game.players:
-                if player not in result.winners:
+            for player in self.players:
+                if player not in winners:
                     player_results[player].losses += 1
 
         player_results_final: List[PlayerSimulatorResult] = list(
@@ -0,0 +1,198 @@
+from enum import Enum
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, Union
+
+from pyminion.core import Card
+from pyminion.exceptions import InvalidGameSetup
+from pyminion.expansions.base import base_set, copper, curse, duchy, estate, gold, province, silver
+from pyminion.expansions.intrigue import intrigue_set
+from pyminion.game import Game
+from pyminion.player import Player
+
+# card lists of the expansions a spec can name
+EXPANSIONS: Dict[str, List[Card]] = {
+    "base": base_set,
+    "intrigue": intrigue_set,
+}
+
+BASIC_CARDS: List[Card] = [copper, silver, gold, estate, duchy, province, curse]
+
+_cards_by_name: Dict[str, Card] = {
+    card.name: card
+    for cards in [BASIC_CARDS, *EXPANSIONS.values()]
+    for card in cards
+}
+
+
+def get_card(name: str) -> Card:
+    """
+    Get the card instance with the given name from the basic cards or any
+    known expansion. Raises KeyError if there is no such card.
+
+    """
+    return _cards_by_name[name]
+
+
+def get_expansion_name(expansion: List[Card]) -> str:
+    for name, cards in EXPANSIONS.items():
+        if cards is expansion:
+            return name
+    raise InvalidGameSetup(f"Invalid game setup: unknown expansion {expansion}")
+
+
+def _card_names(cards: Optional[Sequence[Union[Card, str]]]) -> Optional[Tuple[str, ...]]:
+    if cards is None:
+        return None
+    return tuple(card if isinstance(card, str) else card.name for card in cards)
+
+
+class SeatPolicy(Enum):
+    """
+    How players are seated when a game is built from a spec.
+
+    Fixed keeps the order of the players in the spec. Random shuffles the
+    players when the game starts. Rotate rotates the players in the spec by
+    the index of the game, so that over a series of games every player
+    starts the same number of times.
+
+    """
+
+    Fixed = 0
+    Random = 1
+    Rotate = 2
+
+
+class PlayerSpec:
+    """
+    A player class and the keyword arguments to construct it with.
+
+    """
+
+    __slots__ = ("player_class", "kwargs")
+
+    def __init__(self, player_class: Type[Player], **kwargs: Any):
+        self.player_class = player_class
+        self.kwargs = kwargs
+
+    def __repr__(self):
+        return f"PlayerSpec({self.player_class.__name__}, {self.kwargs})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PlayerSpec):
+            return NotImplemented
+        return self.player_class is other.player_class and self.kwargs == other.kwargs
+
+    def build(self) -> Player:
+        return self.player_class(**self.kwargs)
+
+
+class GameSpec:
+    """
+    Declarative description of a game that can be pickled and sent to other
+    processes.
+
+    Cards and expansions are stored by name, so building a game from the
+    spec resolves them to the card instances of the process it is built in.
+    Every call to build creates new players and a new game that share no
+    state with any other game.
+
+    Attributes:
+        players: Players of the game. Bot classes that take no arguments can
+            be passed as classes.
+        expansions: Names of the expansions the kingdom is chosen from.
+        kingdom_cards: Names of kingdom cards that must be in the supply.
+        start_deck: Names of the cards each player starts with.
+        seat_policy: How the players are seated.
+        seed: Seed for the game's random numbers. Game i built from the
+            spec uses seed + i.
+
+    """
+
+    def __init__(
+        self,
+        players: Sequence[Union[PlayerSpec, Type[Player]]],
+        expansions: Sequence[str] = ("base",),
+        kingdom_cards: Optional[Sequence[Union[Card, str]]] = None,
+        start_deck: Optional[Sequence[Union[Card, str]]] = None,
+        seat_policy: SeatPolicy = SeatPolicy.Random,
+        seed: Optional[int] = None,
+        log_stdout: bool = False,
+        lazy_shuffle: bool = False,
+    ):
+        self.players = tuple(
+            p if isinstance(p, PlayerSpec) else PlayerSpec(p) for p in players
+        )
+        for expansion in expansions:
+            if expansion not in EXPANSIONS:
+                raise InvalidGameSetup(f"Invalid game setup: unknown expansion {expansion}")
+        self.expansions = tuple(expansions)
+        self.kingdom_cards = _card_names(kingdom_cards) or ()
+        self.start_deck = _card_names(start_deck)
+        self.seat_policy = seat_policy
+        self.seed = seed
+        self.log_stdout = log_stdout
+        self.lazy_shuffle = lazy_shuffle
+
+    def __repr__(self):
+        return (
+            f"GameSpec(players={list(self.players)}, expansions={list(self.expansions)}, "
+            f"kingdom_cards={list(self.kingdom_cards)}, seat_policy={self.seat_policy.name}, "
+            f"seed={self.seed})"
+        )
+
+    @classmethod
+    def from_game(cls, game: Game, seed: Optional[int] = None) -> "GameSpec":
+        """
+        Create a spec describing an unstarted game. The players are described
+        by their class and player id, so they must be constructible from
+        player_id alone.
+
+        """
+        players = [PlayerSpec(type(player), player_id=player.player_id) for player in game.players]
+        return cls(
+            players=players,
+            expansions=[get_expansion_name(expansion) for expansion in game.expansions],
+            kingdom_cards=game.kingdom_cards,
+            start_deck=game.start_deck,
+            seat_policy=SeatPolicy.Random if game.random_order else SeatPolicy.Fixed,
+            seed=seed,
+            lazy_shuffle=game.lazy_shuffle,
+        )
+
+    def build_players(self) -> List[Player]:
+        """
+        Build new players in the order of the spec.
+
+        """
+        return [player.build() for player in self.players]
+
+    def build(self, game_index: int = 0, players: Optional[List[Player]] = None) -> Game:
+        """
+        Build a new, unstarted game from the spec.
+
+        Args:
+            game_index: Index of the game in a series of games built from the
+                spec. Used to rotate seats and derive the game's seed.
+            players: Players built with build_players to use instead of
+                building new ones.
+
+        """
+        if players is None:
+            players = self.build_players()
+        if self.seat_policy == SeatPolicy.Rotate and len(players) > 0:
+            offset = game_index % len(players)
+            players = players[offset:] + players[:offset]
+
+        start_deck = None
+        if self.start_deck is not None:
+            start_deck = [get_card(name) for name in self.start_deck]
+
+        return Game(
+            players=players,
+            expansions=[EXPANSIONS[name] for name in self.expansions],
+            kingdom_cards=[get_card(name) for name in self.kingdom_cards],
+            start_deck=start_deck,
+            random_order=self.seat_policy == SeatPolicy.Random,
+            log_stdout=self.log_stdout,
+            lazy_shuffle=self.lazy_shuffle,
+            seed=None if self.seed is None else self.seed + game_index,
+        )
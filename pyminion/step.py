@@ -0,0 +1,237 @@
+import inspect
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence
+
+from pyminion.core import Card
+from pyminion.decider import Decider
+from pyminion.log import logging_disabled
+from pyminion.player import Player
+
+if TYPE_CHECKING:
+    from pyminion.game import Game
+    from pyminion.undo import GameMark
+
+
+# argument holding the cards to choose from, for decisions that do not call it valid_cards
+_VALID_CARDS_ARGS = {
+    "action_phase": "valid_actions",
+    "treasure_phase": "valid_treasures",
+}
+
+_signatures: Dict[str, inspect.Signature] = {}
+
+
+def _get_signature(name: str) -> inspect.Signature:
+    signature = _signatures.get(name)
+    if signature is None:
+        signature = inspect.signature(getattr(Decider, name))
+        _signatures[name] = signature
+    return signature
+
+
+class DecisionRequest:
+    """
+    A decision a player has to make before a stepped game can continue.
+
+    type is the name of the Decider method asked, without "_decision", and
+    args are the arguments it was called with, apart from the player and
+    game. The answer to a request is what the Decider method would return.
+
+    For decisions that choose cards, valid_cards are the cards to choose
+    from. For decisions that choose options, options are the options to
+    choose from by index. min_num and max_num are the number of cards or
+    options to choose, or None if the answer is not a choice (a binary
+    decision or a deck position).
+
+    """
+
+    __slots__ = ("player", "type", "args", "valid_cards", "options", "min_num", "max_num")
+
+    def __init__(self, player: Player, type: str, args: Dict[str, Any]):
+        self.player = player
+        self.type = type
+        self.args = args
+        self.valid_cards: Optional[List[Card]] = args.get(_VALID_CARDS_ARGS.get(type, "valid_cards"))
+        self.options: Optional[Sequence[Any]] = None
+        self.min_num: Optional[int] = None
+        self.max_num: Optional[int] = None
+
+        if type in ("action_phase", "buy_phase"):
+            self.min_num, self.max_num = 0, 1
+        elif type == "treasure_phase":
+            assert self.valid_cards is not None
+            self.min_num, self.max_num = 0, len(self.valid_cards)
+        elif type == "effects_order":
+            self.options = args["effects"]
+            self.min_num, self.max_num = 1, 1
+        elif type == "multiple_option":
+            self.options = args["options"]
+            self.min_num, self.max_num = args["num_choices"], args["num_choices"]
+        elif type == "multi_play":
+            self.min_num, self.max_num = (1 if args["required"] else 0), 1
+        elif self.valid_cards is not None:
+            verb = type.split("_")[0]
+            self.min_num = args[f"min_num_{verb}"]
+            max_num = args[f"max_num_{verb}"]
+            self.max_num = len(self.valid_cards) if max_num == -1 else min(max_num, len(self.valid_cards))
+
+    def __repr__(self):
+        return f"DecisionRequest({self.player.player_id}, {self.type}, {self.args})"
+
+    @property
+    def prompt(self) -> Optional[str]:
+        return self.args.get("prompt")
+
+    @property
+    def card(self) -> Optional[Card]:
+        return self.args.get("card")
+
+
+class _Paused(BaseException):
+    """
+    Raised through the engine to stop a turn at a decision that has no
+    answer yet. Derives from BaseException so that no card logic catches it.
+
+    """
+
+    def __init__(self, request: DecisionRequest):
+        super().__init__(request)
+        self.request = request
+
+
+class _StepDecider:
+    """
+    Stands in for a player's decider while a game is stepped.
+
+    """
+
+    def __init__(self, stepper: "GameStepper", player: Player, decider: Decider):
+        self.stepper = stepper
+        self.player = player
+        self.decider = decider
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self.decider, name)
+        if not name.endswith("_decision"):
+            return attr
+
+        def decide(*args: Any, **kwargs: Any) -> Any:
+            return self.stepper.decide(self, name, args, kwargs)
+
+        return decide
+
+
+class GameStepper:
+    """
+    Plays a game one decision at a time.
+
+    Decisions of the stepped players are returned as requests instead of
+    being asked from their deciders, and the game continues when a request
+    is answered. Decisions of the other players are made by their deciders
+    as usual.
+
+    Card logic asks for decisions in the middle of playing a card, so the
+    engine cannot simply be suspended there. Instead the stepper marks the
+    game at the start of each turn and records the answers given during
+    the turn. When a decision without an answer comes up, the turn is
+    stopped. When it is answered, the game is undone to the start of the
+    turn and the turn is played again with the recorded answers, up to the
+    next decision. Deciders are asked each decision only once, and since
+    the game's random number generator is restored, the replayed turn is
+    the same. A turn with n decisions is played n times, which is cheap
+    next to the work of the caller deciding.
+
+    Stepped games do not log, as replaying turns would log them repeatedly.
+
+    """
+
+    def __init__(self, game: "Game", players: Optional[Sequence[Player]] = None):
+        self.game = game
+        self.players: List[Player] = list(game.players if players is None else players)
+        self.request: Optional[DecisionRequest] = None
+
+        self._deciders: Dict[Player, Decider] = {}
+        self._turn_index = 0
+        self._turn_mark: Optional["GameMark"] = None
+        self._answers: List[Any] = []
+        self._replay_index = 0
+
+    def start(self) -> Optional[DecisionRequest]:
+        """
+        Start the game and play it up to the first decision of a stepped
+        player. Returns the request for that decision, or None if the game
+        ended without one.
+
+        """
+        game = self.game
+        with logging_disabled():
+            game.start()
+        for player in game.players:
+            self._deciders[player] = player.decider
+            player.decider = _StepDecider(self, player, player.decider)
+
+        self._start_turn(0)
+        return self._run()
+
+    def step(self, answer: Any) -> Optional[DecisionRequest]:
+        """
+        Answer the pending request and play on to the next decision of a
+        stepped player. Returns the request for that decision, or None once
+        the game is over.
+
+        """
+        if self.request is None:
+            raise ValueError("There is no decision to answer")
+        assert self._turn_mark is not None
+
+        self._answers.append(answer)
+        self.game.undo_to(self._turn_mark)
+        return self._run()
+
+    def decide(self, step_decider: _StepDecider, name: str, args: Sequence[Any], kwargs: Dict[str, Any]) -> Any:
+        if self._replay_index < len(self._answers):
+            answer = self._answers[self._replay_index]
+        else:
+            player = step_decider.player
+            if player in self.players:
+                bound = _get_signature(name).bind(None, *args, **kwargs)
+                bound.apply_defaults()
+                decision_args = dict(bound.arguments)
+                for arg in ("self", "player", "game"):
+                    del decision_args[arg]
+                raise _Paused(DecisionRequest(player, name[:-len("_decision")], decision_args))
+
+            answer = getattr(step_decider.decider, name)(*args, **kwargs)
+            self._answers.append(answer)
+
+        self._replay_index += 1
+        # card logic may change a returned list, so each replay gets its own copy
+        return list(answer) if isinstance(answer, list) else answer
+
+    def _start_turn(self, turn_index: int) -> None:
+        self._turn_index = turn_index
+        self._answers = []
+        self._turn_mark = self.game.mark()
+
+    def _run(self) -> Optional[DecisionRequest]:
+        game = self.game
+        with logging_disabled():
+            while True:
+                self._replay_index = 0
+                player = game.players[self._turn_index]
+                try:
+                    player.take_turn(game)
+                except _Paused as paused:
+                    self.request = paused.request
+                    return self.request
+
+                game.card_cost_reduction = 0
+                if game.is_over():
+                    self._finish()
+                    return None
+                self._start_turn((self._turn_index + 1) % len(game.players))
+
+    def _finish(self) -> None:
+        self.request = None
+        self.game.clear_marks()
+        for player, decider in self._deciders.items():
+            player.decider = decider
@@ -0,0 +1,96 @@
+import itertools
+from typing import TYPE_CHECKING, Any, List, Tuple
+
+if TYPE_CHECKING:
+    from pyminion.core import AbstractDeck
+
+# epochs are shared by all logs, so a deck that was saved under an earlier log
+# is never taken as saved by a later one
+_epochs = itertools.count()
+
+
+class UndoLog:
+    """
+    Log of the changes made to decks, so they can be undone back to a mark.
+
+    A deck saves its cards to the log the first time it changes after each
+    mark, and not again until the next mark. Exploring a move therefore
+    copies only the decks the move touches, once each, however many cards
+    it moves.
+
+    """
+
+    __slots__ = ("_entries", "_epoch")
+
+    def __init__(self):
+        self._entries: List[Tuple["AbstractDeck", Any]] = []
+
+        # moved on by every mark and undo. A deck is saved again once the epoch has
+        # moved on since it was last saved
+        self._epoch = next(_epochs)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def save(self, deck: "AbstractDeck") -> None:
+        """
+        Save a deck's cards before it changes, unless they were already saved
+        since the last mark.
+
+        """
+        if deck._undo_epoch != self._epoch:
+            deck._undo_epoch = self._epoch
+            self._entries.append((deck, deck.snapshot()))
+
+    def mark(self) -> int:
+        """
+        Mark the current state and return the mark's position in the log.
+
+        """
+        self._epoch = next(_epochs)
+        return len(self._entries)
+
+    def undo_to(self, position: int) -> None:
+        """
+        Restore all decks to their state when the mark at position was made.
+        Marks made after it can no longer be undone to.
+
+        """
+        if position > len(self._entries):
+            raise ValueError(f"Cannot undo to position {position}, the log has {len(self._entries)} entries")
+
+        entries = self._entries
+        while len(entries) > position:
+            deck, snapshot = entries.pop()
+            deck.restore(snapshot)
+        self._epoch = next(_epochs)
+
+
+class GameMark:
+    """
+    A state of a game that it can be undone to with Game.undo_to.
+
+    Decks are restored from the game's undo log. The game's and players'
+    other state is small, so it is captured in full when the mark is made.
+
+    """
+
+    __slots__ = ("position", "rng_state", "phase", "cost_reduction", "effects", "players")
+
+    def __init__(
+        self,
+        position: int,
+        rng_state: Any,
+        phase: Any,
+        cost_reduction: int,
+        effects: List[list],
+        players: List[Tuple[int, int, int, int, int, int]],
+    ):
+        self.position = position
+        self.rng_state = rng_state
+        self.phase = phase
+        self.cost_reduction = cost_reduction
+        self.effects = effects
+
+        # actions, money, buys, turns, shuffles and actions played this turn of each player
+        self.players = players
@@ -26,4 +26,7 @@ setuptools.setup(
         )
     ),
     python_requires=">=3.8",
+    extras_require={
+        "batch": ["numpy"],
+    },
 )
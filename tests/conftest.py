@@ -149,8 +149,7 @@ def game(request, player):
     game.supply = game._create_supply()
     for card in game.all_game_cards:
         card.set_up(game)
-    player.hand.on_add = lambda card, player=player: game.effect_registry.on_hand_add(player, card, game)
-    player.hand.on_remove = lambda card, player=player: game.effect_registry.on_hand_remove(player, card, game)
+    game.set_hand_callbacks(player)
     player.deck.on_shuffle = lambda player=player: game.effect_registry.on_shuffle(player, game)
 
     return game
@@ -1,4 +1,4 @@
-from pyminion.expansions.base import Silver, Copper, silver, copper
+from pyminion.expansions.base import Silver, Copper, silver, copper, estate, province
 from pyminion.expansions.intrigue import Masquerade, masquerade
 from pyminion.game import Game
 from pyminion.human import Human
@@ -48,3 +48,24 @@ def test_masquerade_trash(multiplayer_game: Game, monkeypatch):
 
     assert len(p2.hand) == 1
     assert type(p2.hand.cards[0]) is Copper
+
+
+def test_masquerade_pass_updates_scoreboard(multiplayer_game: Game, monkeypatch):
+    players = multiplayer_game.players
+    p1 = players[0]
+    p2 = players[1]
+
+    p1.hand.cards = [province, masquerade]
+    p2.hand.cards = [estate]
+
+    scoreboard = multiplayer_game.scoreboard
+    assert scoreboard.get_victory_points(p1) == p1.get_victory_points()
+    assert scoreboard.get_victory_points(p2) == p2.get_victory_points()
+
+    responses = iter(["province", "estate", "n"])
+    monkeypatch.setattr("builtins.input", lambda _: next(responses))
+
+    masquerade.play(p1, multiplayer_game)
+    assert p2.hand.cards == [province]
+    assert scoreboard.get_victory_points(p1) == p1.get_victory_points()
+    assert scoreboard.get_victory_points(p2) == p2.get_victory_points()
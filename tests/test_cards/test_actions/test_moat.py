@@ -53,3 +53,35 @@ def test_moat_no_block_witch(multiplayer_game: Game, monkeypatch):
         if p is not witch_player:
             assert len(p.discard_pile) == 1
             assert p.discard_pile.cards[-1] is curse
+
+
+@pytest.mark.kingdom_cards([moat])
+def test_moat_reaction_tracked_by_hand(multiplayer_game: Game):
+    reg = multiplayer_game.effect_registry
+    moat_effects = [e for e in reg.reaction_effects if e.get_card_names() == frozenset(["Moat"])]
+    assert len(moat_effects) == 1
+
+    moat_player = multiplayer_game.players[1]
+    moat_player.deck.add(moat)
+    moat_player.draw()
+
+    # drawing a moat does not register any attack effects
+    assert len(reg.attack_effects) == 0
+    assert moat_player.hand.get_reactions() == {"Moat": 1}
+
+    moat_player.hand.remove(moat)
+    assert moat_player.hand.get_reactions() == {}
+
+
+@pytest.mark.kingdom_cards([moat])
+def test_moat_not_in_hand_no_prompt(multiplayer_game: Game, monkeypatch):
+    witch_player = multiplayer_game.players[0]
+    witch_player.hand.add(witch)
+    moat_player = multiplayer_game.players[1]
+
+    def fail(_):
+        raise AssertionError("player without moat should not be prompted")
+
+    monkeypatch.setattr("builtins.input", fail)
+    witch_player.play(witch, multiplayer_game)
+    assert moat_player.discard_pile.cards[-1] is curse
@@ -1,5 +1,5 @@
 from pyminion.core import Action, CardType, Victory, get_action_cards, get_treasure_cards, get_victory_cards, get_score_cards
-from pyminion.expansions.base import gold, silver, copper, province, duchy, estate, curse, market, smithy
+from pyminion.expansions.base import gold, silver, copper, province, duchy, estate, curse, market, moat, smithy, witch
 from pyminion.expansions.intrigue import nobles
 from pyminion.game import Game
 from pyminion.player import Player
@@ -103,3 +103,46 @@ def test_victory_card_start_count_3_players(player: Player):
     game = Game(players, [])
 
     assert test_victory.get_pile_starting_count(game) == 12
+
+
+def test_card_type_mask():
+    assert nobles.type == (CardType.Action, CardType.Victory)
+    assert nobles.type_mask == CardType.Action | CardType.Victory
+    assert nobles.is_action and nobles.is_victory
+    assert not nobles.is_treasure and not nobles.is_curse
+
+    assert witch.is_action and witch.is_attack and not witch.is_reaction
+    assert moat.is_reaction
+    assert curse.is_curse and not curse.is_victory
+    assert copper.is_treasure and not copper.is_action
+
+    card = Action("test", 1, CardType.Action | CardType.Attack)
+    assert card.type == (CardType.Action, CardType.Attack)
+    assert card.is_attack
+
+
+def test_slotted_card_subclass():
+    assert not hasattr(test_action, "__dict__")
+
+    class CustomAction(Action):
+        def __init__(self):
+            super().__init__("Custom", 2, (CardType.Action,), money=1)
+            self.extra = 3
+
+    card = CustomAction()
+    assert card.money == 1
+    assert card.extra == 3
+    assert card.is_action
+
+
+def test_vanilla_play():
+    assert smithy.vanilla_play
+    assert market.vanilla_play
+    assert not nobles.vanilla_play
+    assert not witch.vanilla_play
+
+    class CustomPlay(Action):
+        def play(self, player, game, generic_play=True):
+            super().play(player, game, generic_play)
+
+    assert not CustomPlay("Custom", 2, (CardType.Action,)).vanilla_play
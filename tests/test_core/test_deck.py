@@ -1,5 +1,7 @@
-from pyminion.core import AbstractDeck, Card, Deck
-from pyminion.expansions.base import Copper, Estate, copper, estate
+from collections import Counter
+from pyminion.core import AbstractDeck, Card, Deck, Hand
+from pyminion.expansions.base import Copper, Estate, copper, estate, gold, moat, silver
+import random
 from typing import List
 
 NUM_COPPER = 7
@@ -119,3 +121,54 @@ def test_deck_on_shuffle():
     deck.shuffle()
     deck.shuffle()
     assert len(shuffles) == 3
+
+
+def test_lazy_shuffle_distribution():
+    random.seed(1)
+    tops: Counter = Counter()
+    for _ in range(3000):
+        deck = Deck([copper, silver, gold], lazy_shuffle=True)
+        deck.shuffle()
+        tops[deck.draw().name] += 1
+
+    for name in ("Copper", "Silver", "Gold"):
+        assert 900 < tops[name] < 1100
+
+
+def test_lazy_shuffle_draws_all_cards():
+    deck = Deck([copper] * 5 + [silver] * 3 + [gold] * 2, lazy_shuffle=True)
+    deck.shuffle()
+    deck.add(estate)
+
+    assert deck.draw() is estate
+    drawn = [deck.draw() for _ in range(10)]
+    assert Counter(drawn) == Counter([copper] * 5 + [silver] * 3 + [gold] * 2)
+    assert len(deck) == 0
+
+
+def test_lazy_shuffle_cards_settles_order():
+    deck = Deck([copper] * 5 + [silver] * 3 + [gold] * 2, lazy_shuffle=True)
+    deck.shuffle()
+    deck.remove(gold)
+    assert len(deck) == 9
+
+    cards = deck.cards[:]
+    assert Counter(cards) == Counter([copper] * 5 + [silver] * 3 + [gold])
+    for card in reversed(cards):
+        assert deck.draw() is card
+
+
+def test_hand_reactions():
+    hand = Hand([copper, moat])
+    assert hand.get_reactions() == {"Moat": 1}
+
+    hand.add(moat)
+    assert hand.get_reactions() == {"Moat": 2}
+
+    hand.remove(moat)
+    hand.remove(copper)
+    assert hand.get_reactions() == {"Moat": 1}
+
+    # replacing the card list directly is detected
+    hand.cards = [copper]
+    assert hand.get_reactions() == {}
@@ -0,0 +1,68 @@
+import logging
+
+import pytest
+
+from pyminion.bots.examples import BigMoney, BigMoneyUltimate
+from pyminion.differential import FuzzBot, compare_engines, describe, fuzz_engines, record_game
+from pyminion.expansions.base import copper, smithy
+from pyminion.game import Game
+from pyminion.quiet import QuietGame
+from pyminion.spec import GameSpec, PlayerSpec
+
+
+def lazy_shuffle_engine(game: Game) -> Game:
+    game.lazy_shuffle = True
+    return game
+
+
+spec = GameSpec(
+    players=[PlayerSpec(BigMoney, player_id="bm"), PlayerSpec(BigMoneyUltimate, player_id="bmu")],
+    kingdom_cards=[smithy],
+    seed=5,
+)
+
+
+def test_describe():
+    assert describe(copper) == "Copper"
+    assert describe([copper, smithy]) == "[Copper, Smithy]"
+    assert describe(None) == "None"
+
+
+def test_record_game():
+    events = record_game(spec.build())
+    assert events[-1].name == "result"
+    assert any(event.name == "buy_phase_decision" for event in events)
+    assert [event.index for event in events] == list(range(len(events)))
+
+
+def test_same_engine_does_not_diverge():
+    assert compare_engines(spec, QuietGame.from_game) is None
+
+
+def test_divergence_is_reported():
+    divergence = compare_engines(spec, lazy_shuffle_engine, context=3)
+    assert divergence is not None
+    assert divergence.reference is not None and divergence.other is not None
+    assert not divergence.reference.same_as(divergence.other)
+    assert len(divergence.context) <= 3
+    assert "Engines diverge at event" in repr(divergence)
+
+
+def test_fuzz_fast_engine(caplog: pytest.LogCaptureFixture):
+    caplog.set_level(logging.WARNING)
+    assert fuzz_engines(QuietGame.from_game, games=10, seed=1) == []
+
+
+def test_fuzz_finds_divergence(caplog: pytest.LogCaptureFixture):
+    caplog.set_level(logging.WARNING)
+    divergences = fuzz_engines(lazy_shuffle_engine, games=2, seed=1)
+    assert len(divergences) == 2
+
+
+def test_fuzz_bot_is_deterministic():
+    spec = GameSpec(
+        players=[PlayerSpec(FuzzBot, seed=1, player_id="a"), PlayerSpec(FuzzBot, seed=2, player_id="b")],
+        expansions=["base", "intrigue"],
+        seed=3,
+    )
+    assert compare_engines(spec, lambda game: game) is None
@@ -0,0 +1,162 @@
+import logging
+import random
+from array import array
+from typing import List, Tuple
+
+import pytest
+
+from pyminion.bots.examples import BigMoney, BigMoneyUltimate, ChapelBot
+from pyminion.core import Pile
+from pyminion.differential import FuzzBot, compare_engines, fuzz_engines
+from pyminion.exceptions import EmptyPile, InvalidGameSetup
+from pyminion.expansions.base import base_set, chapel, copper, estate, moat, smithy
+from pyminion.expansions.intrigue import intrigue_set
+from pyminion.fast import CardTable, FastGame, FastHand, FastSupply
+from pyminion.game import Game
+from pyminion.result import GameResult
+from pyminion.simulator import Simulator
+from pyminion.spec import GameSpec, PlayerSpec
+
+
+def summarize(result: GameResult) -> List[Tuple]:
+    return [
+        (s.player.player_id, s.score, s.turns, s.shuffles, s.turn_order, dict(s.deck.items()))
+        for s in result.player_summaries
+    ]
+
+
+def make_game(seed: int) -> Game:
+    return Game(
+        players=[BigMoney(player_id="bm"), BigMoneyUltimate(player_id="bmu"), ChapelBot(player_id="chapel")],
+        expansions=[base_set, intrigue_set],
+        kingdom_cards=[smithy, chapel],
+        log_stdout=False,
+        seed=seed,
+    )
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_fast_game_plays_same_game(seed: int):
+    game = make_game(seed)
+    fast_game = FastGame.from_game(make_game(seed))
+    assert isinstance(fast_game, Game)
+
+    result = game.play()
+    fast_result = fast_game.play()
+    assert [card.name for card in game.all_game_cards] == [card.name for card in fast_game.all_game_cards]
+    assert summarize(result) == summarize(fast_result)
+
+
+def test_fast_game_zones():
+    game = FastGame.from_game(make_game(0))
+    game.start()
+    counts = game.supply.counts
+    assert isinstance(game.supply, FastSupply)
+    assert isinstance(counts, array)
+    assert list(counts) == [len(pile) for pile in game.supply.piles]
+
+    player = game.players[0]
+    for zone in (player.deck, player.discard_pile, player.hand, player.playmat):
+        ids = zone.get_ids()
+        assert isinstance(ids, array)
+        assert game.card_table.get_cards(ids) == zone.cards
+
+    gained = game.supply.gain_card(copper)
+    assert counts[game.supply.piles.index(game.supply.get_pile("Copper"))] == len(game.supply.get_pile("Copper"))
+    player.discard_pile.add(gained)
+    assert player.discard_pile.cards[-1] is copper
+    assert len(player.discard_pile) == 1
+
+
+def test_card_table():
+    table = CardTable()
+    ids = table.get_ids([copper, estate, copper])
+    assert list(ids) == [0, 1, 0]
+    assert table.get_cards(ids) == [copper, estate, copper]
+    assert table.get_hash(ids) == (2 * copper.hash_key + estate.hash_key) & ((1 << 64) - 1)
+
+
+def test_fast_hand():
+    table = CardTable()
+    hand = FastHand(table, [copper, moat])
+    cards = hand.cards
+    assert hand.get_reactions() == {"Moat": 1}
+
+    hand.add(moat)
+    hand.remove(copper)
+    assert cards == [moat, moat]
+    assert hand.get_reactions() == {"Moat": 2}
+    assert hand.get_hash() == FastHand(table, [moat, moat]).get_hash()
+
+    hand.cards = [estate]
+    assert hand.get_reactions() == {}
+    assert hand.get_hash() == estate.hash_key
+
+
+def test_count_pile():
+    supply = FastSupply([Pile([estate] * 2)], [Pile([copper] * 3)], [])
+    pile = supply.get_pile("Estate")
+    assert pile.cards == [estate, estate]
+    supply.gain_card(estate)
+    supply.gain_card(estate)
+    assert supply.num_empty_piles() == 1
+    assert supply.available_cards() == [copper]
+    with pytest.raises(EmptyPile):
+        supply.gain_card(estate)
+    with pytest.raises(ValueError):
+        pile.add(copper)
+
+    with pytest.raises(InvalidGameSetup):
+        FastSupply([Pile([estate, copper])], [], [])
+
+
+@pytest.mark.parametrize("lazy_shuffle", [False, True])
+def test_fast_game_matches_reference(lazy_shuffle: bool, caplog: pytest.LogCaptureFixture):
+    caplog.set_level(logging.WARNING)
+    spec = GameSpec(
+        players=[PlayerSpec(FuzzBot, seed=i, player_id=f"fuzz_{i}") for i in range(3)],
+        expansions=("base", "intrigue"),
+        lazy_shuffle=lazy_shuffle,
+        seed=4,
+    )
+    assert compare_engines(spec, FastGame.from_game) is None
+
+
+def test_fuzz_fast_game(caplog: pytest.LogCaptureFixture):
+    caplog.set_level(logging.WARNING)
+    assert fuzz_engines(FastGame.from_game, games=10, seed=2) == []
+
+
+def test_fast_game_undo():
+    spec = GameSpec(
+        players=[PlayerSpec(BigMoney, player_id="bm"), PlayerSpec(BigMoneyUltimate, player_id="bmu")],
+        kingdom_cards=[smithy],
+        seed=7,
+    )
+    game = FastGame.from_game(spec.build())
+    game.start()
+    reference = spec.build()
+    reference.start()
+    assert game.state_hash() == reference.state_hash()
+
+    before = game.state_hash()
+    mark = game.mark()
+    for player in game.players:
+        player.take_turn(game)
+    after = game.state_hash()
+    assert after != before
+
+    game.undo_to(mark)
+    assert game.state_hash() == before
+    for player in game.players:
+        player.take_turn(game)
+    assert game.state_hash() == after
+
+
+def test_simulator_fast():
+    random.seed(1)
+    result = Simulator(make_game(0), iterations=3, fast=True).run()
+    assert len(result.game_results) == 3
+    assert all(isinstance(r.game, FastGame) for r in result.game_results)
+    for player_result in result.player_results:
+        assert player_result.wins + player_result.losses + player_result.ties == 3
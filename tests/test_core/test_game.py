@@ -1,10 +1,11 @@
 import pytest
 
+from pyminion.bots.examples import BigMoney
 from pyminion.core import CardType, Card, Supply, Trash
 from pyminion.exceptions import InvalidGameSetup, InvalidPlayerCount
 from pyminion.expansions.base import (base_set, duchy, estate, gold, province,
                                       smithy)
-from pyminion.game import Game
+from pyminion.game import Game, GameTemplate
 from pyminion.human import Human
 
 
@@ -127,3 +128,41 @@ def test_game_win_turns(multiplayer_game: Game):
     # if equal score, player with less turns wins
     multiplayer_game.players[1].turns += 1
     assert multiplayer_game.get_winners() == [multiplayer_game.players[0]]
+
+
+def test_game_lazy_shuffle():
+    bots = [BigMoney(player_id="a"), BigMoney(player_id="b")]
+    game = Game(players=bots, expansions=[base_set], log_stdout=False, lazy_shuffle=True)
+    result = game.play()
+
+    assert result.turns > 0
+    for summary in result.player_summaries:
+        player = summary.player
+        assert player.deck.lazy_shuffle
+        assert len(player.get_all_cards()) == sum(summary.deck.values())
+
+
+def test_game_template_reset():
+    bots = [BigMoney(player_id="a"), BigMoney(player_id="b")]
+    game = Game(players=bots, expansions=[base_set], kingdom_cards=[smithy], log_stdout=False)
+    template = GameTemplate(game)
+    piles = game.supply.piles
+    pile_lengths = [len(pile) for pile in piles]
+    kingdom = [pile.name for pile in game.supply.kingdom_piles]
+
+    game.play_turns()
+    assert [len(pile) for pile in piles] != pile_lengths
+
+    template.reset()
+    assert game.supply.piles is piles
+    assert [len(pile) for pile in piles] == pile_lengths
+    assert [pile.name for pile in game.supply.kingdom_piles] == kingdom
+    assert len(game.trash) == 0
+    for player in game.players:
+        assert player.turns == 0
+        assert len(player.hand) == 5
+        assert len(player.get_all_cards()) == 10
+        assert len(player.playmat) == 0
+
+    result = template.play()
+    assert result.turns > 0
@@ -0,0 +1,129 @@
+import random
+
+import pytest
+
+from pyminion.differential import FuzzBot
+from pyminion.expansions.base import cellar, copper, estate, gold, silver, smithy
+from pyminion.expansions.intrigue import pawn, secret_passage
+from pyminion.game import Game
+from pyminion.moves import (ActionSpace, encode_answer, find_move,
+                            get_action_mask, get_legal_moves)
+from pyminion.player import Player
+from pyminion.spec import GameSpec, PlayerSpec
+from pyminion.step import DecisionRequest
+
+space = ActionSpace.from_expansions()
+
+
+def test_action_space():
+    assert space.describe(ActionSpace.NO) == "No"
+    assert space.describe(ActionSpace.YES) == "Yes"
+    assert space.describe(space.option_index(3)) == "Option 3"
+    assert space.describe(space.card_index(smithy)) == "Smithy"
+    assert len(space) == 2 + space.num_options + len(space.cards)
+    assert len({space.card_index(card) for card in space.cards}) == len(space.cards)
+
+
+def test_action_space_from_game(game: Game):
+    game_space = ActionSpace.from_game(game)
+    assert game_space.card_index(copper) != game_space.card_index(estate)
+    assert len(game_space.cards) == len(game.supply.piles)
+
+
+def test_buy_moves(player: Player):
+    request = DecisionRequest(player, "buy_phase", {"valid_cards": [copper, silver, silver, smithy]})
+    moves = get_legal_moves(request, space)
+    assert [move.answer for move in moves] == [None, copper, silver, smithy]
+    assert moves[0].action == (ActionSpace.NO,)
+
+    mask = get_action_mask(moves, space)
+    assert sum(mask) == 4
+    assert mask[space.card_index(smithy)]
+    assert not mask[space.card_index(gold)]
+
+
+def test_discard_moves(player: Player):
+    request = DecisionRequest(player, "discard", {
+        "prompt": "",
+        "card": cellar,
+        "valid_cards": [copper, estate, copper],
+        "min_num_discard": 0,
+        "max_num_discard": -1,
+    })
+    moves = get_legal_moves(request, space)
+    answers = [sorted(card.name for card in move.answer) for move in moves]
+    assert answers == [
+        [],
+        ["Copper"],
+        ["Estate"],
+        ["Copper", "Copper"],
+        ["Copper", "Estate"],
+        ["Copper", "Copper", "Estate"],
+    ]
+    assert len(set(moves)) == len(moves)
+
+    move = find_move(moves, [space.card_index(estate), space.card_index(copper)])
+    assert move is not None
+    assert sorted(card.name for card in move.answer) == ["Copper", "Estate"]
+
+    assert len(get_legal_moves(request, space, max_moves=3)) == 3
+
+
+def test_treasure_moves_play_all_first(player: Player):
+    request = DecisionRequest(player, "treasure_phase", {"valid_treasures": [copper, silver, copper]})
+    moves = get_legal_moves(request, space)
+    assert sorted(card.name for card in moves[0].answer) == ["Copper", "Copper", "Silver"]
+    assert moves[-1].answer == []
+
+
+def test_option_moves(player: Player):
+    request = DecisionRequest(player, "multiple_option", {
+        "card": pawn,
+        "options": ["+1 card", "+1 action", "+1 buy", "+$1"],
+        "num_choices": 2,
+        "unique": True,
+    })
+    moves = get_legal_moves(request, space)
+    assert len(moves) == 6
+    assert moves[0].answer == [0, 1]
+    assert encode_answer(request, [1, 0], space) == moves[0].action
+
+    binary = DecisionRequest(player, "binary", {"prompt": "", "card": pawn})
+    assert [move.answer for move in get_legal_moves(binary, space)] == [False, True]
+
+
+def test_deck_position_moves(player: Player):
+    request = DecisionRequest(player, "deck_position", {"prompt": "", "card": secret_passage, "num_deck_cards": 63})
+    moves = get_legal_moves(request, space)
+    assert [move.answer for move in moves] == list(range(64))
+    assert sum(get_action_mask(moves, space)) == 64
+
+    request = DecisionRequest(player, "deck_position", {"prompt": "", "card": secret_passage, "num_deck_cards": 64})
+    with pytest.raises(ValueError):
+        get_legal_moves(request, space)
+
+
+def test_moves_of_stepped_games():
+    """
+    Bots' answers are among the legal moves, and games answered with random
+    legal moves are played without errors.
+
+    """
+    rng = random.Random(0)
+    for i in range(3):
+        spec = GameSpec(
+            players=[PlayerSpec(FuzzBot, seed=i * 3 + j, player_id=f"fuzz_{j}") for j in range(3)],
+            expansions=("base", "intrigue"),
+            seed=i,
+        )
+        game = spec.build()
+        deciders = {player: player.decider for player in game.players}
+        request = game.start_steps()
+        while request is not None:
+            moves = get_legal_moves(request, space, max_moves=100000)
+            decide = getattr(deciders[request.player], f"{request.type}_decision")
+            answer = decide(**request.args, player=request.player, game=game)
+            assert find_move(moves, encode_answer(request, answer, space)) is not None
+            if rng.random() < 0.5:
+                answer = rng.choice(moves).answer
+            request = game.step(answer)
@@ -0,0 +1,60 @@
+import logging
+import random
+from typing import List, Tuple
+
+import pytest
+
+from pyminion.bots.examples import BigMoney, BigMoneyUltimate, ChapelBot
+from pyminion.expansions.base import base_set, chapel, smithy
+from pyminion.expansions.intrigue import intrigue_set
+from pyminion.quiet import QuietGame
+from pyminion.game import Game
+from pyminion.result import GameResult
+from pyminion.simulator import Simulator
+
+
+def summarize(result: GameResult) -> List[Tuple]:
+    return [
+        (s.player.player_id, s.score, s.turns, s.shuffles, s.turn_order, dict(s.deck.items()))
+        for s in result.player_summaries
+    ]
+
+
+def make_game(seed: int) -> Game:
+    return Game(
+        players=[BigMoney(player_id="bm"), BigMoneyUltimate(player_id="bmu"), ChapelBot(player_id="chapel")],
+        expansions=[base_set, intrigue_set],
+        kingdom_cards=[smithy, chapel],
+        log_stdout=False,
+        seed=seed,
+    )
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_quiet_game_plays_same_game(seed: int):
+    game = make_game(seed)
+    quiet_game = QuietGame.from_game(make_game(seed))
+    assert isinstance(quiet_game, Game)
+
+    result = game.play()
+    quiet_result = quiet_game.play()
+    assert [card.name for card in game.all_game_cards] == [card.name for card in quiet_game.all_game_cards]
+    assert summarize(result) == summarize(quiet_result)
+
+
+def test_quiet_game_does_not_log(caplog: pytest.LogCaptureFixture):
+    caplog.set_level(logging.INFO)
+    QuietGame.from_game(make_game(0)).play()
+    assert len(caplog.records) == 0
+
+    make_game(0).play()
+    assert len(caplog.records) > 0
+
+
+def test_simulator_quiet():
+    random.seed(1)
+    result = Simulator(make_game(0), iterations=3, quiet=True).run()
+    assert len(result.game_results) == 3
+    assert all(isinstance(r.game, QuietGame) for r in result.game_results)
+    for player_result in result.player_results:
+        assert player_result.wins + player_result.losses + player_result.ties == 3
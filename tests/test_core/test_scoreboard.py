@@ -0,0 +1,117 @@
+import random
+from typing import List, Optional
+
+import pytest
+
+from pyminion.bots.optimized_bot import OptimizedBot, OptimizedBotDecider
+from pyminion.core import Card
+from pyminion.expansions.base import bandit, base_set, copper, duchy, estate, gardens, province, remodel
+from pyminion.expansions.intrigue import duke, harem, intrigue_set, lurker, mill, nobles, swindler, torturer
+from pyminion.game import Game
+from pyminion.player import Player
+
+
+def test_scoreboard_gain_and_trash(game: Game):
+    player = game.players[0]
+    scoreboard = game.scoreboard
+    assert scoreboard.get_victory_points(player) == player.get_victory_points()
+
+    player.gain(province, game)
+    assert scoreboard.get_victory_points(player) == player.get_victory_points()
+    assert scoreboard.get_card_count(player, "Province") == 1
+
+    player.hand.add(estate)
+    scoreboard.add_card(player, estate)
+    player.trash(estate, game)
+    assert scoreboard.get_victory_points(player) == player.get_victory_points()
+
+
+@pytest.mark.kingdom_cards([duke])
+def test_scoreboard_duke(game: Game):
+    player = game.players[0]
+    scoreboard = game.scoreboard
+    vp = scoreboard.get_victory_points(player)
+
+    player.gain(duke, game)
+    player.gain(duke, game)
+    assert scoreboard.get_victory_points(player) == vp
+
+    # each duchy is worth 3 plus 1 for each duke
+    player.gain(duchy, game)
+    assert scoreboard.get_victory_points(player) == vp + 5
+    assert scoreboard.get_victory_points(player) == player.get_victory_points()
+
+
+@pytest.mark.kingdom_cards([gardens])
+def test_scoreboard_gardens(game: Game):
+    player = game.players[0]
+    scoreboard = game.scoreboard
+    total = scoreboard.get_total_card_count(player)
+    assert total == len(player.get_all_cards())
+
+    player.gain(gardens, game)
+    vp = scoreboard.get_victory_points(player)
+    assert vp == player.get_victory_points()
+
+    while (scoreboard.get_total_card_count(player) % 10) != 0:
+        player.gain(copper, game)
+    assert scoreboard.get_victory_points(player) == player.get_victory_points()
+
+    player.trash(copper, game, source=player.discard_pile)
+    assert scoreboard.get_victory_points(player) == player.get_victory_points()
+
+
+def test_scoreboard_lead(multiplayer_game: Game):
+    player1, player2 = multiplayer_game.players
+    scoreboard = multiplayer_game.scoreboard
+    assert scoreboard.get_lead(player1) == 0
+
+    player1.gain(province, multiplayer_game)
+    assert scoreboard.get_lead(player1) == 6
+    assert scoreboard.get_lead(player2) == -6
+
+
+class CheckingDecider(OptimizedBotDecider):
+    """
+    Plays and buys random cards and checks the scoreboard against a full
+    rescan before every buy.
+
+    """
+
+    def action_phase_decision(
+        self,
+        valid_actions: List[Card],
+        player: Player,
+        game: Game,
+    ) -> Optional[Card]:
+        return random.choice(valid_actions)
+
+    def buy_phase_decision(
+        self,
+        valid_cards: List[Card],
+        player: Player,
+        game: Game,
+    ) -> Optional[Card]:
+        for p in game.players:
+            assert game.scoreboard.get_victory_points(p) == p.get_victory_points()
+            assert game.scoreboard.get_total_card_count(p) == len(p.get_all_cards())
+
+        if len(valid_cards) == 0 or random.random() < 0.1:
+            return None
+        return random.choice(valid_cards)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_scoreboard_consistent_in_games(seed: int):
+    random.seed(seed)
+    bots = [OptimizedBot(CheckingDecider(), player_id=f"bot_{i}") for i in range(3)]
+    game = Game(
+        players=bots,
+        expansions=[base_set, intrigue_set],
+        kingdom_cards=[bandit, gardens, duke, harem, lurker, mill, nobles, remodel, swindler, torturer],
+        log_stdout=False,
+    )
+    game.play()
+
+    for player in bots:
+        assert game.scoreboard.get_victory_points(player) == player.get_victory_points()
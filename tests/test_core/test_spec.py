@@ -0,0 +1,117 @@
+import pickle
+
+import pytest
+
+from pyminion.bots.examples import BigMoney, BigMoneyUltimate
+from pyminion.exceptions import InvalidGameSetup
+from pyminion.expansions.base import base_set, copper, estate, moat, smithy
+from pyminion.expansions.intrigue import courtyard
+from pyminion.game import Game
+from pyminion.simulator import Simulator
+from pyminion.spec import GameSpec, PlayerSpec, SeatPolicy, get_card
+
+
+def make_spec(**kwargs) -> GameSpec:
+    return GameSpec(
+        players=[
+            PlayerSpec(BigMoney, player_id="bm"),
+            PlayerSpec(BigMoneyUltimate, player_id="bmu"),
+        ],
+        expansions=["base", "intrigue"],
+        kingdom_cards=[smithy, "Courtyard"],
+        **kwargs,
+    )
+
+
+def test_get_card():
+    assert get_card("Copper") is copper
+    assert get_card("Smithy") is smithy
+    assert get_card("Courtyard") is courtyard
+    with pytest.raises(KeyError):
+        get_card("Not A Card")
+
+
+def test_unknown_expansion():
+    with pytest.raises(InvalidGameSetup):
+        GameSpec(players=[BigMoney], expansions=["unknown"])
+
+
+def test_spec_pickle_round_trip():
+    spec = make_spec(seed=3)
+    loaded = pickle.loads(pickle.dumps(spec))
+    assert loaded.players == spec.players
+    assert loaded.kingdom_cards == ("Smithy", "Courtyard")
+    assert loaded.seed == 3
+
+
+def test_build_independent_games():
+    spec = make_spec()
+    game1 = spec.build()
+    game2 = spec.build()
+    assert game1.kingdom_cards == [smithy, courtyard]
+    assert game1.kingdom_cards[0] is smithy
+    for p1, p2 in zip(game1.players, game2.players):
+        assert p1 is not p2
+    assert game1.trash is not game2.trash
+    assert game1.effect_registry is not game2.effect_registry
+
+    game1.play()
+    assert all(len(p.get_all_cards()) == 0 for p in game2.players)
+
+
+def test_build_start_deck():
+    spec = GameSpec(players=[BigMoney], start_deck=[copper] * 5 + [estate] * 5)
+    game = spec.build()
+    assert game.start_deck == [copper] * 5 + [estate] * 5
+
+
+def test_seat_policy_rotate():
+    spec = make_spec(seat_policy=SeatPolicy.Rotate)
+    assert [p.player_id for p in spec.build(0).players] == ["bm", "bmu"]
+    assert [p.player_id for p in spec.build(1).players] == ["bmu", "bm"]
+    assert not spec.build(1).random_order
+
+
+def test_seeded_games_repeat():
+    spec = make_spec(seed=7)
+    result1 = spec.build().play()
+    result2 = spec.build().play()
+    assert result1.turns == result2.turns
+    assert [s.score for s in result1.player_summaries] == [s.score for s in result2.player_summaries]
+
+
+def test_from_game():
+    game = Game(
+        players=[BigMoney(player_id="a"), BigMoneyUltimate(player_id="b")],
+        expansions=[base_set],
+        kingdom_cards=[moat],
+        random_order=False,
+        log_stdout=False,
+    )
+    spec = GameSpec.from_game(game)
+    assert spec.expansions == ("base",)
+    assert spec.kingdom_cards == ("Moat",)
+    assert spec.seat_policy == SeatPolicy.Fixed
+    assert [p.player_id for p in spec.build().players] == ["a", "b"]
+
+
+def test_pickle_started_game():
+    game = make_spec().build()
+    game.start()
+    loaded: Game = pickle.loads(pickle.dumps(game))
+
+    # cards unpickle to the shared card instances
+    assert loaded.supply.get_pile("Smithy").cards[0] is smithy
+    assert all(card is copper or card is estate for card in loaded.players[0].get_all_cards())
+
+    result = loaded.play_turns()
+    assert result.turns > 0
+
+
+def test_simulator_with_spec():
+    sim = Simulator(make_spec(seat_policy=SeatPolicy.Rotate), iterations=3)
+    result = sim.run()
+    assert len(result.game_results) == 3
+    assert len(result.player_results) == 2
+    for player_result in result.player_results:
+        assert player_result.wins + player_result.losses + player_result.ties == 3
@@ -0,0 +1,169 @@
+import logging
+import random
+
+import pytest
+
+from pyminion.bots.examples import BigMoney, BigMoneyUltimate
+from pyminion.core import Deck, Hand
+from pyminion.differential import FuzzBot
+from pyminion.expansions.base import copper, estate, moat, smithy
+from pyminion.game import Game
+from pyminion.hashing import get_card_key
+from pyminion.quiet import QuietGame
+from pyminion.spec import GameSpec, PlayerSpec
+
+spec = GameSpec(
+    players=[PlayerSpec(BigMoney, player_id="bm"), PlayerSpec(BigMoneyUltimate, player_id="bmu")],
+    kingdom_cards=[smithy],
+    seed=7,
+)
+
+
+def play_turns(game: Game, turns: int) -> None:
+    for _ in range(turns):
+        for player in game.players:
+            player.take_turn(game)
+            game.card_cost_reduction = 0
+
+
+def test_card_keys():
+    assert copper.hash_key == get_card_key("Copper")
+    assert copper.hash_key != estate.hash_key
+
+
+def test_deck_hash_ignores_order():
+    deck = Deck([copper, estate, copper])
+    assert deck.get_hash() == Deck([estate, copper, copper]).get_hash()
+    assert deck.get_order_hash() != Deck([estate, copper, copper]).get_order_hash()
+
+    deck.add(smithy)
+    assert deck.get_hash() == Deck([copper, estate, copper, smithy]).get_hash()
+    assert deck.get_order_hash() == Deck([copper, estate, copper, smithy]).get_order_hash()
+
+    deck.draw()
+    deck.draw()
+    assert deck.get_order_hash() == Deck([copper, estate]).get_order_hash()
+
+
+def test_replaced_card_list_is_hashed_again():
+    hand = Hand([copper])
+    hand.get_hash()
+    hand.cards = [estate, moat]
+    assert hand.get_hash() == Hand([estate, moat]).get_hash()
+    hand.add(copper)
+    assert hand.get_hash() == Hand([estate, moat, copper]).get_hash()
+
+    game = spec.build()
+    game.start()
+    player = game.players[0]
+    game.state_hash()
+    cards = player.hand.cards
+    player.hand.cards = [estate] * len(cards)
+    changed = game.state_hash()
+    player.hand.cards = cards
+    assert changed != game.state_hash()
+
+    fresh = spec.build()
+    fresh.start()
+    assert fresh.state_hash() == game.state_hash()
+
+
+def test_same_game_same_hash():
+    first = spec.build()
+    second = spec.build()
+    first.start()
+    second.start()
+    assert first.state_hash() == second.state_hash()
+
+    first.players[0].take_turn(first)
+    assert first.state_hash() != second.state_hash()
+    second.players[0].take_turn(second)
+    assert first.state_hash() == second.state_hash()
+
+
+@pytest.mark.parametrize("lazy_shuffle", [False, True])
+def test_running_hash_matches_new_hash(lazy_shuffle: bool, caplog: pytest.LogCaptureFixture):
+    """
+    Hashes kept up to date turn by turn match the hashes of the same games
+    hashed for the first time.
+
+    """
+    caplog.set_level(logging.WARNING)
+    rng = random.Random(5)
+    for _ in range(3):
+        game_spec = GameSpec(
+            players=[PlayerSpec(FuzzBot, seed=rng.getrandbits(32), player_id=f"fuzz_{i}") for i in range(3)],
+            expansions=("base", "intrigue"),
+            lazy_shuffle=lazy_shuffle,
+            seed=rng.getrandbits(32),
+        )
+        game = QuietGame.from_game(game_spec.build())
+        game.start()
+        hashes = [game.state_hash()]
+        perspective_hashes = [game.state_hash(game.players[0])]
+        for _ in range(12):
+            play_turns(game, 1)
+            hashes.append(game.state_hash())
+            perspective_hashes.append(game.state_hash(game.players[0]))
+
+        for turns in (0, 5, 12):
+            new_game = QuietGame.from_game(game_spec.build())
+            new_game.start()
+            play_turns(new_game, turns)
+            assert new_game.state_hash() == hashes[turns]
+            assert new_game.state_hash(new_game.players[0]) == perspective_hashes[turns]
+
+
+def test_hidden_information():
+    game = spec.build()
+    game.start()
+    me, opponent = game.players
+
+    full = game.state_hash()
+    mine = game.state_hash(me)
+    theirs = game.state_hash(opponent)
+
+    # swap a card between the opponent's hand and deck
+    hand_card = opponent.hand.cards[0]
+    deck_card = next(card for card in opponent.deck.cards if card is not hand_card)
+    opponent.hand.remove(hand_card)
+    opponent.deck.remove(deck_card)
+    opponent.hand.add(deck_card)
+    opponent.deck.add(hand_card)
+
+    assert game.state_hash(me) == mine
+    assert game.state_hash(opponent) != theirs
+    assert game.state_hash() != full
+
+
+def test_deck_order_is_hidden():
+    game = spec.build()
+    game.start()
+    me = next(player for player in game.players if len(set(player.deck.cards)) > 1)
+
+    full = game.state_hash()
+    mine = game.state_hash(me)
+
+    bottom_card = next(card for card in me.deck.cards if card is not me.deck.cards[-1])
+    me.deck.remove(bottom_card)
+    me.deck.add(bottom_card)
+
+    assert game.state_hash(me) == mine
+    assert game.state_hash() != full
+
+
+def test_undo_restores_hash():
+    game = spec.build()
+    game.start()
+    play_turns(game, 2)
+
+    before = game.state_hash()
+    mark = game.mark()
+    play_turns(game, 2)
+    after = game.state_hash()
+    assert after != before
+
+    game.undo_to(mark)
+    assert game.state_hash() == before
+    play_turns(game, 2)
+    assert game.state_hash() == after
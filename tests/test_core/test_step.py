@@ -0,0 +1,129 @@
+import pytest
+
+from pyminion.bots.examples import BigMoney
+from pyminion.differential import FuzzBot
+from pyminion.expansions.base import copper, estate, militia
+from pyminion.game import Game
+from pyminion.player import Player
+from pyminion.spec import GameSpec, PlayerSpec, SeatPolicy
+from pyminion.step import DecisionRequest
+
+spec = GameSpec(
+    players=[PlayerSpec(FuzzBot, seed=1, player_id="a"), PlayerSpec(FuzzBot, seed=2, player_id="b")],
+    expansions=("base", "intrigue"),
+    seed=11,
+)
+
+
+def answer(request: DecisionRequest, game: Game, deciders: dict):
+    decide = getattr(deciders[request.player], f"{request.type}_decision")
+    return decide(**request.args, player=request.player, game=game)
+
+
+def get_outcome(game: Game) -> list:
+    return [(s.player.player_id, s.score, s.turns) for s in game.summarize_game().player_summaries]
+
+
+def test_stepped_game_matches_played_game():
+    played = spec.build()
+    played.play()
+
+    game = spec.build()
+    deciders = {player: player.decider for player in game.players}
+    request = game.start_steps()
+    steps = 0
+    while request is not None:
+        assert request.player.decider is not deciders[request.player]
+        request = game.step(answer(request, game, deciders))
+        steps += 1
+
+    assert steps > 100
+    assert get_outcome(game) == get_outcome(played)
+    assert all(player.decider is deciders[player] for player in game.players)
+
+
+def test_step_some_players():
+    played = spec.build()
+    played.play()
+
+    game = spec.build()
+    deciders = {player: player.decider for player in game.players}
+    stepped = next(player for player in game.players if player.player_id == "a")
+    request = game.start_steps([stepped])
+    while request is not None:
+        assert request.player is stepped
+        request = game.step(answer(request, game, deciders))
+
+    assert get_outcome(game) == get_outcome(played)
+
+
+def test_step_many_games():
+    games = [spec.build(i) for i in range(4)]
+    outcomes = []
+    for i in range(4):
+        played = spec.build(i)
+        played.play()
+        outcomes.append(get_outcome(played))
+
+    deciders = [{player: player.decider for player in game.players} for game in games]
+    requests = [game.start_steps() for game in games]
+    while any(request is not None for request in requests):
+        for i, game in enumerate(games):
+            request = requests[i]
+            if request is not None:
+                requests[i] = game.step(answer(request, game, deciders[i]))
+
+    assert [get_outcome(game) for game in games] == outcomes
+
+
+def test_turn_requests():
+    game = GameSpec(
+        players=[PlayerSpec(BigMoney, player_id="a"), PlayerSpec(BigMoney, player_id="b")],
+        seat_policy=SeatPolicy.Fixed,
+        seed=3,
+    ).build()
+    request = game.start_steps()
+    assert request is not None
+    assert request.player is game.players[0]
+    # there are no actions to play, so the first decision is which treasures to play
+    assert request.type == "treasure_phase"
+    assert request.valid_cards == [card for card in request.player.hand.cards if card.is_treasure]
+    assert request.min_num == 0 and request.max_num == len(request.valid_cards)
+
+    request = game.step(request.valid_cards)
+    assert request is not None
+    assert request.type == "buy_phase"
+    assert request.min_num == 0 and request.max_num == 1
+    assert request.player.state.money == sum(card.money for card in request.player.playmat.cards)
+
+    request = game.step(None)
+    assert request is not None
+    assert request.player is game.players[1]
+    assert request.type == "treasure_phase"
+    assert game.players[0].turns == 1
+    assert len(game.players[0].hand) == 5
+
+
+def test_card_request(player: Player):
+    request = DecisionRequest(player, "discard", {
+        "prompt": "Discard 2 cards",
+        "card": militia,
+        "valid_cards": [copper, copper, estate],
+        "min_num_discard": 2,
+        "max_num_discard": -1,
+    })
+    assert request.min_num == 2 and request.max_num == 3
+    assert request.card is militia
+    assert request.prompt == "Discard 2 cards"
+
+
+def test_step_errors():
+    game = spec.build()
+    with pytest.raises(ValueError):
+        game.step(None)
+
+    request = game.start_steps()
+    while request is not None:
+        request = game.step(answer(request, game, game.stepper._deciders))  # type: ignore[union-attr]
+    with pytest.raises(ValueError):
+        game.step(None)
@@ -1,7 +1,8 @@
 import pytest
 from pyminion.core import Card, CardType, Pile, Supply
 from pyminion.exceptions import EmptyPile, PileNotFound
-from pyminion.expansions.base import copper, duchy, estate, gold, province, silver
+from pyminion.expansions.base import copper, curse, duchy, estate, gold, province, silver
+from pyminion.game import Game
 
 
 def test_create_supply():
@@ -72,3 +73,39 @@ def test_pile_length(supply: Supply):
     assert supply.pile_length(pile_name="Province") == 8
     supply.gain_card(card=province)
     assert supply.pile_length(pile_name="Province") == 7
+
+
+def test_available_cards_up_to_cost(game: Game):
+    player = game.players[0]
+    supply = game.supply
+
+    cards = supply.available_cards_up_to_cost(2, player, game)
+    expected = [c for c in supply.available_cards() if c.get_cost(player, game) <= 2]
+    assert cards == expected
+    assert estate in cards and copper in cards and curse in cards
+    assert silver not in cards
+
+    for _ in range(len(supply.get_pile("Estate"))):
+        supply.gain_card(estate)
+    assert estate not in supply.available_cards_up_to_cost(2, player, game)
+
+
+def test_available_cards_at_cost(game: Game):
+    player = game.players[0]
+    supply = game.supply
+
+    cards = supply.available_cards_at_cost(6, player, game)
+    assert cards == [c for c in supply.available_cards() if c.get_cost(player, game) == 6]
+    assert gold in cards
+
+
+def test_available_cards_cost_reduction(game: Game):
+    player = game.players[0]
+    supply = game.supply
+
+    assert gold not in supply.available_cards_up_to_cost(5, player, game)
+    game.card_cost_reduction = 1
+    assert gold in supply.available_cards_up_to_cost(5, player, game)
+    assert province not in supply.available_cards_up_to_cost(5, player, game)
+    game.card_cost_reduction = 0
+    assert gold not in supply.available_cards_up_to_cost(5, player, game)
@@ -0,0 +1,72 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Tuple
+
+from pyminion.bots.examples import BigMoney, BigMoneySmithy, BigMoneyUltimate, ChapelBot
+from pyminion.result import GameResult
+from pyminion.spec import GameSpec, PlayerSpec
+
+spec = GameSpec(
+    players=[
+        PlayerSpec(BigMoney, player_id="bm"),
+        PlayerSpec(BigMoneySmithy, player_id="bms"),
+        PlayerSpec(BigMoneyUltimate, player_id="bmu"),
+        PlayerSpec(ChapelBot, player_id="chapel"),
+    ],
+    expansions=["base", "intrigue"],
+    kingdom_cards=["Smithy", "Chapel", "Moat", "Militia"],
+    seed=100,
+)
+
+
+def summarize(result: GameResult) -> Tuple:
+    return (
+        result.turns,
+        [p.player_id for p in result.winners],
+        [(s.player.player_id, s.score, s.turns, s.shuffles) for s in result.player_summaries],
+    )
+
+
+def play(game_index: int) -> Tuple:
+    return summarize(spec.build(game_index).play())
+
+
+def test_concurrent_games_match_sequential_games():
+    num_games = 32
+    expected = [play(i) for i in range(num_games)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(play, range(num_games)))
+
+    assert results == expected
+
+
+def test_concurrent_game_logs_are_separate(tmp_path: Path):
+    def play_logged(game_index: int) -> str:
+        log_file_name = str(tmp_path / f"game_{game_index}.log")
+        game = spec.build(game_index)
+        game = type(game)(
+            players=game.players,
+            expansions=game.expansions,
+            kingdom_cards=game.kingdom_cards,
+            log_stdout=False,
+            log_file=True,
+            log_file_name=log_file_name,
+            seed=game_index,
+        )
+        for player in game.players:
+            player.player_id = f"{player.player_id}_{game_index}"
+        game.play()
+        for handler in game.log_handlers:
+            handler.close()
+        return log_file_name
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        log_file_names: List[str] = list(executor.map(play_logged, range(4)))
+
+    for game_index, log_file_name in enumerate(log_file_names):
+        log = Path(log_file_name).read_text()
+        assert f"bm_{game_index} " in log
+        for other_index in range(4):
+            if other_index != game_index:
+                assert f"bm_{other_index} " not in log
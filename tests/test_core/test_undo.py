@@ -0,0 +1,220 @@
+import logging
+import random
+
+import pytest
+
+from pyminion.bots.examples import BigMoney, BigMoneyUltimate
+from pyminion.core import Deck
+from pyminion.differential import FuzzBot
+from pyminion.expansions.base import copper, estate, merchant, silver, smithy
+from pyminion.game import Game
+from pyminion.player import Player
+from pyminion.quiet import QuietGame
+from pyminion.spec import GameSpec, PlayerSpec
+from pyminion.undo import UndoLog
+
+
+spec = GameSpec(
+    players=[PlayerSpec(BigMoney, player_id="bm"), PlayerSpec(BigMoneyUltimate, player_id="bmu")],
+    kingdom_cards=[smithy],
+    seed=3,
+)
+
+
+def get_game_state(game: Game) -> tuple:
+    """
+    Everything about a game that undoing should restore.
+
+    """
+    players = tuple(
+        (
+            tuple(player.deck.get_cards_unordered()),
+            tuple(player.discard_pile.cards),
+            tuple(player.hand.cards),
+            tuple(player.playmat.cards),
+            str(player.state),
+            player.turns,
+            player.shuffles,
+            player.actions_played_this_turn,
+            game.scoreboard.get_victory_points(player),
+            dict(player.hand.get_reactions()),
+        )
+        for player in game.players
+    )
+    return (
+        players,
+        tuple(game.trash.cards),
+        tuple(tuple(pile.cards) for pile in game.supply.piles),
+        tuple(tuple(effects) for effects in game.effect_registry.snapshot()),
+        game.rng.getstate(),
+        game.current_phase,
+        game.card_cost_reduction,
+    )
+
+
+def test_undo_log_saves_deck_once_per_mark():
+    deck = Deck([copper, estate])
+    log = UndoLog()
+    deck.undo_log = log
+
+    mark = log.mark()
+    deck.draw()
+    deck.add(smithy)
+    assert len(log) == 1
+
+    inner = log.mark()
+    deck.add(copper)
+    assert len(log) == 2
+
+    log.undo_to(inner)
+    assert deck.cards == [copper, smithy]
+    log.undo_to(mark)
+    assert deck.cards == [copper, estate]
+    assert len(log) == 0
+
+    with pytest.raises(ValueError):
+        log.undo_to(1)
+
+
+def test_undo_turn():
+    game = spec.build()
+    game.start()
+    player = game.players[0]
+    player.take_turn(game)
+
+    before = get_game_state(game)
+    mark = game.mark()
+    for player in game.players:
+        player.take_turn(game)
+    assert get_game_state(game) != before
+
+    game.undo_to(mark)
+    assert get_game_state(game) == before
+
+
+def test_undo_replays_the_same_turn():
+    game = spec.build()
+    game.start()
+
+    mark = game.mark()
+    for player in game.players:
+        player.take_turn(game)
+    after = get_game_state(game)
+
+    for _ in range(3):
+        game.undo_to(mark)
+        for player in game.players:
+            player.take_turn(game)
+        assert get_game_state(game) == after
+
+
+def test_nested_marks():
+    game = spec.build()
+    game.start()
+
+    start = get_game_state(game)
+    outer = game.mark()
+    game.players[0].take_turn(game)
+
+    middle = get_game_state(game)
+    inner = game.mark()
+    game.players[1].take_turn(game)
+
+    game.undo_to(inner)
+    assert get_game_state(game) == middle
+    game.undo_to(outer)
+    assert get_game_state(game) == start
+
+
+def test_undo_restores_effect_state(player: Player, game: Game):
+    player.hand.add(merchant)
+    player.hand.add(silver)
+    player.play(merchant, game)
+
+    mark = game.mark()
+    player.play(silver, game)
+    assert player.state.money == 3
+
+    game.undo_to(mark)
+    assert player.state.money == 0
+    player.play(silver, game)
+    assert player.state.money == 3
+
+
+def test_clear_marks():
+    game = spec.build()
+    game.start()
+    mark = game.mark()
+    game.clear_marks()
+    assert all(pile.undo_log is None for pile in game.supply.piles)
+
+    with pytest.raises(ValueError):
+        game.undo_to(mark)
+
+
+def test_undo_after_clear_marks():
+    game = spec.build()
+    game.start()
+    hand = game.players[0].hand
+    cards = list(hand.cards)
+
+    mark = game.mark()
+    hand.add(copper)
+    game.undo_to(mark)
+    game.clear_marks()
+
+    mark = game.mark()
+    hand.add(copper)
+    game.undo_to(mark)
+    assert hand.cards == cards
+
+
+def test_start_clears_marks():
+    game = spec.build()
+    game.start()
+    game.mark()
+    player = game.players[0]
+    assert player.deck.undo_log is game.undo_log
+
+    game.start()
+    assert game.undo_log is None
+    assert player.deck.undo_log is None
+
+
+def test_undo_every_turn_of_fuzz_games(caplog: pytest.LogCaptureFixture):
+    """
+    Undo and replay every turn of games with random kingdoms, so most cards
+    are played between a mark and an undo.
+
+    """
+    caplog.set_level(logging.WARNING)
+    rng = random.Random(5)
+    for _ in range(6):
+        spec = GameSpec(
+            players=[PlayerSpec(FuzzBot, seed=rng.getrandbits(32), player_id=f"fuzz_{i}") for i in range(3)],
+            expansions=("base", "intrigue"),
+            seed=rng.getrandbits(32),
+        )
+        game = QuietGame.from_game(spec.build())
+        game.start()
+
+        while not game.is_over() and game.players[0].turns < 30:
+            for player in game.players:
+                before = get_game_state(game)
+                decider_states = [p.decider.rng.getstate() for p in game.players]
+                mark = game.mark()
+
+                player.take_turn(game)
+                after = get_game_state(game)
+
+                game.undo_to(mark)
+                assert get_game_state(game) == before
+
+                for p, decider_state in zip(game.players, decider_states):
+                    p.decider.rng.setstate(decider_state)
+                player.take_turn(game)
+                assert get_game_state(game) == after
+
+                game.card_cost_reduction = 0
+                if game.is_over():
+                    break
@@ -1,10 +1,10 @@
 from pyminion.core import Card
-from pyminion.effects import AttackEffect, Effect, EffectAction, EffectRegistry, FuncPlayerCardGameEffect, PlayerCardGameEffect, PlayerGameEffect
+from pyminion.effects import AttackEffect, Effect, EffectAction, EffectLifetime, EffectRegistry, FuncPlayerCardGameEffect, PlayerCardGameEffect, PlayerGameEffect
 from pyminion.expansions.base import gold, smithy, witch
 from pyminion.game import Game
 from pyminion.player import Player
 import pytest
-from typing import Optional
+from typing import List, Optional
 
 
 class OrderCounter:
@@ -427,6 +427,29 @@ def test_on_hand_remove(game: Game):
     assert hand_remove_effect.handler_called
 
 
+def test_hand_callbacks_installed_only_with_effects(game: Game):
+    reg = game.effect_registry
+    player = game.players[0]
+
+    assert player.hand.on_add is None
+    assert player.hand.on_remove is None
+
+    reg.register_hand_add_effect(PlayerCardGameEffectTest("add"))
+    assert player.hand.on_add is not None
+    assert player.hand.on_remove is None
+
+    reg.register_hand_remove_effect(PlayerCardGameEffectTest("remove"))
+    assert player.hand.on_remove is not None
+
+    reg.unregister_hand_add_effects("add")
+    assert player.hand.on_add is None
+    assert player.hand.on_remove is not None
+
+    reg.reset()
+    assert player.hand.on_add is None
+    assert player.hand.on_remove is None
+
+
 def test_on_play(game: Game):
     reg = game.effect_registry
 
@@ -506,3 +529,83 @@ def test_on_cleanup_start(game: Game):
     player.start_cleanup_phase(game)
 
     assert effect.handler_called
+
+
+class CountingPlayerCardGameEffect(PlayerCardGameEffect):
+    def __init__(self, name: str, card_names: Optional[List[str]] = None):
+        super().__init__(name, card_names)
+        self.triggered_count = 0
+        self.handled_count = 0
+
+    def get_action(self) -> EffectAction:
+        return EffectAction.Other
+
+    def is_triggered(self, player: Player, card: Card, game: Game) -> bool:
+        self.triggered_count += 1
+        return True
+
+    def handler(self, player: Player, card: Card, game: Game) -> None:
+        self.handled_count += 1
+
+
+def test_card_filter(game: Game):
+    reg = game.effect_registry
+
+    gold_effect = CountingPlayerCardGameEffect("gold", ["Gold"])
+    any_effect = CountingPlayerCardGameEffect("any")
+    reg.register_reveal_effect(gold_effect)
+    reg.register_reveal_effect(any_effect)
+
+    assert gold_effect.get_card_names() == frozenset(["Gold"])
+    assert any_effect.get_card_names() is None
+
+    player = game.players[0]
+    player.reveal(smithy, game)
+
+    assert gold_effect.triggered_count == 0
+    assert gold_effect.handled_count == 0
+    assert any_effect.handled_count == 1
+
+    player.reveal(gold, game)
+
+    assert gold_effect.triggered_count == 1
+    assert gold_effect.handled_count == 1
+    assert any_effect.handled_count == 2
+
+
+def test_card_filter_cache_invalidated(game: Game):
+    reg = game.effect_registry
+
+    assert reg.get_card_effects("play", "Gold") == []
+
+    effect = CountingPlayerCardGameEffect("gold", ["Gold"])
+    reg.register_play_effect(effect)
+    assert reg.get_card_effects("play", "Gold") == [effect]
+    assert reg.get_card_effects("play", "Silver") == []
+
+    reg.unregister_play_effects("gold")
+    assert reg.get_card_effects("play", "Gold") == []
+
+
+def test_turn_lifetime(game: Game):
+    reg = game.effect_registry
+
+    turn_effect = CountingPlayerCardGameEffect("turn", ["Gold"])
+    game_effect = CountingPlayerCardGameEffect("game", ["Gold"])
+    turn_end_effect = PlayerGameEffectTest()
+    reg.register_play_effect(turn_effect, EffectLifetime.Turn)
+    reg.register_play_effect(game_effect)
+    reg.register_turn_end_effect(turn_end_effect, EffectLifetime.Turn)
+    assert reg.get_card_effects("play", "Gold") == [turn_effect, game_effect]
+
+    player = game.players[0]
+    reg.on_turn_end(player, game)
+
+    assert turn_end_effect.handler_called
+    assert reg.get_card_effects("play", "Gold") == [game_effect]
+    assert len(reg.turn_end_effects) == 0
+
+    player.hand.add(gold)
+    player.play(gold, game)
+    assert turn_effect.handled_count == 0
+    assert game_effect.handled_count == 1
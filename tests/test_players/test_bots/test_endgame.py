@@ -0,0 +1,133 @@
+import pytest
+
+from pyminion.bots.examples import BigMoney
+from pyminion.bots.endgame import EndgameSolver, get_money_distribution
+from pyminion.expansions.base import copper, duchy, estate, gold, province, smithy
+from pyminion.game import Game
+from pyminion.log import logging_disabled
+from pyminion.spec import GameSpec, PlayerSpec, SeatPolicy
+
+
+class EndgameBigMoney(BigMoney):
+    def __init__(self, player_id: str = "endgame_big_money"):
+        super().__init__(player_id=player_id)
+        self.decider.endgame_solver = EndgameSolver()
+
+
+def set_up_endgame(provinces: int, opponent_duchies: int, golds: bool = False) -> Game:
+    """
+    Start a game between two BigMoney bots, leave a number of Provinces in
+    the supply and give the second player Duchies. With golds, the Coppers
+    of both players are turned into Golds, so that every hand has $8.
+
+    """
+    game = GameSpec(
+        players=[PlayerSpec(BigMoney, player_id="a"), PlayerSpec(BigMoney, player_id="b")],
+        seat_policy=SeatPolicy.Fixed,
+        seed=0,
+    ).build()
+    with logging_disabled():
+        game.start()
+    while game.supply.pile_length(province.name) > provinces:
+        game.supply.gain_card(province)
+
+    for player in game.players:
+        if golds:
+            for deck in (player.hand, player.deck, player.discard_pile):
+                cards = [gold if card is copper else card for card in deck.cards]
+                deck.clear()
+                deck.add_cards(cards)
+    game.players[1].discard_pile.add_cards([duchy] * opponent_duchies)
+    game.scoreboard.reset()
+
+    player = game.players[0]
+    player.turns = 1
+    player.state.money = 8
+    return game
+
+
+def choose_buy(game: Game, solver: EndgameSolver):
+    player = game.players[0]
+    valid_cards = game.supply.available_cards_up_to_cost(player.state.money, player, game)
+    return solver.choose_buy(valid_cards, player, game)
+
+
+def test_money_distribution():
+    distribution = get_money_distribution([], [copper] * 7 + [estate] * 3, 5, 11)
+    assert sum(probability for _, probability in distribution) == pytest.approx(1)
+    assert sum(money * probability for money, probability in distribution) == pytest.approx(3.5)
+    assert dict(distribution)[5] == pytest.approx(21 / 252)
+
+    distribution = get_money_distribution([gold, gold], [copper] * 3, 3, 8)
+    assert distribution == ((8, pytest.approx(1)),)
+
+
+def test_is_endgame():
+    solver = EndgameSolver()
+    assert not solver.is_endgame(set_up_endgame(8, 0))
+    assert solver.is_endgame(set_up_endgame(2, 0))
+
+
+def test_buys_winning_last_province():
+    # 5 points behind, the last Province wins
+    game = set_up_endgame(1, 1)
+    game.players[1].discard_pile.add(estate)
+    game.scoreboard.reset()
+    assert choose_buy(game, EndgameSolver()) is province
+
+
+def test_does_not_buy_losing_last_province():
+    # 6 points behind, the last Province ties and the tie is lost on turns
+    game = set_up_endgame(1, 2)
+    assert choose_buy(game, EndgameSolver()) is duchy
+
+
+def test_penultimate_province():
+    """
+    3 points behind, buying the second to last Province lets the other
+    player win by buying the last one.
+
+    """
+    game = set_up_endgame(2, 1, golds=True)
+    player = game.players[0]
+    valid_cards = game.supply.available_cards_up_to_cost(8, player, game)
+    assert player.decider.buy_phase_decision(valid_cards, player, game) is province
+
+    player.decider.endgame_solver = EndgameSolver()
+    assert player.decider.buy_phase_decision(valid_cards, player, game) is duchy
+
+
+def test_solved_buys_are_memoized(monkeypatch: pytest.MonkeyPatch):
+    game = set_up_endgame(2, 1, golds=True)
+    solver = EndgameSolver()
+    card = choose_buy(game, solver)
+    assert len(solver.cache) == 1
+
+    def solve(*args):
+        raise AssertionError("the position should have been memoized")
+
+    monkeypatch.setattr(solver, "_solve", solve)
+    assert choose_buy(game, solver) is card
+
+    game.players[0].state.money = 5
+    with pytest.raises(AssertionError):
+        choose_buy(game, solver)
+
+
+def test_endgame_games():
+    spec = GameSpec(
+        players=[PlayerSpec(EndgameBigMoney, player_id="a"), PlayerSpec(BigMoney, player_id="b")],
+        kingdom_cards=[smithy],
+        seed=0,
+    )
+    for i in range(5):
+        game = spec.build(i)
+        game.play()
+        assert len(game.get_winners()) >= 1
+
+
+def test_relevant_buys(game: Game):
+    solver = EndgameSolver()
+    assert solver.is_relevant(province, game)
+    assert solver.is_relevant(estate, game)
+    assert not solver.is_relevant(gold, game)
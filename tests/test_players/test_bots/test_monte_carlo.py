@@ -0,0 +1,100 @@
+from pyminion.bots.examples import BigMoney
+from pyminion.bots.monte_carlo import MonteCarloBot, MonteCarloBotDecider, RolloutDecider, fork_game, get_action_play_order, run_rollouts
+from pyminion.expansions.base import copper, gold, province, smithy, village
+from pyminion.game import Game
+from pyminion.player import Player
+from pyminion.spec import GameSpec, PlayerSpec, SeatPolicy
+
+
+def build_game(seed: int = 0, rollouts: int = 8) -> Game:
+    return GameSpec(
+        players=[
+            PlayerSpec(MonteCarloBot, rollouts=rollouts, processes=0, seed=seed, player_id="mc"),
+            PlayerSpec(BigMoney, player_id="bm"),
+        ],
+        kingdom_cards=[smithy, village],
+        seat_policy=SeatPolicy.Fixed,
+        seed=seed,
+    ).build()
+
+
+def set_up_last_province(game: Game) -> Player:
+    """
+    Leave one Province in the supply and turn the second player's Coppers
+    into Golds, so that they buy the last Province next turn unless the
+    first player buys it now.
+
+    """
+    game.start()
+    while game.supply.pile_length(province.name) > 1:
+        game.supply.gain_card(province)
+    opponent = game.players[1]
+    for deck in (opponent.hand, opponent.deck, opponent.discard_pile):
+        cards = [gold if card is copper else card for card in deck.cards]
+        deck.clear()
+        deck.add_cards(cards)
+    game.scoreboard.reset()
+
+    player = game.players[0]
+    player.state.money = 8
+    return player
+
+
+def test_buys_last_province():
+    game = build_game()
+    player = set_up_last_province(game)
+    valid_cards = game.supply.available_cards_up_to_cost(8, player, game)
+    assert player.decider.buy_phase_decision(valid_cards, player, game) is province
+
+
+def test_nothing_to_buy():
+    game = build_game()
+    game.start()
+    player = game.players[0]
+    assert player.decider.buy_phase_decision([], player, game) is None
+
+
+def test_rollouts_do_not_change_game():
+    game = build_game()
+    player = set_up_last_province(game)
+    deciders = [p.decider for p in game.players]
+    log_handlers = game.log_handlers
+    state_hash = game.state_hash()
+    rng_state = game.rng.getstate()
+
+    decider = MonteCarloBotDecider(rollouts=4, processes=0, seed=1)
+    decider.buy_phase_decision([copper, gold, province], player, game)
+
+    assert game.state_hash() == state_hash
+    assert game.rng.getstate() == rng_state
+    assert [p.decider for p in game.players] == deciders
+    assert game.log_handlers == log_handlers
+    assert len(fork_game(game)) > 0
+
+
+def test_action_play_order(player: Player, game: Game):
+    player.hand.add_cards([smithy, copper, village])
+    assert get_action_play_order(player, game) == [village, smithy]
+
+
+def test_rollouts_stop_at_deadline():
+    game = build_game()
+    player = set_up_last_province(game)
+    args = (fork_game(game), game.players.index(player), province, RolloutDecider(), 0, 4, 100)
+    assert len(run_rollouts(*args)) == 4
+    assert len(run_rollouts(*args, 0.0)) == 1
+
+
+def test_game():
+    game = build_game(1, rollouts=1)
+    game.play()
+    assert len(game.get_winners()) >= 1
+
+
+def test_process_pool():
+    game = build_game()
+    player = set_up_last_province(game)
+    with MonteCarloBotDecider(rollouts=4, processes=2, time_budget=30.0, seed=1) as decider:
+        valid_cards = game.supply.available_cards_up_to_cost(8, player, game)
+        assert decider.buy_phase_decision(valid_cards, player, game) is province
+    assert decider.futures == []
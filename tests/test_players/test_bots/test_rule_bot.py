@@ -0,0 +1,77 @@
+from typing import List, Tuple
+
+import pytest
+
+from pyminion.bots.examples import BigMoney, BigMoneySmithy, BigMoneyUltimate
+from pyminion.bots.rule_bot import (
+    Rule,
+    RuleBot,
+    big_money_rules,
+    big_money_smithy_rules,
+    big_money_ultimate_rules,
+    card_count,
+    money,
+    pile_count,
+    smithy_action_rules,
+    treasure_count,
+)
+from pyminion.expansions.base import base_set, copper, province, silver, smithy
+from pyminion.game import Game
+from pyminion.player import Player
+
+
+def test_expr_evaluate(game: Game):
+    player = game.players[0]
+    player.state.money = 5
+    assert (money * 2 + 1).evaluate(player, game) == 11
+    assert (10 - money).evaluate(player, game) == 5
+    assert (money >= 5).holds(player, game)
+    assert not (money > 5).holds(player, game)
+    assert (money == 5).holds(player, game)
+    assert (pile_count(province) > 0).holds(player, game)
+
+    coppers = card_count(copper).evaluate(player, game)
+    assert coppers == player.get_card_count(copper)
+    assert (treasure_count == coppers).holds(player, game)
+
+
+def test_rule_decider_buys_affordable_card(game: Game):
+    bot = RuleBot([Rule(province), Rule(silver, money < 6)])
+    bot.state.money = 5
+    assert bot.decider.buy_phase_decision([], bot, game) is silver
+    bot.state.money = 6
+    assert bot.decider.buy_phase_decision([], bot, game) is None
+    bot.state.money = 8
+    assert bot.decider.buy_phase_decision([], bot, game) is province
+
+
+def summarize(game: Game) -> List[Tuple[int, int, int]]:
+    result = game.play()
+    return [(s.score, s.turns, s.shuffles) for s in result.player_summaries]
+
+
+@pytest.mark.parametrize(
+    "example_bot, rule_bot",
+    [
+        (BigMoney, lambda: RuleBot(big_money_rules)),
+        (BigMoneySmithy, lambda: RuleBot(big_money_smithy_rules, smithy_action_rules)),
+        (BigMoneyUltimate, lambda: RuleBot(big_money_ultimate_rules, smithy_action_rules)),
+    ],
+)
+def test_rules_match_example_bots(example_bot, rule_bot):
+    for seed in range(3):
+        example_game = Game(
+            players=[example_bot(), BigMoney()],
+            expansions=[base_set],
+            kingdom_cards=[smithy],
+            log_stdout=False,
+            seed=seed,
+        )
+        rule_game = Game(
+            players=[rule_bot(), BigMoney()],
+            expansions=[base_set],
+            kingdom_cards=[smithy],
+            log_stdout=False,
+            seed=seed,
+        )
+        assert summarize(example_game) == summarize(rule_game)
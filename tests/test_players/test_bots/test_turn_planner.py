@@ -0,0 +1,116 @@
+from typing import Iterator
+
+from pyminion.bots.optimized_bot import OptimizedBot, OptimizedBotDecider
+from pyminion.bots.turn_planner import TurnPlanner
+from pyminion.core import Card
+from pyminion.expansions.base import copper, festival, gold, province, silver, smithy, throne_room, village
+from pyminion.game import Game
+from pyminion.player import Player
+from pyminion.spec import GameSpec, PlayerSpec
+
+
+class EngineDecider(OptimizedBotDecider):
+    def action_priority(self, player: Player, game: Game) -> Iterator[Card]:
+        yield smithy
+        yield throne_room
+        yield festival
+        yield village
+
+    def buy_priority(self, player: Player, game: Game) -> Iterator[Card]:
+        money = player.state.money
+        if money >= 8:
+            yield province
+        if money >= 6:
+            yield gold
+        if money >= 5:
+            yield festival
+        if money >= 4 and player.get_card_count(smithy) < 2:
+            yield smithy
+        if money >= 4:
+            yield throne_room
+        if money >= 3:
+            yield village
+            yield silver
+
+
+class PlannedEngineBot(OptimizedBot):
+    def __init__(self, player_id: str = "planned_engine_bot"):
+        decider = EngineDecider()
+        decider.turn_planner = TurnPlanner()
+        super().__init__(decider=decider, player_id=player_id)
+
+
+def test_village_before_smithy(player: Player, game: Game):
+    player.hand.add_cards([smithy, village])
+    planner = TurnPlanner()
+    assert planner.choose_action([smithy, village], player, game) is village
+    # smithy comes first in priority, but only playing village first plays both
+    assert planner.choose_action([smithy, village], player, game, [smithy, village]) is village
+
+
+def test_only_priority_cards_are_played(player: Player, game: Game):
+    player.hand.add_cards([smithy, village])
+    planner = TurnPlanner()
+    assert planner.choose_action([smithy, village], player, game, [smithy]) is smithy
+    assert planner.choose_action([smithy, village], player, game, []) is None
+
+
+def test_throne_room_target(player: Player, game: Game):
+    player.hand.add_cards([village, smithy, smithy])
+    player.state.actions = 0
+    planner = TurnPlanner()
+    # Throne Room on Village gives the actions to play both Smithies
+    assert planner.choose_multi_play([village, smithy, smithy], player, game) is village
+
+
+def test_money_of_draws(player: Player, game: Game):
+    """
+    Festival gives the actions to play Smithy after it, whether or not
+    there are cards to draw.
+
+    """
+    player.deck.clear()
+    player.discard_pile.clear()
+    player.hand.add_cards([smithy, festival])
+    planner = TurnPlanner()
+    assert planner.choose_action([smithy, festival], player, game, [smithy, festival]) is festival
+
+    player.deck.add_cards([copper] * 5)
+    assert planner.choose_action([smithy, festival], player, game, [smithy, festival]) is festival
+    player.state.actions = 0
+    assert planner.choose_action([smithy, festival], player, game) is None
+
+
+def test_repeated_hands_are_cached(player: Player, game: Game):
+    player.hand.add_cards([throne_room, village, smithy, festival])
+    planner = TurnPlanner()
+    valid_actions = [throne_room, village, smithy, festival]
+    card = planner.choose_action(valid_actions, player, game)
+    first_nodes = planner._nodes
+    assert len(planner.cache) > 0
+
+    assert planner.choose_action(valid_actions, player, game) is card
+    assert planner._nodes == 0 < first_nodes
+
+
+def test_node_budget(player: Player, game: Game):
+    player.hand.add_cards([throne_room, village, smithy, festival])
+    valid_actions = [throne_room, village, smithy, festival]
+    planner = TurnPlanner()
+    planner.choose_action(valid_actions, player, game)
+    limited = TurnPlanner(max_nodes=8)
+    assert limited.choose_action(valid_actions, player, game) is not None
+    assert limited._nodes < planner._nodes
+    assert len(limited.cache) < len(planner.cache)
+
+
+def test_planned_game():
+    spec = GameSpec(
+        players=[PlayerSpec(PlannedEngineBot, player_id="a"), PlayerSpec(PlannedEngineBot, player_id="b")],
+        kingdom_cards=[smithy, throne_room, festival, village],
+        seed=0,
+    )
+    for i in range(3):
+        game = spec.build(i)
+        game.play()
+        assert len(game.get_winners()) >= 1
@@ -1,5 +1,7 @@
 import pytest
-from pyminion.core import DiscardPile, Hand, Playmat
+from typing import List
+from pyminion.core import Card, DiscardPile, Hand, Playmat
+from pyminion.effects import EffectAction, FuncPlayerCardGameEffect
 from pyminion.exceptions import (
     CardNotFound,
     InsufficientActions,
@@ -17,6 +19,7 @@ from pyminion.expansions.base import (
     market,
     poacher,
     province,
+    silver,
     smithy,
     vassal,
 )
@@ -187,6 +190,68 @@ def test_play_treasure_increment_money(player: Player, game: Game):
     assert player.state.money == 1
 
 
+def test_play_treasures(player: Player, game: Game):
+    player.hand.add(copper)
+    player.hand.add(estate)
+    player.hand.add(silver)
+    player.hand.add(copper)
+    player.play_treasures([copper, silver, copper], game)
+    assert player.state.money == 4
+    assert player.hand.cards == [estate]
+    assert player.playmat.cards == [copper, silver, copper]
+
+
+def test_play_treasures_with_play_effect(player: Player, game: Game):
+    played: List[Card] = []
+    effect = FuncPlayerCardGameEffect(
+        "play test",
+        EffectAction.Other,
+        lambda p, c, g: played.append(c),
+        card_names=["Silver"],
+    )
+    game.effect_registry.register_play_effect(effect)
+
+    player.hand.add(copper)
+    player.hand.add(silver)
+    player.hand.add(copper)
+    player.play_treasures([copper, silver, copper], game)
+    assert played == [silver]
+    assert player.state.money == 4
+    assert player.playmat.cards == [copper, silver, copper]
+    assert len(player.hand) == 0
+
+
+def test_play_vanilla_action(player: Player, game: Game):
+    played: List[Card] = []
+    effect = FuncPlayerCardGameEffect(
+        "play test",
+        EffectAction.Other,
+        lambda p, c, g: played.append(c),
+        card_names=["Market"],
+    )
+    game.effect_registry.register_play_effect(effect)
+
+    player.hand.add(market)
+    player.hand.add(smithy)
+    player.play(market, game)
+    assert played == [market]
+    assert player.state.actions == 1
+    assert player.state.money == 1
+    assert player.state.buys == 2
+    assert len(player.hand) == 2
+    assert player.actions_played_this_turn == 1
+
+    player.play(smithy, game)
+    assert played == [market]
+    assert player.state.actions == 0
+    assert len(player.hand) == 4
+    assert player.playmat.cards == [market, smithy]
+
+    player.hand.add(smithy)
+    with pytest.raises(InsufficientActions):
+        player.play(smithy, game)
+
+
 def test_play_action_decrement_action(player: Player, game: Game):
     player.hand.add(smithy)
     assert player.state.actions == 1
@@ -283,3 +348,28 @@ def test_cleanup_phase(player: Player, game: Game):
     player.start_cleanup_phase(game)
     assert len(player.hand) == 5
     assert len(player.playmat) == 0
+
+
+def test_cleanup_phase_discard_order(player: Player, game: Game):
+    player.hand.add(copper)
+    player.hand.add(estate)
+    player.playmat.add(silver)
+    player.start_cleanup_phase(game)
+    assert player.discard_pile.cards == [copper, estate, silver]
+
+
+def test_cleanup_phase_discard_effects(player: Player, game: Game):
+    discarded: List[Card] = []
+    effect = FuncPlayerCardGameEffect(
+        "discard test",
+        EffectAction.Other,
+        lambda p, c, g: discarded.append(c),
+    )
+    game.effect_registry.register_discard_effect(effect)
+
+    player.hand.add(copper)
+    player.hand.add(estate)
+    player.playmat.add(silver)
+    player.start_cleanup_phase(game)
+    assert discarded == [copper, estate, silver]
+    assert player.discard_pile.cards == [copper, estate, silver]
@@ -0,0 +1,100 @@
+import logging
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pyminion.batch import BatchSimulator, is_batch_supported
+from pyminion.bots.rule_bot import (
+    Rule,
+    RuleBot,
+    big_money_rules,
+    big_money_smithy_rules,
+    big_money_ultimate_rules,
+    smithy_action_rules,
+)
+from pyminion.exceptions import InvalidGameSetup
+from pyminion.expansions.base import base_set, copper, gardens, gold, laboratory, market, moat, smithy, witch
+from pyminion.game import Game
+from pyminion.simulator import Simulator
+
+
+def make_players():
+    return [
+        RuleBot(big_money_rules, player_id="bm"),
+        RuleBot(big_money_smithy_rules, smithy_action_rules, player_id="bms"),
+    ]
+
+
+def test_supported_cards():
+    assert is_batch_supported(copper)
+    assert is_batch_supported(smithy)
+    assert is_batch_supported(market)
+    assert not is_batch_supported(witch)
+    assert not is_batch_supported(gardens)
+    assert not is_batch_supported(moat)
+
+    with pytest.raises(InvalidGameSetup):
+        BatchSimulator(make_players(), kingdom_cards=[smithy, witch])
+
+
+def test_rule_card_not_in_supply():
+    with pytest.raises(InvalidGameSetup):
+        BatchSimulator(make_players(), kingdom_cards=[])
+
+
+def test_seeded_batches_repeat():
+    result1 = BatchSimulator(make_players(), [smithy], iterations=50, seed=4).run()
+    result2 = BatchSimulator(make_players(), [smithy], iterations=50, seed=4).run()
+    assert np.array_equal(result1.scores, result2.scores)
+    assert np.array_equal(result1.turns, result2.turns)
+
+
+def test_cards_are_conserved():
+    players = [
+        RuleBot([Rule(gold), Rule(laboratory), Rule(market)], [Rule(laboratory), Rule(market)]),
+        RuleBot(big_money_ultimate_rules, smithy_action_rules),
+    ]
+    sim = BatchSimulator(players, [smithy, laboratory, market], iterations=100, seed=0)
+    result = sim.run()
+
+    in_zones = sim.hand.sum(axis=2) + sim.discard.sum(axis=2) + sim.deck_len
+    assert np.array_equal(in_zones, sim.owned.sum(axis=2))
+    start_counts = np.zeros_like(sim.pile_counts)
+    start_counts[sim.get_card_index("Copper")] = 7
+    start_counts[sim.get_card_index("Estate")] = 3
+    total = sim.supply + sim.owned.sum(axis=1)
+    assert np.array_equal(total, np.broadcast_to(sim.pile_counts + 2 * start_counts, total.shape))
+    assert (result.winners.sum(axis=1) >= 1).all()
+
+
+def test_batch_matches_game_statistics(caplog: pytest.LogCaptureFixture):
+    # game logs are not needed and slow down the object engine
+    caplog.set_level(logging.WARNING)
+    iterations = 300
+    batch = BatchSimulator(make_players(), [smithy], iterations=2000, seed=0).run()
+
+    game = Game(
+        players=make_players(), expansions=[base_set], kingdom_cards=[smithy], log_stdout=False, seed=0
+    )
+    sim_result = Simulator(game, iterations=iterations).run()
+
+    game_turns = np.mean([result.turns for result in sim_result.game_results])
+    winner_turns = np.where(batch.winners, batch.turns, 0).max(axis=1)
+    assert abs(winner_turns.mean() - game_turns) < 0.75
+
+    # seat orders differ between games, so results are matched by player
+    batch_results = {result.player.player_id: (i, result) for i, result in enumerate(batch.get_player_results())}
+    for player_result in sim_result.player_results:
+        game_rate = (player_result.wins + player_result.ties / 2) / iterations
+        i, batch_result = batch_results[player_result.player.player_id]
+        batch_rate = (batch_result.wins + batch_result.ties / 2) / 2000
+        assert abs(game_rate - batch_rate) < 0.1
+
+        game_score = np.mean([
+            summary.score
+            for result in sim_result.game_results
+            for summary in result.player_summaries
+            if summary.player is player_result.player
+        ])
+        assert abs(batch.scores[:, i].mean() - game_score) < 1.5
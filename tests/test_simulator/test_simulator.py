@@ -1,9 +1,39 @@
+from typing import List, Optional
+
+from pyminion.bots.bot import Bot
 from pyminion.bots.examples import BigMoney, BigMoneyUltimate
+from pyminion.bots.examples.big_money import BigMoneyDecider
+from pyminion.core import Card
+from pyminion.effects import EffectAction, FuncPlayerCardGameEffect
 from pyminion.expansions.base import base_set, smithy
 from pyminion.game import Game
+from pyminion.player import Player
 from pyminion.simulator import Simulator
 
 
+class HandWatcherDecider(BigMoneyDecider):
+    """
+    Registers an effect on cards added to hands at its first buy in a game
+    and records the games the effect is triggered in.
+
+    """
+
+    def __init__(self):
+        self.games: List[Game] = []
+        self.seen_games: List[Game] = []
+
+    def buy_phase_decision(self, valid_cards: List[Card], player: Player, game: Game) -> Optional[Card]:
+        if game not in self.games:
+            self.games.append(game)
+            effect = FuncPlayerCardGameEffect(
+                "Hand watcher",
+                EffectAction.Other,
+                lambda player, card, game: self.seen_games.append(game),
+            )
+            game.effect_registry.register_hand_add_effect(effect)
+        return super().buy_phase_decision(valid_cards, player, game)
+
+
 def test_sim():
     bm = BigMoney()
     bm_ultimate = BigMoneyUltimate()
@@ -12,3 +42,51 @@ def test_sim():
     )
     sim = Simulator(game, iterations=2)
     sim.run()
+
+
+def test_sim_template():
+    bm = BigMoney()
+    bm_ultimate = BigMoneyUltimate()
+    game = Game(
+        players=[bm, bm_ultimate], expansions=[base_set], kingdom_cards=[smithy]
+    )
+    sim = Simulator(game, iterations=3, use_template=True)
+    result = sim.run()
+    assert len(result.game_results) == 3
+    for player_result in result.player_results:
+        assert player_result.wins + player_result.losses + player_result.ties == 3
+
+
+def test_sim_seeded_games_differ():
+    bm = BigMoney()
+    bm_ultimate = BigMoneyUltimate()
+    game = Game(
+        players=[bm, bm_ultimate], expansions=[base_set], kingdom_cards=[smithy], seed=5
+    )
+    result = Simulator(game, iterations=20).run()
+    games = {
+        tuple((s.player.player_id, s.score, s.turns, s.shuffles) for s in r.player_summaries)
+        for r in result.game_results
+    }
+    assert len(games) > 10
+    assert game.players == [bm, bm_ultimate]
+
+    # a seeded simulation is reproducible
+    again = Simulator(game, iterations=20).run()
+    assert [r.turns for r in again.game_results] == [r.turns for r in result.game_results]
+
+
+def test_sim_hand_effect_registered_during_game():
+    decider = HandWatcherDecider()
+    game = Game(
+        players=[Bot(decider=decider, player_id="watcher"), BigMoney()],
+        expansions=[base_set],
+        kingdom_cards=[smithy],
+        log_stdout=False,
+    )
+    Simulator(game, iterations=3).run()
+    assert len(decider.games) == 3
+    assert game not in decider.games
+    assert len(decider.seen_games) > 0
+    # the effect sees the copy being played, not the game it was copied from
+    assert all(seen in decider.games for seen in decider.seen_games)